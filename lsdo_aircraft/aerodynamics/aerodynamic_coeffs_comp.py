@@ -0,0 +1,178 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+
+
+class AerodynamicCoeffsComp(PartArrayComponent):
+    """
+        Aggregates stacked part coefficients into the aircraft lift coefficient, drag coefficient
+        and lift-to-drag ratio. 'parts' are the lifting surfaces, whose lift, induced drag and wave drag
+        coefficients are referenced to their area and are scaled by area / ref_area, and whose parasite
+        drag coefficient is already referenced to ref_area; 'bodies' only contribute the latter.
+        'parasite_drag_coeff' is the constant parasite drag coefficient of the remaining parts.
+        The sparsity patterns of all partials are computed once in setup.
+    """
+
+    def part_initialize(self):
+        self.options.declare('bodies', default=[], types=list)
+        self.options.declare('parasite_drag_coeff', default=0., types=(int, float))
+
+    def part_setup(self):
+        shape = self.options['shape']
+        bodies = self.options['bodies']
+
+        size = int(np.prod(shape))
+        out_shape = self.alpha_shape + shape
+        out_size = int(np.prod(out_shape))
+
+        self.part_add_input('lifting_surface_lift_coeff', alpha=True)
+        self.part_add_input('lifting_surface_induced_drag_coeff', alpha=True)
+        self.part_add_input('lifting_surface_wave_drag_coeff', alpha=True)
+        self.part_add_input('lifting_surface_parasite_drag_coeff')
+        self.part_add_input('lifting_surface_area')
+        if bodies:
+            self.add_input('body_parasite_drag_coeff', shape=(len(bodies),) + shape)
+        self.flight_add_input('ref_area')
+        self.add_output('lift_coeff', shape=out_shape)
+        self.add_output('drag_coeff', shape=out_shape)
+        self.add_output('lift_to_drag_ratio', shape=out_shape)
+
+        # each entry of a stack contributes to the output entry of its alpha and flight condition
+        rows = self.get_broadcast_indices(self.alpha_shape + (1,) + shape)
+
+        self.body_shape = self.alpha_shape + (len(bodies),) + shape
+        body_rows = np.broadcast_to(
+            np.arange(out_size).reshape(self.alpha_shape + (1,) + shape), self.body_shape).flatten()
+        body_cols = np.broadcast_to(
+            np.arange(len(bodies) * size).reshape((len(bodies),) + shape), self.body_shape).flatten()
+
+        ref_area_rows = np.arange(out_size)
+        ref_area_cols = np.tile(np.arange(size), int(np.prod(self.alpha_shape)))
+
+        for out_name, in_names in [
+            ('lift_coeff', ['lifting_surface_lift_coeff', 'lifting_surface_area']),
+            ('drag_coeff', ['lifting_surface_induced_drag_coeff', 'lifting_surface_wave_drag_coeff',
+                'lifting_surface_area']),
+            ('lift_to_drag_ratio', ['lifting_surface_lift_coeff', 'lifting_surface_induced_drag_coeff',
+                'lifting_surface_wave_drag_coeff', 'lifting_surface_parasite_drag_coeff', 'lifting_surface_area']),
+        ]:
+            for in_name in in_names:
+                cols = self.get_broadcast_indices(self.broadcast_shapes[in_name])
+                self.declare_partials(out_name, in_name, rows=rows, cols=cols)
+
+            self.declare_partials(out_name, 'ref_area', rows=ref_area_rows, cols=ref_area_cols)
+
+        cols = self.get_broadcast_indices(self.part_shape)
+        self.declare_partials('drag_coeff', 'lifting_surface_parasite_drag_coeff', val=1., rows=rows, cols=cols)
+
+        if bodies:
+            self.declare_partials('drag_coeff', 'body_parasite_drag_coeff', val=1., rows=body_rows, cols=body_cols)
+            self.declare_partials('lift_to_drag_ratio', 'body_parasite_drag_coeff', rows=body_rows, cols=body_cols)
+
+    def get_coeffs(self, inputs):
+        part_axis = len(self.alpha_shape)
+
+        area_ratio = inputs['lifting_surface_area'] / inputs['ref_area']
+        area_weighted_drag_coeff = \
+            inputs['lifting_surface_induced_drag_coeff'] + inputs['lifting_surface_wave_drag_coeff']
+
+        lift_coeff = np.sum(inputs['lifting_surface_lift_coeff'] * area_ratio, axis=part_axis)
+        drag_coeff = (
+            self.options['parasite_drag_coeff']
+            + np.sum(area_weighted_drag_coeff * area_ratio, axis=part_axis)
+            + np.sum(inputs['lifting_surface_parasite_drag_coeff'], axis=0)
+        )
+        if self.options['bodies']:
+            drag_coeff = drag_coeff + np.sum(inputs['body_parasite_drag_coeff'], axis=0)
+
+        return lift_coeff, drag_coeff, area_ratio, area_weighted_drag_coeff
+
+    def compute(self, inputs, outputs):
+        lift_coeff, drag_coeff, _, _ = self.get_coeffs(inputs)
+
+        outputs['lift_coeff'] = lift_coeff
+        outputs['drag_coeff'] = drag_coeff
+        outputs['lift_to_drag_ratio'] = lift_coeff / drag_coeff
+
+    def compute_partials(self, inputs, partials):
+        part_axis = len(self.alpha_shape)
+
+        lift_coeff, drag_coeff, area_ratio, area_weighted_drag_coeff = self.get_coeffs(inputs)
+        ref_area = inputs['ref_area']
+
+        # broadcastable against the stacks, with a unit part axis
+        dratio_dlift_coeff = np.expand_dims(1. / drag_coeff, part_axis)
+        dratio_ddrag_coeff = np.expand_dims(-lift_coeff / drag_coeff ** 2, part_axis)
+
+        dlift_coeff_darea = inputs['lifting_surface_lift_coeff'] / ref_area
+        ddrag_coeff_darea = area_weighted_drag_coeff / ref_area
+        dlift_coeff_dref_area = -lift_coeff / ref_area
+        ddrag_coeff_dref_area = -np.sum(area_weighted_drag_coeff * area_ratio, axis=part_axis) / ref_area
+
+        partials['lift_coeff', 'lifting_surface_lift_coeff'] = self.get_part_partials(area_ratio)
+        partials['lift_coeff', 'lifting_surface_area'] = self.get_part_partials(dlift_coeff_darea)
+        partials['lift_coeff', 'ref_area'] = dlift_coeff_dref_area.flatten()
+
+        partials['drag_coeff', 'lifting_surface_induced_drag_coeff'] = self.get_part_partials(area_ratio)
+        partials['drag_coeff', 'lifting_surface_wave_drag_coeff'] = self.get_part_partials(area_ratio)
+        partials['drag_coeff', 'lifting_surface_area'] = self.get_part_partials(ddrag_coeff_darea)
+        partials['drag_coeff', 'ref_area'] = ddrag_coeff_dref_area.flatten()
+
+        partials['lift_to_drag_ratio', 'lifting_surface_lift_coeff'] = self.get_part_partials(
+            dratio_dlift_coeff * area_ratio)
+        partials['lift_to_drag_ratio', 'lifting_surface_induced_drag_coeff'] = self.get_part_partials(
+            dratio_ddrag_coeff * area_ratio)
+        partials['lift_to_drag_ratio', 'lifting_surface_wave_drag_coeff'] = self.get_part_partials(
+            dratio_ddrag_coeff * area_ratio)
+        partials['lift_to_drag_ratio', 'lifting_surface_parasite_drag_coeff'] = self.get_part_partials(
+            dratio_ddrag_coeff)
+        partials['lift_to_drag_ratio', 'lifting_surface_area'] = self.get_part_partials(
+            dratio_dlift_coeff * dlift_coeff_darea + dratio_ddrag_coeff * ddrag_coeff_darea)
+        partials['lift_to_drag_ratio', 'ref_area'] = (
+            dlift_coeff_dref_area / drag_coeff - lift_coeff / drag_coeff ** 2 * ddrag_coeff_dref_area
+        ).flatten()
+
+        if self.options['bodies']:
+            partials['lift_to_drag_ratio', 'body_parasite_drag_coeff'] = np.broadcast_to(
+                dratio_ddrag_coeff, self.body_shape).flatten()
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+    from lsdo_aircraft.geometry.body_geometry import BodyGeometry
+
+
+    shape = (2, 3)
+    parts = [LiftingSurfaceGeometry(name='wing'), LiftingSurfaceGeometry(name='tail')]
+    bodies = [BodyGeometry(name='fuselage'), BodyGeometry(name='nacelle'), BodyGeometry(name='pod')]
+    part_shape = (len(parts),) + shape
+
+    for num_alpha in [None, 4]:
+        alpha_shape = (num_alpha,) if num_alpha is not None else ()
+
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('lifting_surface_lift_coeff', np.random.random(alpha_shape + part_shape))
+        comp.add_output('lifting_surface_induced_drag_coeff', 0.1 * np.random.random(alpha_shape + part_shape))
+        comp.add_output('lifting_surface_wave_drag_coeff', 0.1 * np.random.random(alpha_shape + part_shape))
+        comp.add_output('lifting_surface_parasite_drag_coeff', 0.1 * np.random.random(part_shape))
+        comp.add_output('lifting_surface_area', 1. + 10 * np.random.random(part_shape))
+        comp.add_output('body_parasite_drag_coeff', 0.1 * np.random.random((len(bodies),) + shape))
+        comp.add_output('ref_area', 1. + 10 * np.random.random(shape))
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = AerodynamicCoeffsComp(
+            shape=shape,
+            parts=parts,
+            bodies=bodies,
+            num_alpha=num_alpha,
+            parasite_drag_coeff=0.006,
+        )
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.run_model()
+        prob.check_partials(compact_print=True)
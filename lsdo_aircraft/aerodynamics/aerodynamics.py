@@ -11,4 +11,10 @@ class Aerodynamics(OptionsDictionary):
 
     def initialize(self):
         self.declare('name', default='aerodynamics', types=str)
-        self.declare('group_class', default=AerodynamicsGroup, values=[AerodynamicsGroup])
\ No newline at end of file
+        self.declare('group_class', default=AerodynamicsGroup, values=[AerodynamicsGroup])
+
+        self.declare('fused', default=False, types=bool)
+        self.declare('vectorized', default=False, types=bool)
+        self.declare('num_alpha', default=None, types=int, allow_none=True)
+        self.declare('cache', default=False, types=bool)
+        self.declare('cache_size', default=16, types=int)
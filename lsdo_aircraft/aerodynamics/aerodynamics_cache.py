@@ -0,0 +1,99 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class AerodynamicsCache(object):
+    """
+        Bounded least-recently-used cache of the outputs and the partials of the aerodynamics, keyed by
+        a hash of the geometry and flight-condition inputs they were computed at. Line searches often
+        return to input vectors that have already been evaluated; on a hit, the stored arrays are copied
+        back instead of being recomputed. At most max_size input vectors are kept, and the least recently
+        used one is evicted first. The hits and misses counters cover both outputs and partials, and nbytes
+        is the memory held by the stored arrays.
+    """
+
+    def __init__(self, max_size=16):
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+
+    def get_key(self, inputs, in_names):
+        sha = hashlib.sha1()
+        for in_name in in_names:
+            sha.update(in_name.encode())
+            sha.update(np.ascontiguousarray(inputs[in_name], dtype=float).tobytes())
+        return sha.hexdigest()
+
+    def _load(self, key, entry_name):
+        entry = self._entries.get(key)
+
+        if entry is None or entry_name not in entry:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[entry_name]
+
+    def _store(self, key, entry_name, arrays_dict):
+        if key not in self._entries:
+            self._entries[key] = {}
+        self._entries[key][entry_name] = {
+            name: np.array(val) for name, val in arrays_dict.items()
+        }
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def load_outputs(self, key, outputs):
+        outputs_dict = self._load(key, 'outputs')
+        if outputs_dict is None:
+            return False
+
+        for out_name, val in outputs_dict.items():
+            outputs[out_name] = val
+
+        return True
+
+    def store_outputs(self, key, outputs_dict):
+        self._store(key, 'outputs', outputs_dict)
+
+    def load_partials(self, key, partials):
+        partials_dict = self._load(key, 'partials')
+        if partials_dict is None:
+            return False
+
+        for partial_key, val in partials_dict.items():
+            partials[partial_key] = val
+
+        return True
+
+    def store_partials(self, key, partials_dict):
+        self._store(key, 'partials', partials_dict)
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def size(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return sum(
+            val.nbytes
+            for entry in self._entries.values()
+            for arrays_dict in entry.values()
+            for val in arrays_dict.values()
+        )
+
+    @property
+    def hit_rate(self):
+        num_calls = self.hits + self.misses
+        return float(self.hits) / num_calls if num_calls else 0.
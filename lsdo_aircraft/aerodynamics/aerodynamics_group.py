@@ -6,8 +6,22 @@ from lsdo_utils.api import OptionsDictionary, LinearCombinationComp, PowerCombin
 
 from lsdo_aircraft.aerodynamics.lift_group import LiftGroup
 from lsdo_aircraft.aerodynamics.induced_drag_group import InducedDragGroup
+from lsdo_aircraft.aerodynamics.induced_drag_coeff_comp import InducedDragCoeffComp
 from lsdo_aircraft.aerodynamics.skin_friction_group import SkinFrictionGroup
+from lsdo_aircraft.aerodynamics.skin_friction_coeff_comp import SkinFrictionCoeffComp
 from lsdo_aircraft.aerodynamics.wave_drag_coeff_comp import WaveDragCoeffComp
+from lsdo_aircraft.aerodynamics.part_stack_comp import PartStackComp
+from lsdo_aircraft.aerodynamics.part_lift_coeff_comp import PartLiftCoeffComp
+from lsdo_aircraft.aerodynamics.part_induced_drag_coeff_comp import PartInducedDragCoeffComp
+from lsdo_aircraft.aerodynamics.part_skin_friction_coeff_comp import PartSkinFrictionCoeffComp
+from lsdo_aircraft.aerodynamics.part_parasite_drag_coeff_comp import PartParasiteDragCoeffComp
+from lsdo_aircraft.aerodynamics.part_wave_drag_coeff_comp import PartWaveDragCoeffComp
+from lsdo_aircraft.aerodynamics.aerodynamic_coeffs_comp import AerodynamicCoeffsComp
+from lsdo_aircraft.aerodynamics.aerodynamics_cache import AerodynamicsCache
+from lsdo_aircraft.aerodynamics.dependency_cache import DependencyCache
+from lsdo_aircraft.aerodynamics.tracked_power_combination_comp import TrackedPowerCombinationComp
+from lsdo_aircraft.aerodynamics.utils import wave_drag_rise_coeff
+from lsdo_aircraft.aerodynamics.cached_aerodynamics_comp import CachedAerodynamicsComp
 from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
 from lsdo_aircraft.geometry.body_geometry import BodyGeometry
 from lsdo_aircraft.geometry.part_geometry import PartGeometry
@@ -34,6 +48,7 @@ class AerodynamicsGroup(Group):
         self.options.declare('aircraft', types=OptionsDictionary)
         self.options.declare('geometry', types=OptionsDictionary)
         self.options.declare('options_dictionary', types=OptionsDictionary)
+        self.options.declare('bypass_cache', default=False, types=bool)
 
         self.promotes = [
             'density', 
@@ -44,24 +59,69 @@ class AerodynamicsGroup(Group):
             'mach_number',
         ]
 
+    @classmethod
+    def get_dependent_input_name(cls, options_dictionary, part, var_name, bypass_cache=False):
+        """
+            Returns the name, relative to this group, of the input that receives the geometry variable
+            var_name of part.
+        """
+        part_name = part['name']
+
+        if options_dictionary['cache'] and not bypass_cache:
+            return '{}_{}'.format(part_name, var_name)
+        elif options_dictionary['vectorized']:
+            if isinstance(part, LiftingSurfaceGeometry):
+                return 'lifting_surfaces_group.{}_{}'.format(part_name, var_name)
+            else:
+                return 'bodies_group.{}_{}'.format(part_name, var_name)
+        else:
+            return '{}_group.{}'.format(part_name, var_name)
+
     def setup(self):
         shape = self.options['shape']
         aircraft = self.options['aircraft']
         geometry = self.options['geometry']
         options_dictionary = self.options['options_dictionary']
+
+        if options_dictionary['num_alpha'] is not None and not options_dictionary['vectorized']:
+            raise Exception('The alpha axis requires the vectorized aerodynamics')
+
+        if options_dictionary['cache'] and not self.options['bypass_cache']:
+            self.cache = AerodynamicsCache(max_size=options_dictionary['cache_size'])
+
+            comp = CachedAerodynamicsComp(
+                shape=shape,
+                aircraft=aircraft,
+                geometry=geometry,
+                options_dictionary=options_dictionary,
+                cache=self.cache,
+            )
+            self.add_subsystem('cached_aerodynamics_comp', comp, promotes=['*'])
+            return
+
+        if options_dictionary['vectorized']:
+            self.setup_vectorized()
+            return
         
-        comp = IndepVarComp()
-        comp.add_output('dummy_var')
-        self.add_subsystem('inputs_comp', comp, promotes=['*'])
+        # Only lifting surfaces contribute lift, induced drag and wave drag, so no zero terms, connections
+        # or dummy components are created for the other parts; every part keeps its own group and outputs.
+        # The constant parasite drag coefficients of the parts that are neither lifting surfaces nor bodies
+        # enter the aircraft drag coefficient through aerodynamic_coeffs_comp.
+        # Re_cutoff_comp and form_factor_comp depend only on the geometry and mach_number, so they are tracked
+        # by self.dependency_cache and only recomputed when those change; interference_factor_comp is constant.
+
+        self.dependency_cache = DependencyCache()
+
+        lifting_surfaces, bodies, misc_parasite_drag_coeff = self.get_contributing_parts()
 
         for part in geometry.children:
             name = part['name']
 
             group = Group()
 
-            # Passthrough for area
-
             if isinstance(part, LiftingSurfaceGeometry):
+                # Passthrough for area
+
                 comp = LinearCombinationComp(
                     shape=shape,
                     out_name='_area',
@@ -70,14 +130,9 @@ class AerodynamicsGroup(Group):
                     ),
                 )
                 group.add_subsystem('area_comp', comp, promotes=['*'])
-            else:
-                comp = IndepVarComp()
-                comp.add_output('_area', shape=shape)
-                group.add_subsystem('area_comp', comp, promotes=['*'])
 
-            # Cosine of sweep - useful for many calculations that follow
+                # Cosine of sweep - useful for many calculations that follow
 
-            if isinstance(part, LiftingSurfaceGeometry):
                 def func(sweep): 
                     return np.cos(sweep)
 
@@ -93,65 +148,43 @@ class AerodynamicsGroup(Group):
                 )
                 group.add_subsystem('cos_sweep_comp', comp, promotes=['*'])
 
-            # Lift coefficient
+                # Lift coefficient
 
-            if isinstance(part, LiftingSurfaceGeometry):
                 lift_group = LiftGroup(
                     shape=shape,
                     part=part,
                 )
                 group.add_subsystem('lift_group', lift_group, promotes=['*'])
-            elif isinstance(part, PartGeometry):
-                comp = LinearCombinationComp(
-                    shape=shape,
-                    out_name='dummy_comp_var',
-                    coeffs_dict=dict(
-                        ref_area=1.,
-                        alpha=1.,
-                        wetted_area=1.,
-                        characteristic_length=1.,
-                    ),
-                )
-                group.add_subsystem('dummy_comp', comp, promotes=['*'])
 
-                comp = IndepVarComp()
-                comp.add_output('lift_coeff', val=0., shape=shape)
-                group.add_subsystem('lift_coeff_comp', comp, promotes=['*'])
-            else: 
-                comp = LinearCombinationComp(
-                    shape=shape,
-                    out_name='dummy_comp_var',
-                    coeffs_dict=dict(
-                        alpha=1.,
-                    ),
-                )
-                group.add_subsystem('dummy_comp', comp, promotes=['*'])
+                # Induced drag coefficient
 
-                comp = IndepVarComp()
-                comp.add_output('lift_coeff', val=0., shape=shape)
-                group.add_subsystem('lift_coeff_comp', comp, promotes=['*'])
+                if options_dictionary['fused']:
+                    comp = InducedDragCoeffComp(shape=shape)
+                    group.add_subsystem('induced_drag_coeff_comp', comp, promotes=['*'])
+                else:
+                    induced_drag_group = InducedDragGroup(
+                        shape=shape,
+                        part=part,
+                    )
+                    group.add_subsystem('induced_drag_group', induced_drag_group, promotes=['*'])
 
-            # Induced drag coefficient
+            # Skin friction coefficient
 
-            if isinstance(part, LiftingSurfaceGeometry):
-                induced_drag_group = InducedDragGroup(
+            if options_dictionary['fused']:
+                comp = SkinFrictionCoeffComp(
                     shape=shape,
+                    aircraft=aircraft,
                     part=part,
                 )
-                group.add_subsystem('induced_drag_group', induced_drag_group, promotes=['*'])
-            else: 
-                comp = IndepVarComp()
-                comp.add_output('induced_drag_coeff', val=0., shape=shape)
-                group.add_subsystem('induced_drag_coeff_comp', comp, promotes=['*'])
-
-            # Skin friction coefficient
-            
-            skin_friction_group = SkinFrictionGroup(
-                shape=shape,
-                aircraft=aircraft,
-                part=part,
-            )
-            group.add_subsystem('skin_friction_group', skin_friction_group, promotes=['*'])
+                group.add_subsystem('skin_friction_coeff_comp', comp, promotes=['*'])
+            else:
+                skin_friction_group = SkinFrictionGroup(
+                    shape=shape,
+                    aircraft=aircraft,
+                    part=part,
+                    dependency_cache=self.dependency_cache,
+                )
+                group.add_subsystem('skin_friction_group', skin_friction_group, promotes=['*'])
 
             # Parasite drag coefficient---form factor
 
@@ -159,7 +192,7 @@ class AerodynamicsGroup(Group):
                 thickness_chord = part['thickness_chord']
                 max_thickness_location = part['max_thickness_location']
 
-                comp = PowerCombinationComp(
+                comp = TrackedPowerCombinationComp(
                     shape=shape,
                     out_name='form_factor',
                     coeff=1.34 * (1 + 0.6 / max_thickness_location * thickness_chord + 100. * thickness_chord ** 4),
@@ -167,6 +200,7 @@ class AerodynamicsGroup(Group):
                         mach_number=0.18,
                         cos_sweep=0.28,
                     ),
+                    dependency_cache=self.dependency_cache,
                 )
                 group.add_subsystem('form_factor_comp', comp, promotes=['*'])
             elif isinstance(part, BodyGeometry):  
@@ -196,14 +230,10 @@ class AerodynamicsGroup(Group):
                     ),
                 )
                 group.add_subsystem('parasite_drag_coeff_comp', comp, promotes=['*'])
-            elif isinstance(part, PartGeometry):   
+            else:   
                 comp = IndepVarComp()
                 comp.add_output('parasite_drag_coeff', val=part['parasite_drag_coeff'], shape=shape)
                 group.add_subsystem('parasite_drag_coeff_comp', comp, promotes=['*'])
-            else:
-                comp = IndepVarComp()
-                comp.add_output('parasite_drag_coeff', val=0., shape=shape)
-                group.add_subsystem('parasite_drag_coeff_comp', comp, promotes=['*'])
 
             # Wave drag coefficient
 
@@ -214,7 +244,7 @@ class AerodynamicsGroup(Group):
                 comp = LinearPowerCombinationComp(
                     shape=shape,
                     out_name='critical_mach_number',
-                    constant=-(0.1 / 80.) ** (1. / 3.),
+                    constant=-(0.1 / (4. * wave_drag_rise_coeff)) ** (1. / 3.),
                     terms_list=[
                         (airfoil_technology_factor, dict(
                             cos_sweep=-1.,
@@ -232,12 +262,133 @@ class AerodynamicsGroup(Group):
 
                 comp = WaveDragCoeffComp(shape=shape)
                 group.add_subsystem('wave_drag_coeff_comp', comp, promotes=['*'])
+
+            # Without the dummy components, only lifting surfaces use alpha, and the constant parasite drag
+            # of the other parts does not use ref_area
+
+            if isinstance(part, LiftingSurfaceGeometry):
+                promotes = self.promotes
+            elif isinstance(part, BodyGeometry):
+                promotes = [in_name for in_name in self.promotes if in_name != 'alpha']
             else:
-                comp = IndepVarComp()
-                comp.add_output('wave_drag_coeff', val=0., shape=shape)
-                group.add_subsystem('wave_drag_coeff_comp', comp, promotes=['*'])
+                promotes = [in_name for in_name in self.promotes if in_name not in ['alpha', 'ref_area']]
+
+            self.add_subsystem('{}_group'.format(name), group, promotes=promotes)
 
-            self.add_subsystem('{}_group'.format(name), group, promotes=[
+        # Stacking and aggregation
+
+        comp = PartStackComp(
+            shape=shape,
+            parts=lifting_surfaces,
+            var_names=['lift_coeff', 'induced_drag_coeff', 'wave_drag_coeff', 'parasite_drag_coeff', 'area'],
+        )
+        self.add_subsystem('lifting_surface_stack_comp', comp)
+
+        if bodies:
+            comp = PartStackComp(
+                shape=shape,
+                parts=bodies,
+                var_names=['parasite_drag_coeff'],
+            )
+            self.add_subsystem('body_stack_comp', comp)
+
+        comp = AerodynamicCoeffsComp(
+            shape=shape,
+            parts=lifting_surfaces,
+            bodies=bodies,
+            parasite_drag_coeff=misc_parasite_drag_coeff,
+        )
+        self.add_subsystem('aerodynamic_coeffs_comp', comp, promotes=['*'])
+
+        for part in lifting_surfaces:
+            for var_name, src_var_name in [
+                ('lift_coeff', 'lift_coeff'),
+                ('induced_drag_coeff', 'induced_drag_coeff'),
+                ('wave_drag_coeff', 'wave_drag_coeff'),
+                ('parasite_drag_coeff', 'parasite_drag_coeff'),
+                ('area', '_area'),
+            ]:
+                self.connect(
+                    '{}_group.{}'.format(part['name'], src_var_name),
+                    'lifting_surface_stack_comp.{}_{}'.format(part['name'], var_name),
+                )
+        for part in bodies:
+            self.connect(
+                '{}_group.parasite_drag_coeff'.format(part['name']),
+                'body_stack_comp.{}_parasite_drag_coeff'.format(part['name']),
+            )
+
+        for var_name in ['lift_coeff', 'induced_drag_coeff', 'wave_drag_coeff', 'parasite_drag_coeff', 'area']:
+            self.connect(
+                'lifting_surface_stack_comp.{}'.format(var_name),
+                'lifting_surface_{}'.format(var_name),
+            )
+        if bodies:
+            self.connect('body_stack_comp.parasite_drag_coeff', 'body_parasite_drag_coeff')
+
+    def get_contributing_parts(self):
+        """
+            Returns the lists of lifting surfaces and of bodies, and the sum of the constant parasite
+            drag coefficients of the other parts.
+        """
+        geometry = self.options['geometry']
+
+        lifting_surfaces = [part for part in geometry.children if isinstance(part, LiftingSurfaceGeometry)]
+        bodies = [part for part in geometry.children if isinstance(part, BodyGeometry)]
+        misc_parasite_drag_coeff = sum(
+            part['parasite_drag_coeff'] for part in geometry.children if isinstance(part, PartGeometry))
+
+        return lifting_surfaces, bodies, misc_parasite_drag_coeff
+
+    def add_lift_and_induced_drag_comps(self, group, lifting_surfaces):
+        """
+            Adds the components that compute the stacked lift_coeff and induced_drag_coeff of the lifting
+            surfaces to group, in the vectorized mode.
+        """
+        shape = self.options['shape']
+        num_alpha = self.options['options_dictionary']['num_alpha']
+
+        comp = PartLiftCoeffComp(shape=shape, parts=lifting_surfaces, num_alpha=num_alpha)
+        group.add_subsystem('lift_coeff_comp', comp, promotes=['*'])
+
+        comp = PartInducedDragCoeffComp(shape=shape, parts=lifting_surfaces, num_alpha=num_alpha)
+        group.add_subsystem('induced_drag_coeff_comp', comp, promotes=['*'])
+
+    def setup_vectorized(self):
+        """
+            Stacks the lifting surfaces and the bodies along a leading part axis and evaluates each
+            coefficient once per stack instead of once per part. The other parts only contribute
+            their constant parasite drag coefficient.
+            With num_alpha, alpha and the aircraft coefficients have shape (num_alpha,) + shape, and only
+            the lift, induced drag and wave drag carry the alpha axis; the skin friction and parasite
+            drag are computed once per flight condition.
+        """
+        shape = self.options['shape']
+        aircraft = self.options['aircraft']
+        geometry = self.options['geometry']
+        num_alpha = self.options['options_dictionary']['num_alpha']
+
+        lifting_surfaces, bodies, misc_parasite_drag_coeff = self.get_contributing_parts()
+
+        if lifting_surfaces:
+            group = Group()
+
+            comp = PartStackComp(shape=shape, parts=lifting_surfaces,
+                var_names=self.lifting_surface_dependent_variables)
+            group.add_subsystem('stack_comp', comp, promotes=['*'])
+
+            self.add_lift_and_induced_drag_comps(group, lifting_surfaces)
+
+            comp = PartSkinFrictionCoeffComp(shape=shape, parts=lifting_surfaces, aircraft=aircraft)
+            group.add_subsystem('skin_friction_coeff_comp', comp, promotes=['*'])
+
+            comp = PartParasiteDragCoeffComp(shape=shape, parts=lifting_surfaces, lifting_surfaces=True)
+            group.add_subsystem('parasite_drag_coeff_comp', comp, promotes=['*'])
+
+            comp = PartWaveDragCoeffComp(shape=shape, parts=lifting_surfaces, num_alpha=num_alpha)
+            group.add_subsystem('wave_drag_coeff_comp', comp, promotes=['*'])
+
+            self.add_subsystem('lifting_surfaces_group', group, promotes=[
                 'density', 
                 'speed', 
                 'ref_area',
@@ -246,97 +397,39 @@ class AerodynamicsGroup(Group):
                 'mach_number',
             ])
 
-        # 
+            for var_name in ['lift_coeff', 'induced_drag_coeff', 'wave_drag_coeff', 'parasite_drag_coeff', 'area']:
+                self.connect(
+                    'lifting_surfaces_group.{}'.format(var_name),
+                    'lifting_surface_{}'.format(var_name),
+                )
 
-        names = []
-        lift_coeff_names = []
-        lift_coeff_connects = []
-        area_names = []
-        area_connects = []
-        for part in geometry.children:
-            name = part['name']
-            
-            lift_coeff_name = '{}_group_lift_coeff'.format(name)
-            src_lift_coeff_name = '{}_group.lift_coeff'.format(name)
-            area_name = '{}_group_area'.format(name)
-            src_area_name = '{}_group._area'.format(name)
+        if bodies:
+            group = Group()
 
-            lift_coeff_names.append(lift_coeff_name)
-            lift_coeff_connects.append((src_lift_coeff_name, lift_coeff_name))
+            comp = PartStackComp(shape=shape, parts=bodies, var_names=self.body_dependent_variables)
+            group.add_subsystem('stack_comp', comp, promotes=['*'])
 
-            area_names.append(area_name)
-            area_connects.append((src_area_name, area_name))
+            comp = PartSkinFrictionCoeffComp(shape=shape, parts=bodies, aircraft=aircraft)
+            group.add_subsystem('skin_friction_coeff_comp', comp, promotes=['*'])
 
-            names.append(name)
+            comp = PartParasiteDragCoeffComp(shape=shape, parts=bodies, lifting_surfaces=False)
+            group.add_subsystem('parasite_drag_coeff_comp', comp, promotes=['*'])
 
-        comp = LinearPowerCombinationComp(
-            shape=shape,
-            out_name='lift_coeff',
-            terms_list=[
-                (1., {
-                    lift_coeff_name: 1.,
-                    area_name: 1.,
-                    'ref_area': -1.,
-                })
-                for lift_coeff_name, area_name in zip(lift_coeff_names, area_names)
-            ],
-        )
-        self.add_subsystem('lift_coeff_comp', comp, promotes=['*'])
+            self.add_subsystem('bodies_group', group, promotes=[
+                'density', 
+                'speed', 
+                'ref_area',
+                'dynamic_viscosity', 
+                'mach_number',
+            ])
 
-        comp = LinearPowerCombinationComp(
-            shape=shape,
-            out_name='drag_coeff',
-            terms_list=[
-                (1., {
-                    '{}_group_induced_drag_coeff'.format(name): 1.,
-                    area_name: 1.,
-                    'ref_area': -1.,
-                })
-                for name, area_name in zip(names, area_names)
-            ] + [
-                (1., {
-                    '{}_group_parasite_drag_coeff'.format(name): 1.,
-                    # area_name: 0.,
-                    # 'ref_area': 0.,
-                })
-                for name, area_name in zip(names, area_names)
-            ] + [
-                (1., {
-                    '{}_group_wave_drag_coeff'.format(name): 1.,
-                    area_name: 1.,
-                    'ref_area': -1.,
-                })
-                for name, area_name in zip(names, area_names)
-            ],
-        )
-        self.add_subsystem('drag_coeff_comp', comp, promotes=['*'])
+            self.connect('bodies_group.parasite_drag_coeff', 'body_parasite_drag_coeff')
 
-        comp = PowerCombinationComp(
+        comp = AerodynamicCoeffsComp(
             shape=shape,
-            out_name='lift_to_drag_ratio',
-            powers_dict=dict(
-                lift_coeff=1.,
-                drag_coeff=-1.,
-            ),
+            parts=lifting_surfaces,
+            bodies=bodies,
+            num_alpha=num_alpha,
+            parasite_drag_coeff=misc_parasite_drag_coeff,
         )
-        self.add_subsystem('lift_to_drag_ratio_comp', comp, promotes=['*'])
-        
-        for src, tgt in lift_coeff_connects:
-            self.connect(src, tgt)
-
-        for src, tgt in area_connects:
-            self.connect(src, tgt)
-
-        for name in names:
-            self.connect(
-                '{}_group.induced_drag_coeff'.format(name),
-                '{}_group_induced_drag_coeff'.format(name),
-            )
-            self.connect(
-                '{}_group.parasite_drag_coeff'.format(name),
-                '{}_group_parasite_drag_coeff'.format(name),
-            )
-            self.connect(
-                '{}_group.wave_drag_coeff'.format(name),
-                '{}_group_wave_drag_coeff'.format(name),
-            )
\ No newline at end of file
+        self.add_subsystem('aerodynamic_coeffs_comp', comp, promotes=['*'])
@@ -0,0 +1,206 @@
+import numpy as np
+
+from openmdao.api import ExplicitComponent, Problem, Group, IndepVarComp
+
+from lsdo_utils.api import OptionsDictionary
+
+from lsdo_aircraft.aerodynamics.aerodynamics_cache import AerodynamicsCache
+from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+from lsdo_aircraft.geometry.body_geometry import BodyGeometry
+
+
+class CachedAerodynamicsComp(ExplicitComponent):
+    """
+        Evaluates AerodynamicsGroup as a sub-problem behind an AerodynamicsCache, so the whole aerodynamics
+        is skipped when it is run or linearized again at geometry and flight-condition inputs that are
+        in the cache. The geometry inputs are named '{part}_{var}', e.g., 'wing_area'.
+        All the aerodynamic coefficients are pointwise in the flight conditions, so the partials are diagonal,
+        and each input costs one forward Jacobian-vector product of the sub-problem with a seed of ones.
+    """
+
+    flight_in_names = ['density', 'speed', 'ref_area', 'dynamic_viscosity', 'alpha', 'mach_number']
+    out_names = ['lift_coeff', 'drag_coeff', 'lift_to_drag_ratio']
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+        self.options.declare('aircraft', types=OptionsDictionary)
+        self.options.declare('geometry', types=OptionsDictionary)
+        self.options.declare('options_dictionary', types=OptionsDictionary)
+        self.options.declare('cache', types=AerodynamicsCache)
+
+    def setup(self):
+        shape = self.options['shape']
+        aircraft = self.options['aircraft']
+        geometry = self.options['geometry']
+        options_dictionary = self.options['options_dictionary']
+
+        group_class = options_dictionary['group_class']
+        num_alpha = options_dictionary['num_alpha']
+
+        alpha_shape = (num_alpha,) if num_alpha is not None else ()
+        size = int(np.prod(shape))
+        out_size = int(np.prod(alpha_shape + shape))
+
+        # (in_name, shape, target of the input in the sub-problem)
+        in_specs = []
+        for in_name in self.flight_in_names:
+            in_shape = alpha_shape + shape if in_name == 'alpha' else shape
+            in_specs.append((in_name, in_shape, None))
+
+        for part in geometry.children:
+            if isinstance(part, LiftingSurfaceGeometry):
+                dependent_variables = group_class.lifting_surface_dependent_variables
+            elif isinstance(part, BodyGeometry):
+                dependent_variables = group_class.body_dependent_variables
+            else:
+                dependent_variables = []
+
+            for var_name in dependent_variables:
+                in_specs.append(('{}_{}'.format(part['name'], var_name), shape, 'aerodynamics_group.{}'.format(
+                    group_class.get_dependent_input_name(options_dictionary, part, var_name, bypass_cache=True))))
+
+        self.in_names = [in_name for in_name, _, _ in in_specs]
+
+        # Sub-problem
+
+        model = Group()
+
+        comp = IndepVarComp()
+        for in_name, in_shape, _ in in_specs:
+            comp.add_output(in_name, shape=in_shape)
+        model.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+        group = group_class(
+            shape=shape, aircraft=aircraft, geometry=geometry, options_dictionary=options_dictionary,
+            bypass_cache=True,
+        )
+        model.add_subsystem('aerodynamics_group', group, promotes=group.promotes)
+
+        for in_name, _, tgt in in_specs:
+            if tgt is not None:
+                model.connect(in_name, tgt)
+
+        self.prob = Problem(model)
+        self.prob.setup()
+        self._prob_key = None
+
+        # Component
+
+        for in_name, in_shape, _ in in_specs:
+            self.add_input(in_name, shape=in_shape)
+        for out_name in self.out_names:
+            self.add_output(out_name, shape=alpha_shape + shape)
+
+        rows = np.arange(out_size)
+        for in_name, in_shape, _ in in_specs:
+            if in_shape == shape:
+                cols = np.tile(np.arange(size), out_size // size)
+            else:
+                cols = rows
+            self.declare_partials(self.out_names, in_name, rows=rows, cols=cols)
+
+    def _run_prob(self, inputs, key):
+        if key == self._prob_key:
+            return
+
+        for in_name in self.in_names:
+            self.prob[in_name] = inputs[in_name]
+        self.prob.run_model()
+
+        self._prob_key = key
+
+    def compute(self, inputs, outputs):
+        cache = self.options['cache']
+
+        key = cache.get_key(inputs, self.in_names)
+        if cache.load_outputs(key, outputs):
+            return
+
+        self._run_prob(inputs, key)
+
+        outputs_dict = {}
+        for out_name in self.out_names:
+            outputs_dict[out_name] = outputs[out_name] = self.prob['aerodynamics_group.{}'.format(out_name)]
+
+        cache.store_outputs(key, outputs_dict)
+
+    def compute_partials(self, inputs, partials):
+        cache = self.options['cache']
+
+        key = cache.get_key(inputs, self.in_names)
+        if cache.load_partials(key, partials):
+            return
+
+        self._run_prob(inputs, key)
+
+        of = ['aerodynamics_group.{}'.format(out_name) for out_name in self.out_names]
+
+        partials_dict = {}
+        for ind, in_name in enumerate(self.in_names):
+            jvp = self.prob.compute_jacvec_product(
+                of=of, wrt=[in_name], mode='fwd', seed={in_name: np.ones(inputs[in_name].shape)},
+                linearize=ind == 0,
+            )
+
+            for out_name, of_name in zip(self.out_names, of):
+                partials_dict[out_name, in_name] = partials[out_name, in_name] = jvp[of_name].flatten()
+
+        cache.store_partials(key, partials_dict)
+
+
+if __name__ == '__main__':
+    from lsdo_aircraft.api import Aircraft, Geometry, LiftingSurfaceGeometry, BodyGeometry, PartGeometry
+    from lsdo_aircraft.api import Aerodynamics
+
+
+    shape = (2, 3)
+
+    geometry = Geometry()
+    geometry.add(LiftingSurfaceGeometry(name='wing', lift_coeff_zero_alpha=0.23))
+    geometry.add(LiftingSurfaceGeometry(name='tail', dynamic_pressure_ratio=0.9))
+    geometry.add(BodyGeometry(name='fuselage', fuselage_aspect_ratio=10.))
+    geometry.add(PartGeometry(name='balance', parasite_drag_coeff=0.006))
+
+    aircraft = Aircraft(geometry=geometry, aircraft_type='transport')
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('density', 0.3 + np.random.random(shape))
+    comp.add_output('speed', 100. + 150. * np.random.random(shape))
+    comp.add_output('ref_area', 427.8 * np.ones(shape))
+    comp.add_output('dynamic_viscosity', 1.5e-5 + 0.3e-5 * np.random.random(shape))
+    comp.add_output('alpha', (-1. + 6. * np.random.random(shape)) * np.pi / 180.)
+    comp.add_output('mach_number', 0.3 + 0.5 * np.random.random(shape))
+    comp.add_output('wing_area', 427.8 * np.ones(shape))
+    comp.add_output('wing_wetted_area', 427.8 * 2.1 * np.ones(shape))
+    comp.add_output('wing_characteristic_length', 7. * np.ones(shape))
+    comp.add_output('wing_sweep', 31.6 * np.pi / 180. * np.ones(shape))
+    comp.add_output('wing_incidence_angle', np.zeros(shape))
+    comp.add_output('wing_aspect_ratio', 8.68 * np.ones(shape))
+    comp.add_output('tail_area', 101.3 * np.ones(shape))
+    comp.add_output('tail_wetted_area', 101.3 * 2.1 * np.ones(shape))
+    comp.add_output('tail_characteristic_length', 5. * np.ones(shape))
+    comp.add_output('tail_sweep', 35. * np.pi / 180. * np.ones(shape))
+    comp.add_output('tail_incidence_angle', np.zeros(shape))
+    comp.add_output('tail_aspect_ratio', 4.5 * np.ones(shape))
+    comp.add_output('fuselage_wetted_area', 73 * 2 * np.pi * 3.1 * np.ones(shape))
+    comp.add_output('fuselage_characteristic_length', 73. * np.ones(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    cache = AerodynamicsCache(max_size=4)
+
+    comp = CachedAerodynamicsComp(
+        shape=shape,
+        aircraft=aircraft,
+        geometry=geometry,
+        options_dictionary=Aerodynamics(vectorized=True, cache=True),
+        cache=cache,
+    )
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
+
+    print('hit rate {:.2f}, {} entries, {} bytes'.format(cache.hit_rate, cache.size, cache.nbytes))
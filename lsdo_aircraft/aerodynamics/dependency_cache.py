@@ -0,0 +1,46 @@
+import numpy as np
+
+
+class DependencyCache(object):
+    """
+        Tracks the terms of the aerodynamics that depend only on a few inputs, e.g., the roughness cutoff
+        Reynolds number on characteristic_length and mach_number, or the form factor of lifting surfaces on
+        mach_number and cos_sweep. Each term is stored with a copy of the inputs it was computed from, and is
+        recomputed only when one of them changes; changes to alpha or to the other flight conditions
+        leave it as is. The skips and recomputes counters cover all the terms, and a single cache
+        may be shared by several components since the terms are keyed by the pathname of the component.
+    """
+
+    def __init__(self):
+        self.skips = 0
+        self.recomputes = 0
+
+        self._entries = {}
+
+    def get(self, comp, term_name, inputs, in_names, func):
+        """
+            Returns the term term_name of comp, calling func() to recompute it only if inputs[in_name]
+            changed for any in_name in in_names since it was last computed.
+        """
+        key = (comp.pathname, term_name)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            in_vals, term = entry
+            if all(np.array_equal(in_vals[in_name], inputs[in_name]) for in_name in in_names):
+                self.skips += 1
+                return term
+
+        term = func()
+        self._entries[key] = ({in_name: np.array(inputs[in_name]) for in_name in in_names}, term)
+        self.recomputes += 1
+
+        return term
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def skip_rate(self):
+        num_calls = self.skips + self.recomputes
+        return float(self.skips) / num_calls if num_calls else 0.
@@ -0,0 +1,81 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.aerodynamics.utils import compute_critical_mach_number, wave_drag_rise_coeff
+
+
+class DragDivergenceMachComp(PartArrayComponent):
+    """
+        Drag-divergence Mach number of a stack of lifting surfaces, i.e., the Mach number at which the slope
+        of the wave drag coefficient of PartWaveDragCoeffComp w.r.t. the Mach number reaches 'drag_rise_slope'
+        (0.1 by default), for each part at each lift coefficient.
+        The drag rise is wave_drag_rise_coeff * (mach_number - critical_mach_number) ** 4, so its slope is
+        reached at critical_mach_number + (drag_rise_slope / (4 * wave_drag_rise_coeff)) ** (1 / 3).
+        For the default slope, this is the Korn drag-divergence Mach number behind the critical Mach number
+        of AerodynamicsGroup.
+    """
+
+    def part_initialize(self):
+        self.options.declare('drag_rise_slope', default=0.1, types=float)
+
+    def part_setup(self):
+        self.part_add_input('lift_coeff', alpha=True)
+        self.part_add_input('sweep')
+        self.part_add_output('drag_divergence_mach_number')
+
+        self.part_declare_partials('drag_divergence_mach_number', 'lift_coeff')
+        self.part_declare_partials('drag_divergence_mach_number', 'sweep')
+
+        self.airfoil_technology_factor = self.get_part_array('airfoil_technology_factor')
+        self.thickness_chord = self.get_part_array('thickness_chord')
+
+        self.d_mach = (self.options['drag_rise_slope'] / (4. * wave_drag_rise_coeff)) ** (1. / 3.)
+
+    def get_critical_mach_number(self, inputs, derivs=False):
+        return compute_critical_mach_number(
+            inputs['lift_coeff'], inputs['sweep'], self.airfoil_technology_factor, self.thickness_chord,
+            derivs=derivs,
+        )
+
+    def compute(self, inputs, outputs):
+        outputs['drag_divergence_mach_number'] = self.get_critical_mach_number(inputs) + self.d_mach
+
+    def compute_partials(self, inputs, partials):
+        dcritical_mach_number_dlift_coeff, dcritical_mach_number_dsweep = \
+            self.get_critical_mach_number(inputs, derivs=True)
+
+        partials['drag_divergence_mach_number', 'lift_coeff'] = \
+            self.get_part_partials(dcritical_mach_number_dlift_coeff)
+        partials['drag_divergence_mach_number', 'sweep'] = self.get_part_partials(dcritical_mach_number_dsweep)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    parts = [LiftingSurfaceGeometry(name='wing'), LiftingSurfaceGeometry(name='tail', thickness_chord=0.12)]
+
+    for shape in [(100000,), (2, 3)]:
+        part_shape = (len(parts),) + shape
+
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('lift_coeff', np.random.random(part_shape))
+        comp.add_output('sweep', 0.6 * np.random.random(part_shape))
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = DragDivergenceMachComp(shape=shape, parts=parts)
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.run_model()
+
+        # the slope of the wave drag coefficient at the drag-divergence Mach number
+        d_mach = prob['drag_divergence_mach_number'] - comp.get_critical_mach_number(prob.model.input_comp._outputs)
+        print('max. difference from the drag rise slope',
+            np.max(np.abs(4. * wave_drag_rise_coeff * d_mach ** 3 - 0.1)))
+
+    prob.check_partials(compact_print=True)
@@ -0,0 +1,170 @@
+import numpy as np
+
+from lsdo_utils.api import ArrayExplicitComponent, OptionsDictionary
+
+from lsdo_aircraft.aerodynamics.drag_polar_table import DragPolarTable, get_drag_polar_table, get_geometry_hash
+
+
+class DragPolarComp(ArrayExplicitComponent):
+    """
+        Table-lookup replacement for AerodynamicsGroup: the lift and drag coefficients and the lift-to-drag
+        ratio are interpolated from a DragPolarTable as functions of alpha, Mach number and altitude.
+        The geometry variables the table was built for are scalar inputs named '{part}_{var}', e.g., 'wing_area',
+        together with ref_area, and default to the values stored in the table. Their hash is checked at every
+        compute, so a table built for another geometry is never used silently: with 'regenerate', the table is
+        rebuilt on the same grid (and saved to 'filename', if given), and otherwise an exception is raised.
+        The table holds one geometry, so the partials w.r.t. the geometry inputs are only declared with 'regenerate',
+        and are then computed by finite differences, each rebuilding the table.
+    """
+
+    def array_initialize(self):
+        self.options.declare('table', types=DragPolarTable)
+        self.options.declare('aircraft', types=OptionsDictionary)
+        self.options.declare('geometry', types=OptionsDictionary)
+        self.options.declare('regenerate', default=False, types=bool)
+        self.options.declare('aerodynamics', default=None, types=OptionsDictionary, allow_none=True)
+        self.options.declare('filename', default=None, types=str, allow_none=True)
+
+    def array_setup(self):
+        table = self.options['table']
+
+        self.table = table
+
+        self.geometry_in_names = []
+        for part_name, part_values in table.geometry_values.items():
+            for var_name, val in part_values.items():
+                in_name = '{}_{}'.format(part_name, var_name)
+                self.add_input(in_name, val=val)
+                self.geometry_in_names.append((part_name, var_name, in_name))
+        self.add_input('ref_area', val=table.ref_area)
+
+        self.array_add_input('alpha')
+        self.array_add_input('mach_number')
+        self.array_add_input('altitude')
+        self.array_add_output('lift_coeff')
+        self.array_add_output('drag_coeff')
+        self.array_add_output('lift_to_drag_ratio')
+
+        for out_name in ['lift_coeff', 'drag_coeff', 'lift_to_drag_ratio']:
+            for in_name in DragPolarTable.axis_names:
+                self.array_declare_partials(out_name, in_name)
+
+            if self.options['regenerate']:
+                for _, _, in_name in self.geometry_in_names:
+                    self.declare_partials(out_name, in_name, method='fd')
+                self.declare_partials(out_name, 'ref_area', method='fd')
+
+    def check_geometry(self, inputs):
+        aircraft = self.options['aircraft']
+        geometry = self.options['geometry']
+
+        geometry_values = {}
+        for part_name, var_name, in_name in self.geometry_in_names:
+            geometry_values.setdefault(part_name, {})[var_name] = inputs[in_name]
+
+        geometry_hash = get_geometry_hash(aircraft, geometry, geometry_values, inputs['ref_area'])
+
+        if geometry_hash != self.table.geometry_hash:
+            if not self.options['regenerate']:
+                raise Exception('The drag polar table was built for another geometry; regenerate it')
+
+            self.table = get_drag_polar_table(
+                aircraft, geometry, geometry_values, inputs['ref_area'], *self.table.axes,
+                aerodynamics=self.options['aerodynamics'], filename=self.options['filename'],
+            )
+
+    def compute(self, inputs, outputs):
+        self.check_geometry(inputs)
+
+        lift_coeff, drag_coeff = self.table.evaluate(
+            inputs['alpha'], inputs['mach_number'], inputs['altitude'])
+
+        outputs['lift_coeff'] = lift_coeff
+        outputs['drag_coeff'] = drag_coeff
+        outputs['lift_to_drag_ratio'] = lift_coeff / drag_coeff
+
+    def compute_partials(self, inputs, partials):
+        self.check_geometry(inputs)
+
+        (lift_coeff, drag_coeff), (dlift_coeff, ddrag_coeff) = self.table.evaluate(
+            inputs['alpha'].flatten(), inputs['mach_number'].flatten(), inputs['altitude'].flatten(),
+            derivs=True,
+        )
+
+        for ind, in_name in enumerate(DragPolarTable.axis_names):
+            partials['lift_coeff', in_name] = dlift_coeff[ind]
+            partials['drag_coeff', in_name] = ddrag_coeff[ind]
+            partials['lift_to_drag_ratio', in_name] = \
+                dlift_coeff[ind] / drag_coeff - lift_coeff / drag_coeff ** 2 * ddrag_coeff[ind]
+
+
+if __name__ == '__main__':
+    import time
+
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.api import Aircraft, Geometry, LiftingSurfaceGeometry, BodyGeometry, PartGeometry
+
+    geometry = Geometry()
+    geometry.add(LiftingSurfaceGeometry(name='wing', lift_coeff_zero_alpha=0.23))
+    geometry.add(LiftingSurfaceGeometry(name='tail', dynamic_pressure_ratio=0.9))
+    geometry.add(BodyGeometry(name='fuselage', fuselage_aspect_ratio=10.))
+    geometry.add(PartGeometry(name='balance', parasite_drag_coeff=0.006))
+
+    aircraft = Aircraft(geometry=geometry, aircraft_type='transport')
+
+    geometry_values = dict(
+        wing=dict(
+            area=427.8, wetted_area=427.8 * 2.1, characteristic_length=7.,
+            sweep=31.6 * np.pi / 180., incidence_angle=0., aspect_ratio=8.68,
+        ),
+        tail=dict(
+            area=101.3, wetted_area=101.3 * 2.1, characteristic_length=5.,
+            sweep=35. * np.pi / 180., incidence_angle=0., aspect_ratio=4.5,
+        ),
+        fuselage=dict(
+            wetted_area=73 * 2 * np.pi * 3.1, characteristic_length=73.,
+        ),
+    )
+    ref_area = 427.8
+
+    start = time.time()
+    table = get_drag_polar_table(
+        aircraft, geometry, geometry_values, ref_area,
+        alpha=np.linspace(-2., 8., 11) * np.pi / 180.,
+        mach_number=np.linspace(0.2, 0.85, 14),
+        altitude=np.linspace(0., 12000., 13),
+    )
+    print('drag polar with {} points built in {:.3f} s'.format(table.values[0].size, time.time() - start))
+
+    shape = (2, 3)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('alpha', (-1. + 8. * np.random.random(shape)) * np.pi / 180.)
+    comp.add_output('mach_number', 0.3 + 0.5 * np.random.random(shape))
+    comp.add_output('altitude', 11000. * np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = DragPolarComp(
+        shape=shape,
+        table=table,
+        aircraft=aircraft,
+        geometry=geometry,
+        regenerate=True,
+    )
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+
+    # the geometry partials are finite differences themselves, so they are checked with another step
+    prob.check_partials(compact_print=True, step=1.e-7)
+
+    # a change of the geometry rebuilds the table on the same grid
+    start = time.time()
+    prob['wing_sweep'] = 30. * np.pi / 180.
+    prob.run_model()
+    print('drag polar rebuilt in {:.3f} s, lift_to_drag_ratio {}'.format(
+        time.time() - start, prob['lift_to_drag_ratio'].flatten()))
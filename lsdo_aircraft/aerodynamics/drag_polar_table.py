@@ -0,0 +1,300 @@
+import os
+import hashlib
+
+import numpy as np
+
+from lsdo_aircraft.atmosphere.evaluate_atmosphere import evaluate_atmosphere
+
+
+def get_geometry_hash(aircraft, geometry, geometry_values, ref_area):
+    """
+        Returns a hash of everything the drag polar depends on besides the flight condition:
+        the aircraft regime, the options of every part, the geometry variables of every part and
+        the reference area. geometry_values is a dictionary of dictionaries, e.g.,
+        dict(wing=dict(area=427.8, sweep=0.55, ...), fuselage=dict(...)).
+    """
+    sha = hashlib.sha1()
+    sha.update(repr(aircraft['regime']).encode())
+    sha.update(np.asarray(ref_area, dtype=float).tobytes())
+
+    for part in geometry.children:
+        sha.update(type(part).__name__.encode())
+
+        for key in sorted(part):
+            if key != 'group_class':
+                sha.update(repr((key, part[key])).encode())
+
+        part_values = geometry_values.get(part['name'], {})
+        for var_name in sorted(part_values):
+            sha.update(var_name.encode())
+            sha.update(np.asarray(part_values[var_name], dtype=float).tobytes())
+
+    return sha.hexdigest()
+
+
+def get_hermite_slope_coeffs(axis):
+    """
+        Returns an array of shape (len(axis), 3) with the weights of the values at nodes j - 1, j and j + 1
+        in the slope at node j: the three-point finite difference at interior nodes and the one-sided
+        difference at the end nodes. The grid need not be uniform, and needs at least 2 nodes.
+    """
+    h = np.diff(axis)
+    coeffs = np.zeros((len(axis), 3))
+
+    coeffs[0, 1:] = [-1. / h[0], 1. / h[0]]
+    coeffs[-1, :2] = [-1. / h[-1], 1. / h[-1]]
+
+    h0 = h[:-1]
+    h1 = h[1:]
+    coeffs[1:-1, 0] = -h1 / h0 / (h0 + h1)
+    coeffs[1:-1, 1] = (h1 - h0) / h0 / h1
+    coeffs[1:-1, 2] = h0 / h1 / (h0 + h1)
+
+    return coeffs
+
+
+class DragPolarTable(object):
+    """
+        Lift and drag coefficients tabulated on an (alpha, mach_number, altitude) grid for one
+        geometry, and served by tensor-product cubic Hermite interpolation with finite-difference
+        nodal slopes, so the coefficients and their derivatives are continuous across the nodes.
+        The grids need not be uniform. Points outside the grid are extrapolated with the end intervals.
+        The Reynolds number of each part follows from the Mach number, the altitude and the
+        geometry, so it is not a separate axis of the table.
+        The geometry values and the reference area the table was built for are stored with it.
+    """
+
+    axis_names = ['alpha', 'mach_number', 'altitude']
+    names = ['lift_coeff', 'drag_coeff']
+
+    def __init__(self, axes, values, geometry_hash, geometry_values, ref_area):
+        self.axes = axes
+        self.values = values
+        self.geometry_hash = geometry_hash
+        self.geometry_values = geometry_values
+        self.ref_area = ref_area
+
+        self.slope_coeffs = [get_hermite_slope_coeffs(axis) for axis in axes]
+
+    @classmethod
+    def from_model(cls, aircraft, geometry, geometry_values, ref_area, alpha, mach_number, altitude,
+            aerodynamics=None):
+        """
+            Evaluates AerodynamicsGroup on the full grid in a single batched run. By default, the
+            vectorized aerodynamics is used with an alpha axis, so the alpha-independent terms are
+            only evaluated on the (mach_number, altitude) grid.
+        """
+        from openmdao.api import Problem, IndepVarComp
+
+        from lsdo_aircraft.aerodynamics.aerodynamics import Aerodynamics
+
+        if aerodynamics is None:
+            aerodynamics = Aerodynamics(vectorized=True, num_alpha=len(alpha))
+
+        group_class = aerodynamics['group_class']
+        num_alpha = aerodynamics['num_alpha']
+
+        axes = [np.asarray(axis, dtype=float) for axis in [alpha, mach_number, altitude]]
+
+        if num_alpha is None:
+            shape = tuple(len(axis) for axis in axes)
+            alpha_grid, mach_number_grid, altitude_grid = np.meshgrid(*axes, indexing='ij')
+        elif num_alpha == len(axes[0]):
+            shape = tuple(len(axis) for axis in axes[1:])
+            mach_number_grid, altitude_grid = np.meshgrid(*axes[1:], indexing='ij')
+            alpha_grid = np.broadcast_to(axes[0].reshape((num_alpha, 1, 1)), (num_alpha,) + shape)
+        else:
+            raise Exception('num_alpha of the aerodynamics does not match the alpha grid')
+
+        atmosphere = evaluate_atmosphere(altitude_grid)
+        speed_grid = mach_number_grid * atmosphere.sonic_speed.reshape(shape)
+
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('alpha', val=np.array(alpha_grid))
+        comp.add_output('mach_number', val=mach_number_grid)
+        comp.add_output('speed', val=speed_grid)
+        comp.add_output('density', val=atmosphere.density.reshape(shape))
+        comp.add_output('dynamic_viscosity', val=atmosphere.dynamic_viscosity.reshape(shape))
+        comp.add_output('ref_area', val=ref_area, shape=shape)
+        prob.model.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+        comp = IndepVarComp()
+        connects = []
+        for part in geometry.children:
+            part_name = part['name']
+
+            for var_name, val in geometry_values.get(part_name, {}).items():
+                name = '{}_{}'.format(part_name, var_name)
+
+                comp.add_output(name, val=val, shape=shape)
+                connects.append((name, 'aerodynamics_group.{}'.format(
+                    group_class.get_dependent_input_name(aerodynamics, part, var_name))))
+        prob.model.add_subsystem('geometry_inputs_comp', comp, promotes=['*'])
+
+        group = group_class(shape=shape, aircraft=aircraft, geometry=geometry, options_dictionary=aerodynamics)
+        prob.model.add_subsystem('aerodynamics_group', group, promotes=group.promotes)
+
+        for src, tgt in connects:
+            prob.model.connect(src, tgt)
+
+        prob.setup()
+        prob.run_model()
+
+        values = np.array([prob['aerodynamics_group.{}'.format(name)] for name in cls.names])
+        geometry_hash = get_geometry_hash(aircraft, geometry, geometry_values, ref_area)
+
+        geometry_values = {
+            part_name: {var_name: np.asarray(val, dtype=float).item() for var_name, val in part_values.items()}
+            for part_name, part_values in geometry_values.items()
+        }
+
+        return cls(axes, values, geometry_hash, geometry_values, np.asarray(ref_area, dtype=float).item())
+
+    @classmethod
+    def load(cls, filename):
+        """
+            Returns the table saved in filename, or None if the file does not hold the geometry
+            values of the table, e.g., one saved before they were stored.
+        """
+        data = np.load(filename)
+        if 'geometry_names' not in data:
+            return None
+
+        axes = [data[axis_name] for axis_name in cls.axis_names]
+        values = np.array([data[name] for name in cls.names])
+
+        geometry_values = {}
+        for name, val in zip(data['geometry_names'], data['geometry_values']):
+            part_name, var_name = str(name).split('.')
+            geometry_values.setdefault(part_name, {})[var_name] = float(val)
+
+        return cls(axes, values, str(data['geometry_hash']), geometry_values, float(data['ref_area']))
+
+    def save(self, filename):
+        arrays = dict(zip(self.axis_names, self.axes))
+        arrays.update(zip(self.names, self.values))
+
+        geometry_names = []
+        geometry_values = []
+        for part_name, part_values in self.geometry_values.items():
+            for var_name, val in part_values.items():
+                geometry_names.append('{}.{}'.format(part_name, var_name))
+                geometry_values.append(val)
+
+        np.savez_compressed(
+            filename, geometry_hash=np.array(self.geometry_hash), ref_area=np.array(self.ref_area),
+            geometry_names=np.array(geometry_names, dtype=str), geometry_values=np.array(geometry_values, dtype=float),
+            **arrays
+        )
+
+    def _get_basis(self, points):
+        """
+            Returns, for each axis, the node indices of shape (4, num_points) of the stencil of each point
+            and the weights of the values at those nodes in the interpolant and in its derivative.
+        """
+        inds = []
+        weights = []
+        dweights = []
+        for axis, coeffs, x in zip(self.axes, self.slope_coeffs, points):
+            x = x.reshape(-1)
+            ind = np.clip(np.searchsorted(axis, x) - 1, 0, len(axis) - 2)
+            dx = axis[ind + 1] - axis[ind]
+            t = (x - axis[ind]) / dx
+
+            h00 = (1 + 2 * t) * (1 - t) ** 2
+            h10 = t * (1 - t) ** 2
+            h01 = t ** 2 * (3 - 2 * t)
+            h11 = t ** 2 * (t - 1)
+
+            dh00 = 6 * t * (t - 1) / dx
+            dh10 = (1 - t) * (1 - 3 * t)
+            dh01 = -dh00
+            dh11 = t * (3 * t - 2)
+
+            # the slopes at nodes ind and ind + 1 reach from node ind - 1 to node ind + 2
+            c0 = coeffs[ind].T
+            c1 = coeffs[ind + 1].T
+            zeros = np.zeros(x.shape)
+
+            inds.append(np.clip(ind + np.arange(-1, 3).reshape((4, 1)), 0, len(axis) - 1))
+            weights.append(np.array([
+                zeros, h00, h01, zeros,
+            ]) + dx * h10 * np.concatenate((c0, [zeros])) + dx * h11 * np.concatenate(([zeros], c1)))
+            dweights.append(np.array([
+                zeros, dh00, dh01, zeros,
+            ]) + dh10 * np.concatenate((c0, [zeros])) + dh11 * np.concatenate(([zeros], c1)))
+
+        return inds, weights, dweights
+
+    def evaluate(self, alpha, mach_number, altitude, derivs=False):
+        """
+            Returns an array of shape (2,) + alpha.shape with the interpolated coefficients, ordered
+            as in DragPolarTable.names. If derivs is True, an array of shape (2, 3) + alpha.shape with
+            their derivatives w.r.t. alpha, mach_number and altitude is returned as well.
+        """
+        shape = alpha.shape
+        num_axes = len(self.axes)
+
+        inds, weights, dweights = self._get_basis([alpha, mach_number, altitude])
+
+        values = 0.
+        axis_derivs = [0.] * num_axes
+        for corner in np.ndindex(*(4,) * num_axes):
+            corner_values = self.values[(slice(None),) + tuple(ind[c] for ind, c in zip(inds, corner))]
+
+            corner_weights = [w[c] for w, c in zip(weights, corner)]
+            values = values + np.prod(corner_weights, axis=0) * corner_values
+
+            if derivs:
+                for axis_ind in range(num_axes):
+                    dweight = dweights[axis_ind][corner[axis_ind]]
+                    others = np.prod([w for ind, w in enumerate(corner_weights) if ind != axis_ind], axis=0)
+                    axis_derivs[axis_ind] = axis_derivs[axis_ind] + dweight * others * corner_values
+
+        values = values.reshape((len(self.names),) + shape)
+
+        if derivs:
+            return values, np.array(axis_derivs).transpose(1, 0, 2).reshape((len(self.names), num_axes) + shape)
+        else:
+            return values
+
+
+_tables = {}
+
+def get_drag_polar_table(aircraft, geometry, geometry_values, ref_area, alpha, mach_number, altitude,
+        aerodynamics=None, filename=None):
+    """
+        Returns the drag polar of the given geometry. One table is kept per process and per filename,
+        and is replaced whenever it is requested for another geometry or grid.
+        If a filename is given, the table is loaded from that .npz file when it exists and was built
+        for the same geometry and grid, and is regenerated and saved to it otherwise.
+    """
+    geometry_hash = get_geometry_hash(aircraft, geometry, geometry_values, ref_area)
+    axes = [np.asarray(axis, dtype=float) for axis in [alpha, mach_number, altitude]]
+
+    def is_valid(table):
+        return table.geometry_hash == geometry_hash and all(
+            table_axis.shape == axis.shape and np.all(table_axis == axis)
+            for table_axis, axis in zip(table.axes, axes)
+        )
+
+    key = filename
+
+    if key in _tables and is_valid(_tables[key]):
+        return _tables[key]
+
+    table = None
+    if filename is not None and os.path.exists(filename):
+        table = DragPolarTable.load(filename)
+
+    if table is None or not is_valid(table):
+        table = DragPolarTable.from_model(
+            aircraft, geometry, geometry_values, ref_area, alpha, mach_number, altitude, aerodynamics)
+        if filename is not None:
+            table.save(filename)
+
+    _tables[key] = table
+
+    return table
@@ -0,0 +1,80 @@
+import numpy as np
+
+from lsdo_utils.api import ArrayExplicitComponent
+
+from lsdo_aircraft.aerodynamics.utils import compute_induced_drag_coeff
+
+
+class InducedDragCoeffComp(ArrayExplicitComponent):
+    """
+        Fused induced drag component: computes the sweep capped at 30 degrees, the unswept and swept
+        Oswald efficiency fits, their blend and the induced drag coefficient in a single pass.
+        The 30 degree cap is a scalar constant broadcast against sweep.
+        The output is the same as that of InducedDragGroup, which remains the reference implementation.
+    """
+
+    def array_setup(self):
+        self.array_add_input('lift_coeff')
+        self.array_add_input('aspect_ratio')
+        self.array_add_input('sweep')
+        self.array_add_output('induced_drag_coeff')
+
+        self.array_declare_partials('induced_drag_coeff', 'lift_coeff')
+        self.array_declare_partials('induced_drag_coeff', 'aspect_ratio')
+        self.array_declare_partials('induced_drag_coeff', 'sweep')
+
+    def compute(self, inputs, outputs):
+        outputs['induced_drag_coeff'] = compute_induced_drag_coeff(
+            inputs['lift_coeff'], inputs['aspect_ratio'], inputs['sweep'])
+
+    def compute_partials(self, inputs, partials):
+        dCDi_dlift_coeff, dCDi_daspect_ratio, dCDi_dsweep = compute_induced_drag_coeff(
+            inputs['lift_coeff'].flatten(), inputs['aspect_ratio'].flatten(), inputs['sweep'].flatten(),
+            derivs=True,
+        )
+
+        partials['induced_drag_coeff', 'lift_coeff'] = dCDi_dlift_coeff
+        partials['induced_drag_coeff', 'aspect_ratio'] = dCDi_daspect_ratio
+        partials['induced_drag_coeff', 'sweep'] = dCDi_dsweep
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_utils.api import GeneralOperationComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+    from lsdo_aircraft.aerodynamics.induced_drag_group import InducedDragGroup
+
+
+    shape = (2, 3)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('lift_coeff', np.random.random(shape))
+    comp.add_output('aspect_ratio', 1. + 10 * np.random.random(shape))
+    comp.add_output('sweep', np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = InducedDragCoeffComp(shape=shape)
+    prob.model.add_subsystem('comp', comp, promotes_inputs=['*'])
+
+    comp = GeneralOperationComp(
+        shape=shape,
+        out_name='cos_sweep',
+        in_names=['sweep'],
+        func=np.cos,
+        deriv=lambda sweep: -np.sin(sweep),
+    )
+    prob.model.add_subsystem('cos_sweep_comp', comp, promotes=['*'])
+
+    group = InducedDragGroup(shape=shape, part=LiftingSurfaceGeometry(name='wing'))
+    prob.model.add_subsystem('group', group, promotes_inputs=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
+
+    print('max. difference from InducedDragGroup:', np.max(np.abs(
+        prob['comp.induced_drag_coeff'] - prob['group.induced_drag_coeff'])))
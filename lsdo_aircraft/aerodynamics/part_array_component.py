@@ -0,0 +1,96 @@
+import numpy as np
+
+from openmdao.api import ExplicitComponent
+
+
+class PartArrayComponent(ExplicitComponent):
+    """
+        Base class for components that evaluate one quantity for a stack of parts at once.
+        Part variables carry a leading part axis, i.e., they have shape (num_parts,) + shape,
+        while flight-condition variables have the plain shape and are broadcast along the part
+        axis. The part options are read from the list of geometry options dictionaries in 'parts'.
+        If 'num_alpha' is given, the outputs carry a further leading alpha axis, i.e., they have shape
+        (num_alpha, num_parts) + shape; inputs added with alpha=True carry it too, and the others are
+        broadcast along it, so alpha-independent terms are computed once per flight condition.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+        self.options.declare('parts', types=list)
+        self.options.declare('num_alpha', default=None, types=int, allow_none=True)
+
+        self.part_initialize()
+
+    def part_initialize(self):
+        pass
+
+    def setup(self):
+        shape = self.options['shape']
+        parts = self.options['parts']
+        num_alpha = self.options['num_alpha']
+
+        self.num_parts = len(parts)
+        self.part_shape = (self.num_parts,) + shape
+        self.alpha_shape = (num_alpha,) if num_alpha is not None else ()
+        self.full_shape = self.alpha_shape + self.part_shape
+
+        # shapes against which each input broadcasts to full_shape
+        self.broadcast_shapes = {}
+
+        self.part_setup()
+
+    def part_setup(self):
+        pass
+
+    def get_part_array(self, key):
+        """
+            Returns the values of the part option 'key' as an array broadcastable to the part shape.
+        """
+        values = np.array([part[key] for part in self.options['parts']], dtype=float)
+        return values.reshape((self.num_parts,) + (1,) * len(self.options['shape']))
+
+    def get_broadcast_input(self, inputs, name):
+        """
+            Returns a view of the input 'name' that broadcasts to the full shape.
+        """
+        return inputs[name].reshape(self.broadcast_shapes[name])
+
+    def part_add_input(self, name, val=1.0, alpha=False):
+        shape = self.full_shape if alpha else self.part_shape
+
+        self.add_input(name, val=val, shape=shape)
+        self.broadcast_shapes[name] = shape
+
+    def part_add_output(self, name, val=1.0):
+        self.add_output(name, val=val, shape=self.full_shape)
+
+    def flight_add_input(self, name, val=1.0, alpha=False):
+        shape = self.options['shape']
+
+        if alpha:
+            self.add_input(name, val=val, shape=self.alpha_shape + shape)
+            self.broadcast_shapes[name] = self.alpha_shape + (1,) + shape
+        else:
+            self.add_input(name, val=val, shape=shape)
+            self.broadcast_shapes[name] = shape
+
+    def get_broadcast_indices(self, shape):
+        """
+            Returns the flat indices of an array of the given shape, broadcast to the full shape and flattened.
+        """
+        return np.broadcast_to(np.arange(int(np.prod(shape))).reshape(shape), self.full_shape).flatten()
+
+    def part_declare_partials(self, of, wrt, val=None):
+        rows = np.arange(int(np.prod(self.full_shape)))
+        cols = self.get_broadcast_indices(self.broadcast_shapes[wrt])
+
+        if val is None:
+            self.declare_partials(of, wrt, rows=rows, cols=cols)
+        else:
+            self.declare_partials(of, wrt, val=val, rows=rows, cols=cols)
+
+    def get_part_partials(self, derivs):
+        """
+            Broadcasts derivs to the full shape and flattens it, for both part and flight partials.
+        """
+        return np.broadcast_to(derivs, self.full_shape).flatten()
@@ -0,0 +1,59 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.aerodynamics.utils import compute_induced_drag_coeff
+
+
+class PartInducedDragCoeffComp(PartArrayComponent):
+    """
+        Induced drag coefficient of a stack of lifting surfaces, with the sweep-blended Oswald
+        efficiency of InducedDragGroup.
+    """
+
+    def part_setup(self):
+        self.part_add_input('lift_coeff', alpha=True)
+        self.part_add_input('aspect_ratio')
+        self.part_add_input('sweep')
+        self.part_add_output('induced_drag_coeff')
+
+        self.part_declare_partials('induced_drag_coeff', 'lift_coeff')
+        self.part_declare_partials('induced_drag_coeff', 'aspect_ratio')
+        self.part_declare_partials('induced_drag_coeff', 'sweep')
+
+    def compute(self, inputs, outputs):
+        outputs['induced_drag_coeff'] = compute_induced_drag_coeff(
+            inputs['lift_coeff'], inputs['aspect_ratio'], inputs['sweep'])
+
+    def compute_partials(self, inputs, partials):
+        dCDi_dlift_coeff, dCDi_daspect_ratio, dCDi_dsweep = compute_induced_drag_coeff(
+            inputs['lift_coeff'], inputs['aspect_ratio'], inputs['sweep'], derivs=True)
+
+        partials['induced_drag_coeff', 'lift_coeff'] = self.get_part_partials(dCDi_dlift_coeff)
+        partials['induced_drag_coeff', 'aspect_ratio'] = self.get_part_partials(dCDi_daspect_ratio)
+        partials['induced_drag_coeff', 'sweep'] = self.get_part_partials(dCDi_dsweep)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    shape = (2, 3)
+    parts = [LiftingSurfaceGeometry(name='wing'), LiftingSurfaceGeometry(name='tail')]
+    part_shape = (len(parts),) + shape
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('lift_coeff', np.random.random(part_shape))
+    comp.add_output('aspect_ratio', 1. + 10 * np.random.random(part_shape))
+    comp.add_output('sweep', np.random.random(part_shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = PartInducedDragCoeffComp(shape=shape, parts=parts)
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
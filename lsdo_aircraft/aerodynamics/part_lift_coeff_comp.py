@@ -0,0 +1,94 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.aerodynamics.utils import get_lift_coeff_params, compute_lift_curve_slope
+
+
+class PartLiftCoeffComp(PartArrayComponent):
+    """
+        Lift coefficient of a stack of lifting surfaces, with the lift curve slope of
+        LiftCurveSlopeDenominatorComp and the lift coefficient of LiftGroup.
+    """
+
+    def part_setup(self):
+        self.part_add_input('aspect_ratio')
+        self.part_add_input('sweep')
+        self.part_add_input('incidence_angle')
+        self.flight_add_input('mach_number')
+        self.flight_add_input('alpha', alpha=True)
+        self.part_add_output('lift_coeff')
+
+        self.part_declare_partials('lift_coeff', 'aspect_ratio')
+        self.part_declare_partials('lift_coeff', 'sweep')
+        self.part_declare_partials('lift_coeff', 'incidence_angle')
+        self.part_declare_partials('lift_coeff', 'mach_number')
+        self.part_declare_partials('lift_coeff', 'alpha')
+
+        self.beta_eta_2, self.slope_coeff, self.lift_coeff_constant, self.alpha_coeff, self.incidence_coeff = \
+            get_lift_coeff_params(self.options['parts'], self.options['shape'])
+
+    def get_lift_curve_slope(self, inputs, derivs=False):
+        return compute_lift_curve_slope(
+            inputs['aspect_ratio'], inputs['sweep'], inputs['mach_number'], self.beta_eta_2, self.slope_coeff,
+            derivs=derivs,
+        )
+
+    def compute(self, inputs, outputs):
+        lift_curve_slope = self.get_lift_curve_slope(inputs)
+
+        outputs['lift_coeff'] = (
+            self.lift_coeff_constant
+            + self.alpha_coeff * lift_curve_slope * self.get_broadcast_input(inputs, 'alpha')
+            + self.incidence_coeff * lift_curve_slope * inputs['incidence_angle']
+        )
+
+    def compute_partials(self, inputs, partials):
+        alpha = self.get_broadcast_input(inputs, 'alpha')
+        incidence_angle = inputs['incidence_angle']
+
+        lift_curve_slope = self.get_lift_curve_slope(inputs)
+        dslope_daspect_ratio, dslope_dsweep, dslope_dmach_number = self.get_lift_curve_slope(inputs, derivs=True)
+
+        dlift_coeff_dslope = self.alpha_coeff * alpha + self.incidence_coeff * incidence_angle
+
+        partials['lift_coeff', 'aspect_ratio'] = self.get_part_partials(
+            dlift_coeff_dslope * dslope_daspect_ratio)
+        partials['lift_coeff', 'sweep'] = self.get_part_partials(
+            dlift_coeff_dslope * dslope_dsweep)
+        partials['lift_coeff', 'mach_number'] = self.get_part_partials(
+            dlift_coeff_dslope * dslope_dmach_number)
+        partials['lift_coeff', 'alpha'] = self.get_part_partials(
+            self.alpha_coeff * lift_curve_slope)
+        partials['lift_coeff', 'incidence_angle'] = self.get_part_partials(
+            self.incidence_coeff * lift_curve_slope)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    shape = (2, 3)
+    parts = [
+        LiftingSurfaceGeometry(name='wing', lift_coeff_zero_alpha=0.23),
+        LiftingSurfaceGeometry(name='tail', dynamic_pressure_ratio=0.9, downwash_slope=0.3),
+    ]
+    part_shape = (len(parts),) + shape
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('aspect_ratio', 10 * np.random.random(part_shape))
+    comp.add_output('sweep', np.random.random(part_shape))
+    comp.add_output('incidence_angle', 0.1 * np.random.random(part_shape))
+    comp.add_output('mach_number', 0.8 * np.random.random(shape))
+    comp.add_output('alpha', 0.1 * np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = PartLiftCoeffComp(shape=shape, parts=parts)
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
@@ -0,0 +1,113 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+class PartParasiteDragCoeffComp(PartArrayComponent):
+    """
+        Parasite drag coefficient of a stack of lifting surfaces or of bodies, from the skin friction
+        coefficient, the form factor and the interference factor of each part.
+        The form factor of lifting surfaces depends on the Mach number and sweep, while that of bodies
+        is a constant computed from the fuselage aspect ratio.
+    """
+
+    def part_initialize(self):
+        self.options.declare('lifting_surfaces', default=True, types=bool)
+
+    def part_setup(self):
+        lifting_surfaces = self.options['lifting_surfaces']
+
+        self.part_add_input('skin_friction_coeff')
+        self.part_add_input('wetted_area')
+        self.flight_add_input('ref_area')
+        self.part_add_output('parasite_drag_coeff')
+
+        self.part_declare_partials('parasite_drag_coeff', 'skin_friction_coeff')
+        self.part_declare_partials('parasite_drag_coeff', 'wetted_area')
+        self.part_declare_partials('parasite_drag_coeff', 'ref_area')
+
+        interference_factor = self.get_part_array('interference_factor')
+
+        if lifting_surfaces:
+            self.part_add_input('sweep')
+            self.flight_add_input('mach_number')
+
+            self.part_declare_partials('parasite_drag_coeff', 'sweep')
+            self.part_declare_partials('parasite_drag_coeff', 'mach_number')
+
+            thickness_chord = self.get_part_array('thickness_chord')
+            max_thickness_location = self.get_part_array('max_thickness_location')
+
+            self.form_factor_coeff = interference_factor * 1.34 * (
+                1 + 0.6 / max_thickness_location * thickness_chord + 100. * thickness_chord ** 4)
+        else:
+            fuselage_aspect_ratio = self.get_part_array('fuselage_aspect_ratio')
+
+            self.form_factor_coeff = interference_factor * (
+                1 + 60. / fuselage_aspect_ratio ** 3. + fuselage_aspect_ratio / 400.)
+
+    def get_form_factor(self, inputs):
+        if self.options['lifting_surfaces']:
+            return self.form_factor_coeff * inputs['mach_number'] ** 0.18 * np.cos(inputs['sweep']) ** 0.28
+        else:
+            return self.form_factor_coeff
+
+    def compute(self, inputs, outputs):
+        form_factor = self.get_form_factor(inputs)
+
+        outputs['parasite_drag_coeff'] = \
+            inputs['skin_friction_coeff'] * form_factor * inputs['wetted_area'] / inputs['ref_area']
+
+    def compute_partials(self, inputs, partials):
+        skin_friction_coeff = inputs['skin_friction_coeff']
+        wetted_area = inputs['wetted_area']
+        ref_area = inputs['ref_area']
+
+        form_factor = self.get_form_factor(inputs)
+        parasite_drag_coeff = skin_friction_coeff * form_factor * wetted_area / ref_area
+
+        partials['parasite_drag_coeff', 'skin_friction_coeff'] = self.get_part_partials(
+            form_factor * wetted_area / ref_area)
+        partials['parasite_drag_coeff', 'wetted_area'] = self.get_part_partials(
+            skin_friction_coeff * form_factor / ref_area)
+        partials['parasite_drag_coeff', 'ref_area'] = self.get_part_partials(
+            -parasite_drag_coeff / ref_area)
+
+        if self.options['lifting_surfaces']:
+            partials['parasite_drag_coeff', 'sweep'] = self.get_part_partials(
+                -0.28 * parasite_drag_coeff * np.tan(inputs['sweep']))
+            partials['parasite_drag_coeff', 'mach_number'] = self.get_part_partials(
+                0.18 * parasite_drag_coeff / inputs['mach_number'])
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.body_geometry import BodyGeometry
+
+
+    shape = (2, 3)
+
+    for lifting_surfaces, parts in [
+        (True, [LiftingSurfaceGeometry(name='wing'), LiftingSurfaceGeometry(name='tail', thickness_chord=0.12)]),
+        (False, [BodyGeometry(name='fuselage'), BodyGeometry(name='nacelle', fuselage_aspect_ratio=4.)]),
+    ]:
+        part_shape = (len(parts),) + shape
+
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('skin_friction_coeff', 1.e-3 * (1. + np.random.random(part_shape)))
+        comp.add_output('wetted_area', 1. + 10 * np.random.random(part_shape))
+        comp.add_output('sweep', np.random.random(part_shape))
+        comp.add_output('ref_area', 1. + 10 * np.random.random(shape))
+        comp.add_output('mach_number', 0.3 + 0.5 * np.random.random(shape))
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = PartParasiteDragCoeffComp(shape=shape, parts=parts, lifting_surfaces=lifting_surfaces)
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.run_model()
+        prob.check_partials(compact_print=True)
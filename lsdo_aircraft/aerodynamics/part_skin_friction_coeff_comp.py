@@ -0,0 +1,86 @@
+import numpy as np
+
+from lsdo_utils.api import OptionsDictionary
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.aerodynamics.utils import get_Re_cutoff_params, compute_skin_friction_coeff
+
+
+class PartSkinFrictionCoeffComp(PartArrayComponent):
+    """
+        Skin friction coefficient of a stack of parts, blending the laminar and turbulent flat-plate
+        coefficients of SkinFrictionGroup by the laminar percentage of each part.
+    """
+
+    def part_initialize(self):
+        self.options.declare('aircraft', types=OptionsDictionary)
+
+    def part_setup(self):
+        aircraft = self.options['aircraft']
+
+        self.part_add_input('characteristic_length')
+        self.flight_add_input('density')
+        self.flight_add_input('speed')
+        self.flight_add_input('dynamic_viscosity')
+        self.flight_add_input('mach_number')
+        self.part_add_output('skin_friction_coeff')
+
+        self.part_declare_partials('skin_friction_coeff', 'characteristic_length')
+        self.part_declare_partials('skin_friction_coeff', 'density')
+        self.part_declare_partials('skin_friction_coeff', 'speed')
+        self.part_declare_partials('skin_friction_coeff', 'dynamic_viscosity')
+        self.part_declare_partials('skin_friction_coeff', 'mach_number')
+
+        self.Re_cutoff_coeff, self.Re_cutoff_mach_power = get_Re_cutoff_params(
+            aircraft['regime'], self.get_part_array('skin_friction_roughness'))
+        self.laminar_ratio = self.get_part_array('laminar_pctg') / 100.
+
+    def compute(self, inputs, outputs):
+        outputs['skin_friction_coeff'] = compute_skin_friction_coeff(
+            inputs['density'], inputs['speed'], inputs['dynamic_viscosity'],
+            inputs['characteristic_length'], inputs['mach_number'],
+            self.Re_cutoff_coeff, self.Re_cutoff_mach_power, self.laminar_ratio,
+        )
+
+    def compute_partials(self, inputs, partials):
+        dCf_ddensity, dCf_dspeed, dCf_dviscosity, dCf_dlength, dCf_dmach_number = compute_skin_friction_coeff(
+            inputs['density'], inputs['speed'], inputs['dynamic_viscosity'],
+            inputs['characteristic_length'], inputs['mach_number'],
+            self.Re_cutoff_coeff, self.Re_cutoff_mach_power, self.laminar_ratio, derivs=True,
+        )
+
+        partials['skin_friction_coeff', 'density'] = self.get_part_partials(dCf_ddensity)
+        partials['skin_friction_coeff', 'speed'] = self.get_part_partials(dCf_dspeed)
+        partials['skin_friction_coeff', 'dynamic_viscosity'] = self.get_part_partials(dCf_dviscosity)
+        partials['skin_friction_coeff', 'characteristic_length'] = self.get_part_partials(dCf_dlength)
+        partials['skin_friction_coeff', 'mach_number'] = self.get_part_partials(dCf_dmach_number)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.aircraft import Aircraft
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+    from lsdo_aircraft.geometry.body_geometry import BodyGeometry
+
+
+    shape = (2, 3)
+    parts = [LiftingSurfaceGeometry(name='wing', laminar_pctg=10.), BodyGeometry(name='fuselage')]
+    part_shape = (len(parts),) + shape
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('characteristic_length', 1. + 10 * np.random.random(part_shape))
+    comp.add_output('density', 0.3 + np.random.random(shape))
+    comp.add_output('speed', 100. + 150. * np.random.random(shape))
+    comp.add_output('dynamic_viscosity', 1.e-5 * (1. + np.random.random(shape)))
+    comp.add_output('mach_number', 0.3 + 0.5 * np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = PartSkinFrictionCoeffComp(shape=shape, parts=parts, aircraft=Aircraft(aircraft_type='transport'))
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
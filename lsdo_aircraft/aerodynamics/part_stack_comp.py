@@ -0,0 +1,66 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+
+
+class PartStackComp(PartArrayComponent):
+    """
+        Stacks the per-part inputs '{part name}_{var name}' into the part variable 'var name'
+        along the leading part axis.
+    """
+
+    def part_initialize(self):
+        self.options.declare('var_names', types=list)
+
+    def part_setup(self):
+        shape = self.options['shape']
+        parts = self.options['parts']
+        var_names = self.options['var_names']
+
+        size = int(np.prod(shape))
+
+        for var_name in var_names:
+            self.part_add_output(var_name)
+
+            for ind, part in enumerate(parts):
+                in_name = '{}_{}'.format(part['name'], var_name)
+
+                self.flight_add_input(in_name)
+                self.declare_partials(
+                    var_name, in_name, val=1.,
+                    rows=ind * size + np.arange(size),
+                    cols=np.arange(size),
+                )
+
+    def compute(self, inputs, outputs):
+        parts = self.options['parts']
+        var_names = self.options['var_names']
+
+        for var_name in var_names:
+            for ind, part in enumerate(parts):
+                outputs[var_name][ind] = inputs['{}_{}'.format(part['name'], var_name)]
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    shape = (2, 3)
+    parts = [LiftingSurfaceGeometry(name='wing'), LiftingSurfaceGeometry(name='tail')]
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    for part in parts:
+        comp.add_output('{}_sweep'.format(part['name']), np.random.random(shape))
+        comp.add_output('{}_area'.format(part['name']), np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = PartStackComp(shape=shape, parts=parts, var_names=['sweep', 'area'])
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
@@ -0,0 +1,76 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.aerodynamics.utils import compute_critical_mach_number, wave_drag_rise_coeff
+
+
+class PartWaveDragCoeffComp(PartArrayComponent):
+    """
+        Wave drag coefficient of a stack of lifting surfaces, from the critical Mach number of
+        AerodynamicsGroup and the drag rise of WaveDragCoeffComp.
+    """
+
+    def part_setup(self):
+        self.part_add_input('lift_coeff', alpha=True)
+        self.part_add_input('sweep')
+        self.flight_add_input('mach_number')
+        self.part_add_output('wave_drag_coeff')
+
+        self.part_declare_partials('wave_drag_coeff', 'lift_coeff')
+        self.part_declare_partials('wave_drag_coeff', 'sweep')
+        self.part_declare_partials('wave_drag_coeff', 'mach_number')
+
+        self.airfoil_technology_factor = self.get_part_array('airfoil_technology_factor')
+        self.thickness_chord = self.get_part_array('thickness_chord')
+
+    def get_critical_mach_number(self, inputs, derivs=False):
+        return compute_critical_mach_number(
+            inputs['lift_coeff'], inputs['sweep'], self.airfoil_technology_factor, self.thickness_chord,
+            derivs=derivs,
+        )
+
+    def compute(self, inputs, outputs):
+        d_mach = inputs['mach_number'] - self.get_critical_mach_number(inputs)
+        d_mach *= d_mach > 0.
+
+        outputs['wave_drag_coeff'] = wave_drag_rise_coeff * d_mach ** 4
+
+    def compute_partials(self, inputs, partials):
+        d_mach = inputs['mach_number'] - self.get_critical_mach_number(inputs)
+        d_mach *= d_mach > 0.
+
+        dwave_drag_coeff_dmach = 4. * wave_drag_rise_coeff * d_mach ** 3
+        dcritical_mach_number_dlift_coeff, dcritical_mach_number_dsweep = \
+            self.get_critical_mach_number(inputs, derivs=True)
+
+        partials['wave_drag_coeff', 'lift_coeff'] = self.get_part_partials(
+            -dwave_drag_coeff_dmach * dcritical_mach_number_dlift_coeff)
+        partials['wave_drag_coeff', 'sweep'] = self.get_part_partials(
+            -dwave_drag_coeff_dmach * dcritical_mach_number_dsweep)
+        partials['wave_drag_coeff', 'mach_number'] = self.get_part_partials(dwave_drag_coeff_dmach)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    shape = (2, 3)
+    parts = [LiftingSurfaceGeometry(name='wing'), LiftingSurfaceGeometry(name='tail', thickness_chord=0.12)]
+    part_shape = (len(parts),) + shape
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('lift_coeff', np.random.random(part_shape))
+    comp.add_output('sweep', np.random.random(part_shape))
+    comp.add_output('mach_number', 0.7 + 0.3 * np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = PartWaveDragCoeffComp(shape=shape, parts=parts)
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
@@ -0,0 +1,98 @@
+import numpy as np
+
+from lsdo_utils.api import OptionsDictionary, ArrayExplicitComponent
+
+from lsdo_aircraft.aerodynamics.utils import get_Re_cutoff_params, compute_skin_friction_coeff
+
+
+class SkinFrictionCoeffComp(ArrayExplicitComponent):
+    """
+        Fused skin friction component: computes the Reynolds number, the roughness cutoff Reynolds number,
+        their smooth minimum, the laminar and turbulent skin friction coefficients and their blend
+        in a single pass. The output is the same as that of SkinFrictionGroup, which remains the
+        reference implementation.
+    """
+
+    def array_initialize(self):
+        self.options.declare('aircraft', types=OptionsDictionary)
+        self.options.declare('part', types=OptionsDictionary)
+
+    def array_setup(self):
+        aircraft = self.options['aircraft']
+        part = self.options['part']
+
+        self.array_add_input('density')
+        self.array_add_input('speed')
+        self.array_add_input('dynamic_viscosity')
+        self.array_add_input('characteristic_length')
+        self.array_add_input('mach_number')
+        self.array_add_output('skin_friction_coeff')
+
+        self.array_declare_partials('skin_friction_coeff', 'density')
+        self.array_declare_partials('skin_friction_coeff', 'speed')
+        self.array_declare_partials('skin_friction_coeff', 'dynamic_viscosity')
+        self.array_declare_partials('skin_friction_coeff', 'characteristic_length')
+        self.array_declare_partials('skin_friction_coeff', 'mach_number')
+
+        self.Re_cutoff_coeff, self.Re_cutoff_mach_power = get_Re_cutoff_params(
+            aircraft['regime'], part['skin_friction_roughness'])
+        self.laminar_ratio = part['laminar_pctg'] / 100.
+
+    def compute(self, inputs, outputs):
+        outputs['skin_friction_coeff'] = compute_skin_friction_coeff(
+            inputs['density'], inputs['speed'], inputs['dynamic_viscosity'],
+            inputs['characteristic_length'], inputs['mach_number'],
+            self.Re_cutoff_coeff, self.Re_cutoff_mach_power, self.laminar_ratio,
+        )
+
+    def compute_partials(self, inputs, partials):
+        dCf_ddensity, dCf_dspeed, dCf_dviscosity, dCf_dlength, dCf_dmach_number = compute_skin_friction_coeff(
+            inputs['density'].flatten(), inputs['speed'].flatten(), inputs['dynamic_viscosity'].flatten(),
+            inputs['characteristic_length'].flatten(), inputs['mach_number'].flatten(),
+            self.Re_cutoff_coeff, self.Re_cutoff_mach_power, self.laminar_ratio, derivs=True,
+        )
+
+        partials['skin_friction_coeff', 'density'] = dCf_ddensity
+        partials['skin_friction_coeff', 'speed'] = dCf_dspeed
+        partials['skin_friction_coeff', 'dynamic_viscosity'] = dCf_dviscosity
+        partials['skin_friction_coeff', 'characteristic_length'] = dCf_dlength
+        partials['skin_friction_coeff', 'mach_number'] = dCf_dmach_number
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.aircraft import Aircraft
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+    from lsdo_aircraft.aerodynamics.skin_friction_group import SkinFrictionGroup
+
+
+    shape = (2, 3)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('density', 0.3 + np.random.random(shape))
+    comp.add_output('speed', 100. + 150. * np.random.random(shape))
+    comp.add_output('dynamic_viscosity', 1.e-5 * (1. + np.random.random(shape)))
+    comp.add_output('characteristic_length', 1. + 10 * np.random.random(shape))
+    comp.add_output('mach_number', 0.3 + 0.5 * np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    for regime in ['subsonic', 'transonic']:
+        aircraft = Aircraft(aircraft_type='transport', regime=regime)
+        part = LiftingSurfaceGeometry(name='wing', laminar_pctg=10.)
+
+        comp = SkinFrictionCoeffComp(shape=shape, aircraft=aircraft, part=part)
+        prob.model.add_subsystem('{}_comp'.format(regime), comp, promotes_inputs=['*'])
+
+        group = SkinFrictionGroup(shape=shape, aircraft=aircraft, part=part)
+        prob.model.add_subsystem('{}_group'.format(regime), group, promotes_inputs=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
+
+    for regime in ['subsonic', 'transonic']:
+        print(regime, 'max. difference from SkinFrictionGroup:', np.max(np.abs(
+            prob['{}_comp.skin_friction_coeff'.format(regime)] - prob['{}_group.skin_friction_coeff'.format(regime)])))
@@ -4,6 +4,9 @@ from openmdao.api import Group
 
 from lsdo_utils.api import OptionsDictionary, LinearCombinationComp, PowerCombinationComp, GeneralOperationComp, ElementwiseMinComp
 
+from lsdo_aircraft.aerodynamics.dependency_cache import DependencyCache
+from lsdo_aircraft.aerodynamics.tracked_power_combination_comp import TrackedPowerCombinationComp
+
 
 class SkinFrictionGroup(Group):
 
@@ -11,11 +14,13 @@ class SkinFrictionGroup(Group):
         self.options.declare('shape', types=tuple)
         self.options.declare('aircraft', types=OptionsDictionary)
         self.options.declare('part', types=OptionsDictionary)
+        self.options.declare('dependency_cache', default=None, types=DependencyCache, allow_none=True)
 
     def setup(self):
         shape = self.options['shape']
         aircraft = self.options['aircraft']
         part = self.options['part']
+        dependency_cache = self.options['dependency_cache']
 
         skin_friction_roughness = part['skin_friction_roughness']
         laminar_pctg = part['laminar_pctg']
@@ -33,17 +38,18 @@ class SkinFrictionGroup(Group):
         self.add_subsystem('Re_comp', comp, promotes=['*'])
 
         if aircraft['regime'] == 'subsonic':
-            comp = PowerCombinationComp(
+            comp = TrackedPowerCombinationComp(
                 shape=shape,
                 out_name='Re_cutoff',
                 coeff=38.21 * skin_friction_roughness ** -1.053,
                 powers_dict=dict(
                     characteristic_length=1.053,
                 ),
+                dependency_cache=dependency_cache,
             )
             self.add_subsystem('Re_cutoff_comp', comp, promotes=['*'])
         elif aircraft['regime'] in ['transonic', 'supersonic']:
-            comp = PowerCombinationComp(
+            comp = TrackedPowerCombinationComp(
                 shape=shape,
                 out_name='Re_cutoff',
                 coeff=44.62 * skin_friction_roughness ** -1.053,
@@ -51,6 +57,7 @@ class SkinFrictionGroup(Group):
                     characteristic_length=1.053,
                     mach_number=1.16,
                 ),
+                dependency_cache=dependency_cache,
             )
             self.add_subsystem('Re_cutoff_comp', comp, promotes=['*'])
         else:
@@ -0,0 +1,83 @@
+import numpy as np
+
+from lsdo_utils.api import PowerCombinationComp
+
+from lsdo_aircraft.aerodynamics.dependency_cache import DependencyCache
+
+
+class TrackedPowerCombinationComp(PowerCombinationComp):
+    """
+        PowerCombinationComp for terms that depend only on the geometry and mach_number, e.g., Re_cutoff_comp and
+        form_factor_comp of AerodynamicsGroup. With a dependency_cache, the output and the partials are stored
+        with the inputs they were computed from, and compute and compute_partials restore them instead of
+        evaluating the powers again until one of the inputs changes.
+    """
+
+    def array_initialize(self):
+        super(TrackedPowerCombinationComp, self).array_initialize()
+        self.options.declare('dependency_cache', default=None, types=DependencyCache, allow_none=True)
+
+    def compute(self, inputs, outputs):
+        dependency_cache = self.options['dependency_cache']
+        out_name = self.options['out_name']
+        in_names = list(self.options['powers_dict'])
+
+        if dependency_cache is None:
+            return super(TrackedPowerCombinationComp, self).compute(inputs, outputs)
+
+        def func():
+            super(TrackedPowerCombinationComp, self).compute(inputs, outputs)
+            return np.array(outputs[out_name])
+
+        outputs[out_name] = dependency_cache.get(self, out_name, inputs, in_names, func)
+
+    def compute_partials(self, inputs, partials):
+        dependency_cache = self.options['dependency_cache']
+        out_name = self.options['out_name']
+        in_names = list(self.options['powers_dict'])
+
+        if dependency_cache is None:
+            return super(TrackedPowerCombinationComp, self).compute_partials(inputs, partials)
+
+        def func():
+            super(TrackedPowerCombinationComp, self).compute_partials(inputs, partials)
+            return {in_name: np.array(partials[out_name, in_name]) for in_name in in_names}
+
+        derivs = dependency_cache.get(self, 'd{}'.format(out_name), inputs, in_names, func)
+        for in_name in in_names:
+            partials[out_name, in_name] = derivs[in_name]
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+
+    shape = (2, 3)
+
+    dependency_cache = DependencyCache()
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('mach_number', np.random.random(shape))
+    comp.add_output('cos_sweep', np.random.random(shape))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = TrackedPowerCombinationComp(
+        shape=shape,
+        out_name='form_factor',
+        coeff=1.5,
+        powers_dict=dict(
+            mach_number=0.18,
+            cos_sweep=0.28,
+        ),
+        dependency_cache=dependency_cache,
+    )
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    for ind in range(5):
+        prob.run_model()
+    prob.check_partials(compact_print=True)
+
+    print('{} skips, {} recomputes'.format(dependency_cache.skips, dependency_cache.recomputes))
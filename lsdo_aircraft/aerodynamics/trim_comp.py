@@ -0,0 +1,239 @@
+import numpy as np
+
+from openmdao.api import ImplicitComponent
+
+from lsdo_aircraft.aerodynamics.utils import get_lift_coeff_params, compute_lift_curve_slope
+
+
+class TrimComp(ImplicitComponent):
+    """
+        This component solves for the alpha at which the lift of the lifting surfaces equals the weight,
+        at every point independently, with the lift coefficient of LiftGroup (PartLiftCoeffComp).
+        The part inputs (aspect_ratio, sweep, incidence_angle, area) have shape (num_parts,) + shape, as
+        in the vectorized aerodynamics; the lift is dynamic_pressure * sum(area * lift_coeff) over the parts.
+        Each point is bracketed between 'alpha_min' and 'alpha_max', then solved by Newton's method with
+        bisection whenever a step leaves the bracket; points that cannot be trimmed in the bracket are
+        clipped to its ends, and their residual is alpha - alpha_min or alpha - alpha_max instead, with a unit
+        derivative w.r.t. alpha and zero derivatives w.r.t. the inputs. The solve starts from the current alpha,
+        so successive solves are warm-started.
+        The Jacobian w.r.t. alpha is diagonal, so the linear solve is a pointwise division.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+        self.options.declare('parts', types=list)
+        self.options.declare('alpha_min', default=-10. * np.pi / 180., types=float)
+        self.options.declare('alpha_max', default=20. * np.pi / 180., types=float)
+        self.options.declare('num_iter', default=50, types=int)
+        self.options.declare('tol', default=1.e-12, types=float)
+
+    def setup(self):
+        shape = self.options['shape']
+        parts = self.options['parts']
+
+        size = int(np.prod(shape))
+        part_shape = (len(parts),) + shape
+
+        for name in ['aspect_ratio', 'sweep', 'incidence_angle', 'area']:
+            self.add_input(name, shape=part_shape)
+        self.add_input('mach_number', shape=shape)
+        self.add_input('dynamic_pressure', shape=shape)
+        self.add_input('weight', shape=shape)
+        self.add_output('alpha', shape=shape)
+
+        arange = np.arange(size)
+        part_cols = np.arange(len(parts) * size)
+        part_rows = np.tile(arange, len(parts))
+
+        for name in ['aspect_ratio', 'sweep', 'incidence_angle', 'area']:
+            self.declare_partials('alpha', name, rows=part_rows, cols=part_cols)
+        self.declare_partials('alpha', ['mach_number', 'dynamic_pressure', 'weight', 'alpha'], rows=arange, cols=arange)
+
+        self.beta_eta_2, self.slope_coeff, self.lift_coeff_constant, self.alpha_coeff, self.incidence_coeff = \
+            get_lift_coeff_params(parts, shape)
+
+    def get_lift_curve_slope(self, inputs, derivs=False):
+        return compute_lift_curve_slope(
+            inputs['aspect_ratio'], inputs['sweep'], inputs['mach_number'], self.beta_eta_2, self.slope_coeff,
+            derivs=derivs,
+        )
+
+    def get_res(self, inputs, alpha, lift_curve_slope):
+        """
+            Returns the residual, lift - weight, and its derivative w.r.t. alpha.
+        """
+        area = inputs['area']
+        dynamic_pressure = inputs['dynamic_pressure']
+
+        lift_coeff = (
+            self.lift_coeff_constant
+            + self.alpha_coeff * lift_curve_slope * alpha
+            + self.incidence_coeff * lift_curve_slope * inputs['incidence_angle']
+        )
+
+        residual = dynamic_pressure * np.sum(area * lift_coeff, axis=0) - inputs['weight']
+        dres_dalpha = dynamic_pressure * np.sum(area * self.alpha_coeff * lift_curve_slope, axis=0)
+
+        return residual, dres_dalpha
+
+    def get_clip_masks(self, inputs, lift_curve_slope):
+        """
+            Returns the masks of the points that are clipped to alpha_min, whose lift is already above the weight
+            there, and to alpha_max, whose lift is still below the weight there; the lift increases with alpha.
+        """
+        shape = self.options['shape']
+
+        rl, _ = self.get_res(inputs, self.options['alpha_min'] * np.ones(shape), lift_curve_slope)
+        ru, _ = self.get_res(inputs, self.options['alpha_max'] * np.ones(shape), lift_curve_slope)
+        mask_l = rl >= 0
+        mask_u = ru <= 0
+        mask_l[mask_u] = False
+
+        return mask_l, mask_u
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        alpha = outputs['alpha']
+
+        lift_curve_slope = self.get_lift_curve_slope(inputs)
+        mask_l, mask_u = self.get_clip_masks(inputs, lift_curve_slope)
+
+        residual, _ = self.get_res(inputs, alpha, lift_curve_slope)
+        residual[mask_l] = alpha[mask_l] - self.options['alpha_min']
+        residual[mask_u] = alpha[mask_u] - self.options['alpha_max']
+
+        residuals['alpha'] = residual
+
+    def solve_nonlinear(self, inputs, outputs):
+        shape = self.options['shape']
+        num_iter = self.options['num_iter']
+        tol = self.options['tol']
+
+        lift_curve_slope = self.get_lift_curve_slope(inputs)
+        scale = np.maximum(np.abs(inputs['weight']), 1.)
+
+        xl = self.options['alpha_min'] * np.ones(shape)
+        xu = self.options['alpha_max'] * np.ones(shape)
+
+        # points that are not bracketed are clipped to the bracket ends
+        mask_l, mask_u = self.get_clip_masks(inputs, lift_curve_slope)
+
+        x = np.clip(outputs['alpha'], xl, xu)
+
+        for ind in range(num_iter):
+            r, dr_dx = self.get_res(inputs, x, lift_curve_slope)
+
+            if np.max(np.abs(r[~(mask_l | mask_u)]) / scale[~(mask_l | mask_u)], initial=0.) < tol:
+                break
+
+            mask_p = r > 0
+            mask_n = r <= 0
+            xu[mask_p] = x[mask_p]
+            xl[mask_n] = x[mask_n]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x = x - r / dr_dx
+
+            mask_bisect = ~((x > xl) & (x < xu))
+            x[mask_bisect] = 0.5 * xl[mask_bisect] + 0.5 * xu[mask_bisect]
+
+        x[mask_l] = self.options['alpha_min']
+        x[mask_u] = self.options['alpha_max']
+
+        outputs['alpha'] = x
+
+    def linearize(self, inputs, outputs, partials):
+        area = inputs['area']
+        dynamic_pressure = inputs['dynamic_pressure']
+        alpha = outputs['alpha']
+        incidence_angle = inputs['incidence_angle']
+
+        lift_curve_slope = self.get_lift_curve_slope(inputs)
+        dslope_daspect_ratio, dslope_dsweep, dslope_dmach_number = self.get_lift_curve_slope(inputs, derivs=True)
+
+        # the residuals of the clipped points only depend on alpha
+        mask_clip = np.logical_or(*self.get_clip_masks(inputs, lift_curve_slope))
+        not_clip = ~mask_clip
+
+        lift_coeff = (
+            self.lift_coeff_constant
+            + self.alpha_coeff * lift_curve_slope * alpha
+            + self.incidence_coeff * lift_curve_slope * incidence_angle
+        )
+        dlift_dslope = dynamic_pressure * area * (self.alpha_coeff * alpha + self.incidence_coeff * incidence_angle)
+        dres_dalpha = dynamic_pressure * np.sum(area * self.alpha_coeff * lift_curve_slope, axis=0)
+
+        dres_dalpha[mask_clip] = 1.
+
+        partials['alpha', 'aspect_ratio'] = (dlift_dslope * dslope_daspect_ratio * not_clip).flatten()
+        partials['alpha', 'sweep'] = (dlift_dslope * dslope_dsweep * not_clip).flatten()
+        partials['alpha', 'incidence_angle'] = (
+            dynamic_pressure * area * self.incidence_coeff * lift_curve_slope * not_clip).flatten()
+        partials['alpha', 'area'] = (dynamic_pressure * lift_coeff * not_clip).flatten()
+        partials['alpha', 'mach_number'] = (np.sum(dlift_dslope * dslope_dmach_number, axis=0) * not_clip).flatten()
+        partials['alpha', 'dynamic_pressure'] = (np.sum(area * lift_coeff, axis=0) * not_clip).flatten()
+        partials['alpha', 'weight'] = -not_clip.flatten().astype(float)
+        partials['alpha', 'alpha'] = dres_dalpha.flatten()
+
+        self.jac = dres_dalpha
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        if mode == 'fwd':
+            d_outputs['alpha'] += 1. / self.jac * d_residuals['alpha']
+        else:
+            d_residuals['alpha'] += 1. / self.jac * d_outputs['alpha']
+
+
+if __name__ == '__main__':
+    import time
+
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    parts = [
+        LiftingSurfaceGeometry(name='wing', lift_coeff_zero_alpha=0.23),
+        LiftingSurfaceGeometry(name='tail', dynamic_pressure_ratio=0.9, downwash_slope=0.3),
+    ]
+
+    for shape in [(100000,), (2, 3)]:
+        part_shape = (len(parts),) + shape
+
+        area = 100. + 300. * np.random.random(part_shape)
+        dynamic_pressure = 5000. + 15000. * np.random.random(shape)
+
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('aspect_ratio', 4. + 6. * np.random.random(part_shape))
+        comp.add_output('sweep', 0.6 * np.random.random(part_shape))
+        comp.add_output('incidence_angle', 0.05 * np.random.random(part_shape))
+        comp.add_output('area', area)
+        comp.add_output('mach_number', 0.2 + 0.6 * np.random.random(shape))
+        comp.add_output('dynamic_pressure', dynamic_pressure)
+        weight_ratio = 0.3 + 0.5 * np.random.random(shape)
+        if shape == (2, 3):
+            # one point too heavy and one too light to be trimmed, which are clipped to alpha_max and alpha_min
+            weight_ratio[0, :2] = [5., -5.]
+
+        comp.add_output('weight', dynamic_pressure * np.sum(area, axis=0) * weight_ratio)
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = TrimComp(shape=shape, parts=parts)
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.final_setup()
+
+        start = time.time()
+        prob.run_model()
+        print('{} points trimmed in {:.3f} s'.format(np.prod(shape), time.time() - start))
+
+        prob.model.run_apply_nonlinear()
+        residuals = prob.model._residuals['alpha']
+        print('max. relative residual', np.max(np.abs(residuals) / np.abs(prob['weight'])))
+
+    prob.check_partials(compact_print=True)
+
+    # the linear solve goes through solve_linear, which check_partials does not call
+    prob.check_totals(of=['alpha'], wrt=['weight', 'dynamic_pressure', 'sweep'], compact_print=True, step_calc='rel')
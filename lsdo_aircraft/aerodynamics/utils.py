@@ -0,0 +1,190 @@
+import numpy as np
+
+
+sweep_30 = 30. * np.pi / 180.
+
+# coefficient of the quartic drag rise of WaveDragCoeffComp, wave_drag_rise_coeff * (mach_number - critical_mach_number) ** 4
+wave_drag_rise_coeff = 20.
+
+def compute_smooth_min(a, b, rho):
+    """
+        KS smooth minimum of a and b, as in ElementwiseMinComp, and its derivatives w.r.t. a and b.
+    """
+    a, b = np.broadcast_arrays(a, b)
+    f_min = np.minimum(a, b)
+
+    exp_a = np.exp(-rho * (a - f_min))
+    exp_b = np.exp(-rho * (b - f_min))
+    exp_sum = exp_a + exp_b
+
+    return f_min - np.log(exp_sum) / rho, exp_a / exp_sum, exp_b / exp_sum
+
+
+def get_Re_cutoff_params(regime, skin_friction_roughness):
+    """
+        Returns the coefficient and the Mach number exponent of the roughness cutoff Reynolds number,
+        Re_cutoff = coeff * characteristic_length ** 1.053 * mach_number ** power.
+    """
+    if regime == 'subsonic':
+        return 38.21 * skin_friction_roughness ** -1.053, 0.
+    elif regime in ['transonic', 'supersonic']:
+        return 44.62 * skin_friction_roughness ** -1.053, 1.16
+    else:
+        raise Exception()
+
+
+def compute_skin_friction_coeff(
+        density, speed, dynamic_viscosity, characteristic_length, mach_number,
+        Re_cutoff_coeff, Re_cutoff_mach_power, laminar_ratio, derivs=False):
+    """
+        Skin friction coefficient of SkinFrictionGroup: the laminar and turbulent flat-plate coefficients,
+        the latter at the smooth minimum of Re and the roughness cutoff Reynolds number, blended by the
+        laminar ratio. If derivs is True, the derivatives w.r.t. density, speed, dynamic_viscosity,
+        characteristic_length and mach_number are returned instead, in that order.
+    """
+    Re = density * speed * characteristic_length / dynamic_viscosity
+    Re_cutoff = Re_cutoff_coeff * characteristic_length ** 1.053 * mach_number ** Re_cutoff_mach_power
+    Re_turbulent_min, dmin_dRe, dmin_dRe_cutoff = compute_smooth_min(Re, Re_cutoff, 1e-3)
+
+    log_Re = np.log(Re_turbulent_min) / np.log(10)
+    mach_factor = 1 + 0.144 * mach_number ** 2
+
+    if not derivs:
+        skin_friction_coeff_laminar = 1.328 * Re ** -0.5
+        skin_friction_coeff_turbulent = 0.455 / log_Re ** 2.58 / mach_factor ** 0.65
+
+        return laminar_ratio * skin_friction_coeff_laminar + (1 - laminar_ratio) * skin_friction_coeff_turbulent
+
+    dlaminar_dRe = -0.5 * 1.328 * Re ** -1.5
+    dturbulent_dmin = -2.58 * 0.455 / log_Re ** 3.58 / Re_turbulent_min / np.log(10) / mach_factor ** 0.65
+    dturbulent_dmach_number = -0.65 * 0.455 / log_Re ** 2.58 / mach_factor ** 1.65 * 2 * 0.144 * mach_number
+
+    dCf_dRe = laminar_ratio * dlaminar_dRe + (1 - laminar_ratio) * dturbulent_dmin * dmin_dRe
+    dCf_dRe_cutoff = (1 - laminar_ratio) * dturbulent_dmin * dmin_dRe_cutoff
+
+    return (
+        dCf_dRe * Re / density,
+        dCf_dRe * Re / speed,
+        -dCf_dRe * Re / dynamic_viscosity,
+        dCf_dRe * Re / characteristic_length + dCf_dRe_cutoff * 1.053 * Re_cutoff / characteristic_length,
+        dCf_dRe_cutoff * Re_cutoff_mach_power * Re_cutoff / mach_number
+            + (1 - laminar_ratio) * dturbulent_dmach_number,
+    )
+
+
+def compute_induced_drag_coeff(lift_coeff, aspect_ratio, sweep, derivs=False):
+    """
+        Induced drag coefficient of InducedDragGroup, with the Oswald efficiency blended between the
+        unswept and swept fits by the sweep capped at 30 degrees. If derivs is True, the derivatives
+        w.r.t. lift_coeff, aspect_ratio and sweep are returned instead, in that order.
+    """
+    sweep_capped_30, dsweep_capped_30_dsweep, _ = compute_smooth_min(sweep, sweep_30, 50.)
+
+    cos_sweep_015 = np.cos(sweep) ** 0.15
+    aspect_ratio_068 = aspect_ratio ** 0.68
+
+    oswald_efficiency_unswept = 1.14 - 1.78 * 0.045 * aspect_ratio_068
+    oswald_efficiency_swept = -3.1 + 4.61 * cos_sweep_015 - 4.61 * 0.045 * aspect_ratio_068 * cos_sweep_015
+    blend = sweep_capped_30 / sweep_30
+    oswald_efficiency = oswald_efficiency_unswept + (oswald_efficiency_swept - oswald_efficiency_unswept) * blend
+
+    induced_drag_coeff = lift_coeff ** 2 / np.pi / oswald_efficiency / aspect_ratio
+
+    if not derivs:
+        return induced_drag_coeff
+
+    dcos_sweep_015_dsweep = -0.15 * np.cos(sweep) ** -0.85 * np.sin(sweep)
+    daspect_ratio_068_daspect_ratio = 0.68 * aspect_ratio ** -0.32
+
+    deu_daspect_ratio = -1.78 * 0.045 * daspect_ratio_068_daspect_ratio
+    des_daspect_ratio = -4.61 * 0.045 * daspect_ratio_068_daspect_ratio * cos_sweep_015
+    des_dsweep = (4.61 - 4.61 * 0.045 * aspect_ratio_068) * dcos_sweep_015_dsweep
+
+    de_daspect_ratio = deu_daspect_ratio * (1 - blend) + des_daspect_ratio * blend
+    de_dsweep = des_dsweep * blend \
+        + (oswald_efficiency_swept - oswald_efficiency_unswept) * dsweep_capped_30_dsweep / sweep_30
+
+    return (
+        2 * lift_coeff / np.pi / oswald_efficiency / aspect_ratio,
+        -induced_drag_coeff / aspect_ratio - induced_drag_coeff / oswald_efficiency * de_daspect_ratio,
+        -induced_drag_coeff / oswald_efficiency * de_dsweep,
+    )
+
+
+def get_part_array(parts, key, shape):
+    """
+        Returns the values of the part option 'key' as an array broadcastable to (len(parts),) + shape.
+    """
+    values = np.array([part[key] for part in parts], dtype=float)
+    return values.reshape((len(parts),) + (1,) * len(shape))
+
+
+def get_lift_coeff_params(parts, shape):
+    """
+        Returns the part constants of the lift coefficient of LiftGroup for a list of lifting surfaces,
+        as arrays broadcastable to (len(parts),) + shape: beta ** 2 / eta ** 2 and the coefficient of
+        the lift curve slope of LiftCurveSlopeDenominatorComp, then the constant, alpha and incidence
+        angle coefficients of the lift coefficient.
+    """
+    dynamic_pressure_ratio = get_part_array(parts, 'dynamic_pressure_ratio', shape)
+
+    beta_eta_2 = (2 * np.pi / get_part_array(parts, 'lift_curve_slope_2D', shape)) ** 2
+    slope_coeff = 2 * np.pi * get_part_array(parts, 'wing_exposed_ratio', shape) * 1.07 \
+        * (1. + get_part_array(parts, 'fuselage_diameter_span', shape)) ** 2.
+    lift_coeff_constant = dynamic_pressure_ratio * get_part_array(parts, 'lift_coeff_zero_alpha', shape)
+    alpha_coeff = dynamic_pressure_ratio * (1 - get_part_array(parts, 'downwash_slope', shape))
+    incidence_coeff = dynamic_pressure_ratio
+
+    return beta_eta_2, slope_coeff, lift_coeff_constant, alpha_coeff, incidence_coeff
+
+
+def compute_lift_curve_slope(aspect_ratio, sweep, mach_number, beta_eta_2, slope_coeff, derivs=False):
+    """
+        Lift curve slope of LiftCurveSlopeDenominatorComp. If derivs is True, the derivatives
+        w.r.t. aspect_ratio, sweep and mach_number are returned instead, in that order.
+    """
+    tan_sweep = np.tan(sweep)
+    beta_2 = 1 - mach_number ** 2
+
+    arg = 4. + aspect_ratio ** 2 * beta_eta_2 * (1 + tan_sweep ** 2 / beta_2)
+    denominator = 2 + np.sqrt(arg)
+
+    if not derivs:
+        return slope_coeff * aspect_ratio / denominator
+
+    darg_daspect_ratio = 2 * aspect_ratio * beta_eta_2 * (1 + tan_sweep ** 2 / beta_2)
+    darg_dsweep = aspect_ratio ** 2 * beta_eta_2 * 2 * tan_sweep / np.cos(sweep) ** 2 / beta_2
+    darg_dmach_number = aspect_ratio ** 2 * beta_eta_2 * tan_sweep ** 2 * 2 * mach_number / beta_2 ** 2
+
+    dslope_darg = -slope_coeff * aspect_ratio / denominator ** 2 * 0.5 / np.sqrt(arg)
+
+    return (
+        slope_coeff / denominator + dslope_darg * darg_daspect_ratio,
+        dslope_darg * darg_dsweep,
+        dslope_darg * darg_dmach_number,
+    )
+
+
+def compute_critical_mach_number(lift_coeff, sweep, airfoil_technology_factor, thickness_chord, derivs=False):
+    """
+        Critical Mach number of critical_mach_number_comp in AerodynamicsGroup: the Korn drag-divergence
+        Mach number less (0.1 / (4 * wave_drag_rise_coeff)) ** (1 / 3), the Mach number increment at which
+        the drag rise of WaveDragCoeffComp reaches a slope of 0.1. If derivs is True, the derivatives w.r.t. lift_coeff
+        and sweep are returned instead, in that order.
+    """
+    cos_sweep = np.cos(sweep)
+
+    if not derivs:
+        return -(0.1 / (4. * wave_drag_rise_coeff)) ** (1. / 3.) \
+            + airfoil_technology_factor / cos_sweep \
+            - thickness_chord / cos_sweep ** 2 \
+            - 0.1 * lift_coeff / cos_sweep ** 3
+
+    return (
+        -0.1 / cos_sweep ** 3,
+        np.tan(sweep) * (
+            airfoil_technology_factor / cos_sweep
+            - 2 * thickness_chord / cos_sweep ** 2
+            - 0.3 * lift_coeff / cos_sweep ** 3
+        ),
+    )
@@ -2,6 +2,8 @@ import numpy as np
 
 from lsdo_utils.comps.array_explicit_component import ArrayExplicitComponent
 
+from lsdo_aircraft.aerodynamics.utils import wave_drag_rise_coeff
+
 
 class WaveDragCoeffComp(ArrayExplicitComponent):
 
@@ -17,14 +19,14 @@ class WaveDragCoeffComp(ArrayExplicitComponent):
         d_mach = inputs['mach_number'] - inputs['critical_mach_number']
         d_mach *= d_mach > 0.
 
-        outputs['wave_drag_coeff'] = 20. * d_mach ** 4
+        outputs['wave_drag_coeff'] = wave_drag_rise_coeff * d_mach ** 4
 
     def compute_partials(self, inputs, partials):
         d_mach = (inputs['mach_number'] - inputs['critical_mach_number']).flatten()
         d_mach *= d_mach > 0.
 
-        partials['wave_drag_coeff', 'mach_number'] = 80. * d_mach ** 3
-        partials['wave_drag_coeff', 'critical_mach_number'] = -80. * d_mach ** 3
+        partials['wave_drag_coeff', 'mach_number'] = 4. * wave_drag_rise_coeff * d_mach ** 3
+        partials['wave_drag_coeff', 'critical_mach_number'] = -4. * wave_drag_rise_coeff * d_mach ** 3
 
 
 if __name__ == '__main__':
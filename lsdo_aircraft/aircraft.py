@@ -59,6 +59,10 @@ class Aircraft(OptionsDictionary):
         self.declare('regime', default='transonic', values=['subsonic', 'transonic'])
 
         self.declare('powertrain', default=None, allow_none=True)
+        self.declare('atmosphere', default=None, allow_none=True)
+
+        self.declare('coupled_sizing', default=False, types=bool)
+        self.declare('coupled_sizing_wing', default='wing', types=str)
 
     def pre_setup(self):
         self.empty_weight_fraction_parameters = dict(
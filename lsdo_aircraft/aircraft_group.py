@@ -1,11 +1,28 @@
-from openmdao.api import Group
+from openmdao.api import Group, NewtonSolver, DirectSolver
+
+from lsdo_utils.api import PowerCombinationComp
 
 from lsdo_aircraft.aircraft import Aircraft
+from lsdo_aircraft.atmosphere.atmosphere import Atmosphere
+from lsdo_aircraft.atmosphere.atmosphere_group import AtmosphereGroup
 from lsdo_aircraft.geometry.geometry_group import GeometryGroup
 from lsdo_aircraft.analyses.analyses_group import AnalysesGroup
+from lsdo_aircraft.powertrain.powertrain_group import PowertrainGroup
+from lsdo_aircraft.aerodynamics.aerodynamics_group import AerodynamicsGroup
+from lsdo_aircraft.sizing_gross_weight.sizing_gross_weight_group import SizingGrossWeightGroup
+from lsdo_aircraft.sizing_performance.sizing_performance_group import SizingPerformanceGroup
 
 
 class AircraftGroup(Group):
+    """
+        The aircraft owns a single atmosphere block, promoted to this level, that feeds both the
+        analyses and the powertrain. Its options are aircraft['atmosphere'] if given, else those of
+        the first Atmosphere module of the powertrain; every Atmosphere module of the powertrain is
+        merged into it, and must have the same options apart from its name.
+        With aircraft['coupled_sizing'], the sizing groups are added as well and coupled with the aerodynamics:
+        the wing area from sizing drives the area and ref_area of the aerodynamics, and their
+        lift_to_drag_ratio drives the propellant weight fraction of sizing. See add_coupled_sizing.
+    """
 
     def initialize(self):
         self.options.declare('shape', types=tuple)
@@ -15,17 +32,134 @@ class AircraftGroup(Group):
         shape = self.options['shape']
         aircraft = self.options['aircraft']
 
+        powertrain = aircraft['powertrain']
+
+        atmosphere = aircraft['atmosphere']
+        if atmosphere is None and powertrain is not None and powertrain.get_modules(Atmosphere):
+            atmosphere = powertrain.get_modules(Atmosphere)[0]
+        if atmosphere is None:
+            atmosphere = Atmosphere(name='atmosphere')
+
+        if powertrain is not None:
+            for module in powertrain.get_modules(Atmosphere):
+                for key in atmosphere:
+                    if key != 'name' and module[key] != atmosphere[key]:
+                        raise Exception('Atmosphere module {} has {}={!r}, but the shared atmosphere has {!r}'.format(
+                            module['name'], key, module[key], atmosphere[key]))
+
         geometry_group = GeometryGroup(
             shape=shape, 
             options_dictionary=aircraft['geometry'],
         )
         self.add_subsystem('geometry_group', geometry_group, promotes=['*'])
 
+        atmosphere_group = AtmosphereGroup(
+            shape=shape,
+            options_dictionary=atmosphere,
+        )
+        self.add_subsystem('atmosphere_group', atmosphere_group, promotes=['*'])
+
         analyses_group = AnalysesGroup(
             shape=shape, 
             aircraft=aircraft,
             geometry=aircraft['geometry'], 
             options_dictionary=aircraft['analyses'],
+            include_atmosphere=False,
         )
         self.add_subsystem('analyses_group', analyses_group, promotes=['*'])
-        analyses_group.connect_inputs(self)
\ No newline at end of file
+
+        if aircraft['coupled_sizing']:
+            analyses_group.connect_inputs(self, sources=self.add_coupled_sizing())
+        else:
+            analyses_group.connect_inputs(self)
+
+        if powertrain is not None:
+            powertrain_group = PowertrainGroup(
+                shape=shape,
+                powertrain=powertrain,
+                shared_atmosphere=True,
+            )
+            self.add_subsystem('powertrain_group', powertrain_group)
+            powertrain_group.connect_atmosphere(self)
+
+    def add_coupled_sizing(self):
+        """
+            Adds SizingGrossWeightGroup and SizingPerformanceGroup and couples them with the aerodynamics.
+            The aerodynamics see the wing of aircraft['coupled_sizing_wing'] scaled to the sized wing_area:
+            its wetted area scales with the area and its characteristic length with the square root of it,
+            from the values of the geometry group. ref_area is the sized wing_area, the cruise_speed of sizing
+            is the speed of the analyses, and the density of sizing is renamed sizing_density so that
+            it is not taken from the cruise atmosphere.
+            Every sweep point is independent, so the Jacobian of the coupled system is block diagonal
+            with one small block per point. The Newton solver uses a DirectSolver on the assembled
+            sparse (CSC) Jacobian, whose sparse LU factorization only fills in within those blocks,
+            so a Newton iteration costs the same per point however many points there are.
+            Returns the sources of the sized wing variables, for AnalysesGroup.connect_inputs.
+        """
+        shape = self.options['shape']
+        aircraft = self.options['aircraft']
+
+        wing_name = aircraft['coupled_sizing_wing']
+
+        sizing_group = Group()
+
+        group = SizingGrossWeightGroup(
+            shape=shape,
+            aircraft=aircraft,
+        )
+        sizing_group.add_subsystem('sizing_gross_weight_group', group, promotes=['*'])
+
+        group = SizingPerformanceGroup(
+            shape=shape,
+            aircraft=aircraft,
+        )
+        sizing_group.add_subsystem('sizing_performance_group', group, promotes=['*'])
+
+        self.add_subsystem('sizing_group', sizing_group, promotes=[
+            '*', ('density', 'sizing_density'), ('cruise_speed', 'speed')])
+
+        comp = PowerCombinationComp(
+            shape=shape,
+            out_name='sized_wing_wetted_area',
+            powers_dict=dict(
+                wing_area=1.,
+                geometry_wing_wetted_area=1.,
+                geometry_wing_area=-1.,
+            ),
+        )
+        self.add_subsystem('sized_wing_wetted_area_comp', comp, promotes=['*'])
+
+        comp = PowerCombinationComp(
+            shape=shape,
+            out_name='sized_wing_characteristic_length',
+            powers_dict=dict(
+                wing_area=0.5,
+                geometry_wing_characteristic_length=1.,
+                geometry_wing_area=-0.5,
+            ),
+        )
+        self.add_subsystem('sized_wing_characteristic_length_comp', comp, promotes=['*'])
+
+        for var_name in ['area', 'wetted_area', 'characteristic_length']:
+            self.connect(
+                '{}_geometry_group.{}'.format(wing_name, var_name),
+                'geometry_wing_{}'.format(var_name),
+            )
+
+        self.connect('wing_area', 'ref_area')
+
+        for analysis in aircraft['analyses'].children:
+            if issubclass(analysis['group_class'], AerodynamicsGroup):
+                self.connect('{}_analysis_group.lift_to_drag_ratio'.format(analysis['name']), 'lift_to_drag_ratio')
+                break
+        else:
+            raise Exception('coupled_sizing requires an aerodynamics analysis')
+
+        self.nonlinear_solver = NewtonSolver(solve_subsystems=True, maxiter=20, atol=1.e-10, rtol=1.e-10)
+        self.linear_solver = DirectSolver(assemble_jac=True)
+
+        return {
+            (wing_name, 'area'): 'wing_area',
+            (wing_name, 'wetted_area'): 'sized_wing_wetted_area',
+            (wing_name, 'characteristic_length'): 'sized_wing_characteristic_length',
+        }
@@ -2,6 +2,7 @@ from openmdao.api import Group
 
 from lsdo_utils.api import OptionsDictionary
 
+from lsdo_aircraft.atmosphere.atmosphere import Atmosphere
 from lsdo_aircraft.atmosphere.atmosphere_group import AtmosphereGroup
 
 from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
@@ -15,6 +16,7 @@ class AnalysesGroup(Group):
         self.options.declare('aircraft', types=OptionsDictionary)
         self.options.declare('options_dictionary', types=OptionsDictionary)
         self.options.declare('geometry', types=OptionsDictionary)
+        self.options.declare('include_atmosphere', default=True, types=bool)
 
     def setup(self):
         shape = self.options['shape']
@@ -22,11 +24,12 @@ class AnalysesGroup(Group):
         options_dictionary = self.options['options_dictionary']
         geometry = self.options['geometry']
 
-        group = AtmosphereGroup(
-            shape=shape,
-            options_dictionary=object(),
-        )
-        self.add_subsystem('atmosphere_analysis_group', group, promotes=['*'])
+        if self.options['include_atmosphere']:
+            group = AtmosphereGroup(
+                shape=shape,
+                options_dictionary=Atmosphere(name='atmosphere'),
+            )
+            self.add_subsystem('atmosphere_analysis_group', group, promotes=['*'])
 
         for analysis in options_dictionary.children:
             name = analysis['name']
@@ -35,7 +38,14 @@ class AnalysesGroup(Group):
             group = group_class(shape=shape, aircraft=aircraft, options_dictionary=analysis, geometry=geometry)
             self.add_subsystem('{}_analysis_group'.format(name), group, promotes=group.promotes)
 
-    def connect_inputs(self, aircraft_group):
+    def connect_inputs(self, aircraft_group, sources=None):
+        """
+            Connects the geometry variables of every part to the analyses that depend on them.
+            sources optionally maps (part_name, var_name) to a source that replaces the geometry group's.
+        """
+        if sources is None:
+            sources = {}
+
         options_dictionary = self.options['options_dictionary']
         geometry = self.options['geometry']
 
@@ -55,6 +65,7 @@ class AnalysesGroup(Group):
 
                 for var_name in dependent_variables:
                     aircraft_group.connect(
-                        '{}_geometry_group.{}'.format(part_name, var_name),
-                        '{}_analysis_group.{}_group.{}'.format(analysis_name, part_name, var_name),
+                        sources.get((part_name, var_name), '{}_geometry_group.{}'.format(part_name, var_name)),
+                        '{}_analysis_group.{}'.format(
+                            analysis_name, group_class.get_dependent_input_name(analysis, part, var_name)),
                     )
\ No newline at end of file
@@ -9,6 +9,8 @@ from lsdo_aircraft.simple_reciprocating.simple_reciprocating import SimpleRecipr
 from lsdo_aircraft.simple_turbofan.simple_turbofan import SimpleTurbofan
 from lsdo_aircraft.simple_turboprop.simple_turboprop import SimpleTurboprop
 from lsdo_aircraft.atmosphere.atmosphere_group import AtmosphereGroup
+from lsdo_aircraft.atmosphere.evaluate_atmosphere import evaluate_atmosphere, AtmosphereArrays
+from lsdo_aircraft.atmosphere.inverse_atmosphere_comp import InverseAtmosphereComp
 # 
 from lsdo_aircraft.geometry.geometry import Geometry
 from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
@@ -17,6 +19,11 @@ from lsdo_aircraft.geometry.part_geometry import PartGeometry
 # 
 from lsdo_aircraft.analyses.analyses import Analyses
 from lsdo_aircraft.aerodynamics.aerodynamics import Aerodynamics
+from lsdo_aircraft.aerodynamics.drag_polar_table import DragPolarTable, get_drag_polar_table, get_geometry_hash
+from lsdo_aircraft.aerodynamics.drag_polar_comp import DragPolarComp
+from lsdo_aircraft.aerodynamics.trim_comp import TrimComp
+from lsdo_aircraft.aerodynamics.drag_divergence_mach_comp import DragDivergenceMachComp
+from lsdo_aircraft.vlm.vlm import VLM
 # 
 from lsdo_aircraft.aircraft import Aircraft
 # 
@@ -11,5 +11,12 @@ class Atmosphere(OptionsDictionary):
         self.declare('name', types=str)
         self.declare('group_class', default=AtmosphereGroup, values=[AtmosphereGroup])
 
+        self.declare('fused', default=False, types=bool)
+        self.declare('layered', default=False, types=bool)
+        self.declare('tabulated', default=False, types=bool)
+        self.declare('table_filename', default=None, types=str, allow_none=True)
+        self.declare('cache', default=False, types=bool)
+        self.declare('deduplicate', default='auto', values=[True, False, 'auto'])
+
     def pre_setup(self):
         pass
\ No newline at end of file
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+class AtmosphereCache(object):
+    """
+        Memoizes the last outputs and the last partials of an atmosphere component, keyed by
+        copies of the altitude, speed and temperature offset inputs they were computed at. When a component is run
+        or linearized again at unchanged inputs (e.g., a fixed altitude profile across driver
+        iterations), the stored arrays are copied back instead of being recomputed.
+        The hits and misses counters cover both outputs and partials.
+    """
+
+    in_names = ['altitude', 'speed', 'temperature_offset']
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._outputs_key = None
+        self._outputs = None
+        self._partials_key = None
+        self._partials = None
+
+    def _get_key(self, inputs):
+        return [np.array(inputs[in_name]) for in_name in self.in_names]
+
+    def _is_hit(self, key, inputs):
+        is_hit = key is not None and all(
+            np.array_equal(key_array, inputs[in_name])
+            for key_array, in_name in zip(key, self.in_names)
+        )
+
+        if is_hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        return is_hit
+
+    def load_outputs(self, inputs, outputs):
+        if not self._is_hit(self._outputs_key, inputs):
+            return False
+
+        for out_name, val in self._outputs.items():
+            outputs[out_name] = val
+
+        return True
+
+    def store_outputs(self, inputs, outputs_dict):
+        self._outputs_key = self._get_key(inputs)
+        self._outputs = outputs_dict
+
+    def load_partials(self, inputs, partials):
+        if not self._is_hit(self._partials_key, inputs):
+            return False
+
+        for key, val in self._partials.items():
+            partials[key] = val
+
+        return True
+
+    def store_partials(self, inputs, partials_dict):
+        self._partials_key = self._get_key(inputs)
+        self._partials = partials_dict
+
+    @property
+    def hit_rate(self):
+        num_calls = self.hits + self.misses
+        return float(self.hits) / num_calls if num_calls else 0.
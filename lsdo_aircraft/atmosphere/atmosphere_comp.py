@@ -0,0 +1,224 @@
+from __future__ import print_function
+import numpy as np
+
+from lsdo_utils.api import ArrayExplicitComponent
+
+from lsdo_aircraft.atmosphere.atmosphere_cache import AtmosphereCache
+from lsdo_aircraft.atmosphere.constants import R, gamma, mu2, T2, Ts
+from lsdo_aircraft.atmosphere.utils import \
+    AltitudeRegimeIndex, compute_pressures, compute_pressure_derivs, compute_temps, compute_temp_derivs
+from lsdo_aircraft.atmosphere.isa_utils import \
+    compute_isa_pressures, compute_isa_pressure_derivs, compute_isa_temps, compute_isa_temp_derivs
+
+
+class AtmosphereComp(ArrayExplicitComponent):
+    """
+        Fused atmosphere component: computes temperature, pressure, density, sonic speed, viscosity,
+        Mach number and dynamic pressure from altitude [m] and speed [m/s] in a single vectorized pass.
+        The temperature_offset input [K] shifts the temperature from the standard day (e.g., 15 for ISA+15)
+        at the standard pressure of each altitude.
+        The outputs are the same as those of the component chain in AtmosphereGroup, which remains
+        the reference implementation.
+        With 'deduplicate', the standard-day temperature and pressure are only evaluated on the unique
+        altitudes and scattered back; in 'auto' mode this is done when the array is at least
+        'min_compression_ratio' times larger than the number of unique altitudes. So that distinct altitudes
+        do not pay for a full sort, 'auto' first applies the same test to a strided sample of about
+        'num_samples' altitudes, which passes when the unique altitudes are few compared to the sample.
+        The ratio achieved in the last evaluation is stored in compression_ratio.
+    """
+
+    def array_initialize(self):
+        self.options.declare('regime_index', default=None, types=AltitudeRegimeIndex, allow_none=True)
+        self.options.declare('layered', default=False, types=bool)
+
+        self.options.declare('cache', default=None, types=AtmosphereCache, allow_none=True)
+        self.options.declare('deduplicate', default='auto', values=[True, False, 'auto'])
+        self.options.declare('min_compression_ratio', default=10., types=(int, float))
+        self.options.declare('num_samples', default=1000, types=int)
+
+    def array_setup(self):
+        if self.options['regime_index'] is None:
+            self.options['regime_index'] = AltitudeRegimeIndex()
+
+        self.unique_regime_index = AltitudeRegimeIndex()
+        self.compression_ratio = 1.
+
+        self.array_add_input('altitude')
+        self.array_add_input('speed')
+        self.array_add_input('temperature_offset', val=0.)
+        self.array_add_output('temperature')
+        self.array_add_output('pressure_MPa')
+        self.array_add_output('density')
+        self.array_add_output('sonic_speed')
+        self.array_add_output('dynamic_viscosity')
+        self.array_add_output('mach_number')
+        self.array_add_output('dynamic_pressure')
+
+        for out_name in [
+            'temperature',
+            'pressure_MPa',
+            'density',
+            'sonic_speed',
+            'dynamic_viscosity',
+            'mach_number',
+            'dynamic_pressure',
+        ]:
+            self.array_declare_partials(out_name, 'altitude')
+        self.array_declare_partials('mach_number', 'speed')
+        self.array_declare_partials('dynamic_pressure', 'speed')
+
+        for out_name in [
+            'temperature',
+            'density',
+            'sonic_speed',
+            'dynamic_viscosity',
+            'mach_number',
+            'dynamic_pressure',
+        ]:
+            self.array_declare_partials(out_name, 'temperature_offset')
+
+    def _compute_standard_atmosphere(self, h_m, regime_index, derivs):
+        if self.options['layered']:
+            segments = regime_index.get_segments(h_m)
+            arrays = [compute_isa_temps(h_m, segments), compute_isa_pressures(h_m, segments)]
+            if derivs:
+                arrays += [compute_isa_temp_derivs(h_m, segments), compute_isa_pressure_derivs(h_m, segments)]
+        else:
+            mask_arrays = regime_index.get_mask_arrays(h_m)
+            arrays = [compute_temps(h_m, *mask_arrays), compute_pressures(h_m, *mask_arrays)]
+            if derivs:
+                arrays += [compute_temp_derivs(h_m, *mask_arrays), compute_pressure_derivs(h_m, *mask_arrays)]
+
+        return arrays
+
+    def get_standard_atmosphere(self, h_m, derivs=False):
+        """
+            Returns the standard-day temperature and pressure at h_m, followed by their altitude
+            derivatives if derivs is True.
+        """
+        deduplicate = self.options['deduplicate']
+        regime_index = self.options['regime_index']
+
+        if deduplicate is False:
+            self.compression_ratio = 1.
+            return self._compute_standard_atmosphere(h_m, regime_index, derivs)
+
+        if deduplicate == 'auto':
+            h_sample = h_m.reshape(-1)[::max(h_m.size // self.options['num_samples'], 1)]
+
+            if h_sample.size < self.options['min_compression_ratio'] * np.unique(h_sample).size:
+                self.compression_ratio = 1.
+                return self._compute_standard_atmosphere(h_m, regime_index, derivs)
+
+        h_unique, inverse = regime_index.get_unique(h_m)
+
+        if deduplicate == 'auto' and h_m.size < self.options['min_compression_ratio'] * h_unique.size:
+            self.compression_ratio = 1.
+            return self._compute_standard_atmosphere(h_m, regime_index, derivs)
+
+        self.compression_ratio = float(h_m.size) / h_unique.size
+
+        arrays = self._compute_standard_atmosphere(h_unique, self.unique_regime_index, derivs)
+        return [array[inverse].reshape(h_m.shape) for array in arrays]
+
+    def compute(self, inputs, outputs):
+        cache = self.options['cache']
+        if cache is not None and cache.load_outputs(inputs, outputs):
+            return
+
+        h_m = inputs['altitude']
+        speed = inputs['speed']
+        temperature_offset = inputs['temperature_offset']
+
+        std_temperature, p_Pa = self.get_standard_atmosphere(h_m)
+        temperature = std_temperature + temperature_offset
+
+        density = p_Pa / R / temperature
+        sonic_speed = np.sqrt(gamma * R * temperature)
+
+        outputs_dict = {
+            'temperature': temperature,
+            'pressure_MPa': p_Pa / 1e6,
+            'density': density,
+            'sonic_speed': sonic_speed,
+            'dynamic_viscosity': mu2 * (temperature / T2) ** 1.5 * (T2 + Ts) / (temperature + Ts),
+            'mach_number': speed / sonic_speed,
+            'dynamic_pressure': 0.5 * density * speed ** 2,
+        }
+
+        for out_name, val in outputs_dict.items():
+            outputs[out_name] = val
+
+        if cache is not None:
+            cache.store_outputs(inputs, outputs_dict)
+
+    def compute_partials(self, inputs, partials):
+        cache = self.options['cache']
+        if cache is not None and cache.load_partials(inputs, partials):
+            return
+
+        h_m = inputs['altitude'].flatten()
+        speed = inputs['speed'].flatten()
+        temperature_offset = inputs['temperature_offset'].flatten()
+
+        std_temperature, p_Pa, dtemperature_dh, dp_dh = self.get_standard_atmosphere(h_m, derivs=True)
+        temperature = std_temperature + temperature_offset
+
+        density = p_Pa / R / temperature
+        ddensity_dtemperature = -density / temperature
+        ddensity_dh = dp_dh / R / temperature + ddensity_dtemperature * dtemperature_dh
+
+        sonic_speed = np.sqrt(gamma * R * temperature)
+        dsonic_speed_dtemperature = 0.5 * sonic_speed / temperature
+        dsonic_speed_dh = dsonic_speed_dtemperature * dtemperature_dh
+
+        dviscosity_dtemperature = (
+            1.5 * mu2 * temperature ** 0.5 / T2 ** 1.5 * (T2 + Ts) / (temperature + Ts)
+            - mu2 * (temperature / T2) ** 1.5 * (T2 + Ts) / (temperature + Ts) ** 2
+        )
+
+        partials_dict = {
+            ('temperature', 'altitude'): dtemperature_dh,
+            ('pressure_MPa', 'altitude'): dp_dh / 1e6,
+            ('density', 'altitude'): ddensity_dh,
+            ('sonic_speed', 'altitude'): dsonic_speed_dh,
+            ('dynamic_viscosity', 'altitude'): dviscosity_dtemperature * dtemperature_dh,
+            ('mach_number', 'altitude'): -speed / sonic_speed ** 2 * dsonic_speed_dh,
+            ('mach_number', 'speed'): 1. / sonic_speed,
+            ('dynamic_pressure', 'altitude'): 0.5 * speed ** 2 * ddensity_dh,
+            ('dynamic_pressure', 'speed'): density * speed,
+            ('temperature', 'temperature_offset'): np.ones(h_m.shape),
+            ('density', 'temperature_offset'): ddensity_dtemperature,
+            ('sonic_speed', 'temperature_offset'): dsonic_speed_dtemperature,
+            ('dynamic_viscosity', 'temperature_offset'): dviscosity_dtemperature,
+            ('mach_number', 'temperature_offset'): -speed / sonic_speed ** 2 * dsonic_speed_dtemperature,
+            ('dynamic_pressure', 'temperature_offset'): 0.5 * speed ** 2 * ddensity_dtemperature,
+        }
+
+        for key, val in partials_dict.items():
+            partials[key] = val
+
+        if cache is not None:
+            cache.store_partials(inputs, partials_dict)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+
+    shape = (2, 3)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('altitude', np.array([[0., 5.e3, 10.8e3], [11.e3, 11.3e3, 15.e3]]))
+    comp.add_output('speed', 250. * np.random.random(shape))
+    comp.add_output('temperature_offset', 30. * np.random.random(shape) - 15.)
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = AtmosphereComp(shape=shape)
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
@@ -9,6 +9,11 @@ from lsdo_aircraft.atmosphere.pressure_comp import PressureComp
 from lsdo_aircraft.atmosphere.density_comp import DensityComp
 from lsdo_aircraft.atmosphere.sonic_speed_comp import SonicSpeedComp
 from lsdo_aircraft.atmosphere.viscosity_comp import ViscosityComp
+from lsdo_aircraft.atmosphere.atmosphere_comp import AtmosphereComp
+from lsdo_aircraft.atmosphere.tabulated_atmosphere_comp import TabulatedAtmosphereComp
+from lsdo_aircraft.atmosphere.atmosphere_table import get_atmosphere_table
+from lsdo_aircraft.atmosphere.atmosphere_cache import AtmosphereCache
+from lsdo_aircraft.atmosphere.utils import AltitudeRegimeIndex
 
 
 class AtmosphereGroup(Group):
@@ -21,10 +26,43 @@ class AtmosphereGroup(Group):
 
     def setup(self):
         shape = self.options['shape']
-
-        size = int(np.prod(shape))
-
-        group = Group()
+        options_dictionary = self.options['options_dictionary']
+
+        layered = options_dictionary['layered']
+
+        if options_dictionary['cache']:
+            if not (options_dictionary['tabulated'] or options_dictionary['fused']):
+                raise Exception('The atmosphere cache requires the fused or tabulated atmosphere')
+
+            self.cache = cache = AtmosphereCache()
+        else:
+            self.cache = cache = None
+
+        if options_dictionary['deduplicate'] is True and (
+                options_dictionary['tabulated'] or not options_dictionary['fused']):
+            raise Exception('Atmosphere deduplication requires the fused atmosphere')
+
+        if options_dictionary['tabulated']:
+            comp = TabulatedAtmosphereComp(
+                shape=shape,
+                table=get_atmosphere_table(layered, options_dictionary['table_filename']),
+                cache=cache,
+            )
+            self.add_subsystem('atmosphere_comp', comp, promotes=['*'])
+            return
+
+        self.regime_index = regime_index = AltitudeRegimeIndex()
+
+        if options_dictionary['fused']:
+            comp = AtmosphereComp(
+                shape=shape,
+                regime_index=regime_index,
+                layered=layered,
+                cache=cache,
+                deduplicate=options_dictionary['deduplicate'],
+            )
+            self.add_subsystem('atmosphere_comp', comp, promotes=['*'])
+            return
 
         comp = PowerCombinationComp(
             shape=shape,
@@ -34,10 +72,10 @@ class AtmosphereGroup(Group):
         )
         self.add_subsystem('altitude_km_comp', comp, promotes=['*'])
 
-        comp = TemperatureComp(shape=shape)
+        comp = TemperatureComp(shape=shape, regime_index=regime_index, layered=layered)
         self.add_subsystem('temperature_comp', comp, promotes=['*'])
 
-        comp = PressureComp(shape=shape)
+        comp = PressureComp(shape=shape, regime_index=regime_index, layered=layered)
         self.add_subsystem('pressure_comp', comp, promotes=['*'])
 
         comp = DensityComp(shape=shape)
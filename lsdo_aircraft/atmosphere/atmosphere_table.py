@@ -0,0 +1,203 @@
+from __future__ import division
+import os
+
+import numpy as np
+
+from lsdo_aircraft.atmosphere.constants import R, gamma, mu2, T2, Ts
+from lsdo_aircraft.atmosphere.utils import \
+    get_mask_arrays, compute_temps, compute_temp_derivs, compute_pressures, compute_pressure_derivs
+from lsdo_aircraft.atmosphere.isa_utils import \
+    get_segments, compute_isa_temps, compute_isa_temp_derivs, compute_isa_pressures, compute_isa_pressure_derivs
+
+
+def compute_analytic_properties(h_m, layered=False):
+    """
+        Evaluates the analytic atmosphere model and returns two arrays of shape (5,) + h_m.shape
+        holding the values and the altitude derivatives of, in order: temperature [K], pressure [Pa],
+        density [kg/m^3], sonic speed [m/s] and dynamic viscosity [kg/m/s].
+    """
+    if layered:
+        segments = get_segments(h_m)
+        temperature = compute_isa_temps(h_m, segments)
+        dtemperature_dh = compute_isa_temp_derivs(h_m, segments)
+        p_Pa = compute_isa_pressures(h_m, segments)
+        dp_dh = compute_isa_pressure_derivs(h_m, segments)
+    else:
+        mask_arrays = get_mask_arrays(h_m)
+        temperature = compute_temps(h_m, *mask_arrays)
+        dtemperature_dh = compute_temp_derivs(h_m, *mask_arrays)
+        p_Pa = compute_pressures(h_m, *mask_arrays)
+        dp_dh = compute_pressure_derivs(h_m, *mask_arrays)
+
+    density = p_Pa / R / temperature
+    ddensity_dh = dp_dh / R / temperature - density / temperature * dtemperature_dh
+
+    sonic_speed = np.sqrt(gamma * R * temperature)
+    dsonic_speed_dh = 0.5 * sonic_speed / temperature * dtemperature_dh
+
+    viscosity = mu2 * (temperature / T2) ** 1.5 * (T2 + Ts) / (temperature + Ts)
+    dviscosity_dh = (
+        1.5 * mu2 * temperature ** 0.5 / T2 ** 1.5 * (T2 + Ts) / (temperature + Ts)
+        - mu2 * (temperature / T2) ** 1.5 * (T2 + Ts) / (temperature + Ts) ** 2
+    ) * dtemperature_dh
+
+    values = np.array([temperature, p_Pa, density, sonic_speed, viscosity])
+    derivs = np.array([dtemperature_dh, dp_dh, ddensity_dh, dsonic_speed_dh, dviscosity_dh])
+
+    return values, derivs
+
+
+class AtmosphereTable(object):
+    """
+        Atmosphere properties tabulated on a uniform altitude grid together with their exact
+        altitude derivatives, and served by cubic Hermite interpolation. Locating a point on the
+        uniform grid is a single floor operation, so no pow, exp or sqrt is evaluated per point.
+        Altitudes outside the grid are extrapolated with the end interval.
+        layered records which model the table was built from.
+    """
+
+    names = ['temperature', 'pressure', 'density', 'sonic_speed', 'dynamic_viscosity']
+
+    def __init__(self, h_m, values, derivs, layered=False):
+        self.h_m = h_m
+        self.values = values
+        self.derivs = derivs
+        self.layered = layered
+
+        self.h_min = h_m[0]
+        self.dh = h_m[1] - h_m[0]
+
+    @staticmethod
+    def get_grid(layered=False, h_min=-2000., h_max=None, dh=50.):
+        # the two-layer model is tabulated up to 40 km, below the altitude where the
+        # troposphere power law (evaluated at every point by the mask approach) becomes invalid
+        if h_max is None:
+            h_max = 86000. if layered else 40000.
+
+        return h_min + dh * np.arange(int(round((h_max - h_min) / dh)) + 1)
+
+    @classmethod
+    def from_model(cls, layered=False, h_min=-2000., h_max=None, dh=50.):
+        h_m = cls.get_grid(layered, h_min, h_max, dh)
+        values, derivs = compute_analytic_properties(h_m, layered)
+        return cls(h_m, values, derivs, layered)
+
+    @classmethod
+    def load(cls, filename):
+        """
+            Returns the table saved in filename, or None if the file does not hold a table with
+            its model and grid, e.g., one saved before they were stored.
+        """
+        data = np.load(filename)
+        if not isinstance(data, np.lib.npyio.NpzFile) or 'layered' not in data:
+            return None
+
+        return cls(data['h_m'], data['values'], data['derivs'], bool(data['layered']))
+
+    def save(self, filename):
+        # written through a file object so that no .npz extension is appended to filename
+        with open(filename, 'wb') as f:
+            np.savez(f, h_m=self.h_m, values=self.values, derivs=self.derivs, layered=np.array(self.layered))
+
+    def _get_basis(self, h_m):
+        s = (h_m.reshape(-1) - self.h_min) / self.dh
+        ind = np.clip(np.floor(s).astype(int), 0, len(self.h_m) - 2)
+        t = s - ind
+        return ind, t
+
+    def evaluate(self, h_m):
+        """
+            Returns an array of shape (5,) + h_m.shape with the interpolated properties,
+            ordered as in AtmosphereTable.names.
+        """
+        ind, t = self._get_basis(h_m)
+        dh = self.dh
+
+        h00 = (1 + 2 * t) * (1 - t) ** 2
+        h10 = t * (1 - t) ** 2
+        h01 = t ** 2 * (3 - 2 * t)
+        h11 = t ** 2 * (t - 1)
+
+        values = (
+            h00 * self.values[:, ind] + h10 * dh * self.derivs[:, ind]
+            + h01 * self.values[:, ind + 1] + h11 * dh * self.derivs[:, ind + 1]
+        )
+        return values.reshape((len(self.names),) + h_m.shape)
+
+    def evaluate_derivs(self, h_m):
+        """
+            Returns an array of shape (5,) + h_m.shape with the altitude derivatives of the
+            interpolated properties, ordered as in AtmosphereTable.names.
+        """
+        ind, t = self._get_basis(h_m)
+        dh = self.dh
+
+        dh00 = 6 * t * (t - 1)
+        dh10 = (1 - t) * (1 - 3 * t)
+        dh01 = -dh00
+        dh11 = t * (3 * t - 2)
+
+        derivs = (
+            dh00 / dh * self.values[:, ind] + dh10 * self.derivs[:, ind]
+            + dh01 / dh * self.values[:, ind + 1] + dh11 * self.derivs[:, ind + 1]
+        )
+        return derivs.reshape((len(self.names),) + h_m.shape)
+
+    def get_accuracy_report(self, layered=False, num_points=100000):
+        """
+            Returns a dictionary with the maximum relative errors of the interpolated values and
+            derivatives with respect to the analytic model, sampled randomly over the table range.
+        """
+        h_m = self.h_m[0] + (self.h_m[-1] - self.h_m[0]) * np.random.random(num_points)
+
+        values, derivs = compute_analytic_properties(h_m, layered)
+        table_values = self.evaluate(h_m)
+        table_derivs = self.evaluate_derivs(h_m)
+
+        report = {}
+        for ind, name in enumerate(self.names):
+            report[name] = np.max(np.abs(table_values[ind] - values[ind]) / np.abs(values[ind]))
+            report['d{}_dh'.format(name)] = \
+                np.max(np.abs(table_derivs[ind] - derivs[ind])) / np.max(np.abs(derivs[ind]))
+
+        return report
+
+
+_tables = {}
+
+def get_atmosphere_table(layered=False, filename=None):
+    """
+        Returns the atmosphere table of the two-layer or the layered model, built once per process.
+        If a filename is given, the table is loaded from that file when it exists and was built for
+        the same model and grid, and is built and saved to it otherwise.
+    """
+    key = (layered, filename)
+
+    def is_valid(table):
+        h_m = AtmosphereTable.get_grid(layered)
+        return table is not None and table.layered == layered and \
+            table.h_m.shape == h_m.shape and np.all(table.h_m == h_m)
+
+    if key not in _tables:
+        table = None
+        if filename is not None and os.path.exists(filename):
+            table = AtmosphereTable.load(filename)
+
+        if not is_valid(table):
+            table = AtmosphereTable.from_model(layered)
+            if filename is not None:
+                table.save(filename)
+
+        _tables[key] = table
+
+    return _tables[key]
+
+
+if __name__ == '__main__':
+    for layered in [False, True]:
+        table = get_atmosphere_table(layered)
+        report = table.get_accuracy_report(layered)
+
+        print('layered' if layered else 'two-layer', 'table, {} nodes, max. relative errors:'.format(len(table.h_m)))
+        for name in sorted(report):
+            print('    {:<30} {:.3e}'.format(name, report[name]))
@@ -35,4 +35,10 @@ g = 9.81
 gamma = 1.4
 
 # Viscosity of air at T2 [kg/m/s]
-mu2 = 1.716e-5
\ No newline at end of file
+mu2 = 1.716e-5
+
+# ISA layer base altitudes; the highest layer extends to 86 km [m]
+layer_base_altitudes = [0., 11000., 20000., 32000., 47000., 51000., 71000.]
+
+# ISA layer lapse rates - rate of temperature decrease vs altitude [K/m]
+layer_lapse_rates = [6.5e-3, 0., -1.0e-3, -2.8e-3, 0., 2.8e-3, 2.0e-3]
@@ -0,0 +1,180 @@
+from __future__ import division
+import numpy as np
+
+from lsdo_aircraft.atmosphere.constants import h_trans
+from lsdo_aircraft.atmosphere.constants import T0, T1, T2, Ts, L, R
+from lsdo_aircraft.atmosphere.constants import p0, p1, g, gamma, mu2
+from lsdo_aircraft.atmosphere.utils import h_lower, h_upper, g_L_R, pressure_coeffs, temp_coeffs
+
+
+class AtmosphereArrays(object):
+    """
+        Struct-of-arrays holding the atmosphere properties of a flat array of num_points altitudes,
+        under the same names as the outputs of AtmosphereComp, together with the work buffers used
+        by evaluate_atmosphere. Allocate it once and pass it as out= to evaluate every chunk of
+        at most num_points points without allocating new arrays.
+    """
+
+    names = [
+        'temperature',
+        'pressure_MPa',
+        'density',
+        'sonic_speed',
+        'dynamic_viscosity',
+        'mach_number',
+        'dynamic_pressure',
+    ]
+
+    def __init__(self, num_points):
+        self.num_points = num_points
+
+        for name in self.names:
+            setattr(self, name, np.empty(num_points))
+
+        self.p_Pa = np.empty(num_points)
+        self.tmp1 = np.empty(num_points)
+        self.tmp2 = np.empty(num_points)
+        self.tropos_mask = np.empty(num_points, dtype=bool)
+        self.strato_mask = np.empty(num_points, dtype=bool)
+        self.smooth_mask = np.empty(num_points, dtype=bool)
+
+    buffer_names = ['p_Pa', 'tmp1', 'tmp2', 'tropos_mask', 'strato_mask', 'smooth_mask']
+
+    def get_dict(self):
+        return {name: getattr(self, name) for name in self.names}
+
+    def get_views(self, num_points):
+        """
+            Returns an AtmosphereArrays whose arrays are views of the first num_points points of these.
+        """
+        views = AtmosphereArrays.__new__(AtmosphereArrays)
+        views.num_points = num_points
+
+        for name in self.names + self.buffer_names:
+            setattr(views, name, getattr(self, name)[:num_points])
+
+        return views
+
+
+def _compute_cubic(coeffs, h_m, out, tmp):
+    # a * h ** 3 + b * h ** 2 + c * h + d, in the same order of operations as utils.py
+    a, b, c, d = coeffs
+
+    np.power(h_m, 3, out=out)
+    np.multiply(out, a, out=out)
+    np.square(h_m, out=tmp)
+    np.multiply(tmp, b, out=tmp)
+    np.add(out, tmp, out=out)
+    np.multiply(h_m, c, out=tmp)
+    np.add(out, tmp, out=out)
+    np.add(out, d, out=out)
+
+def evaluate_atmosphere(h_m, speed=None, temperature_offset=None, out=None):
+    """
+        Evaluates the two-layer atmosphere model of AtmosphereComp outside of OpenMDAO.
+        h_m is an array of altitudes [m] and speed an optional array of speeds [m/s] of the same
+        size; mach_number and dynamic_pressure are only computed when speed is given.
+        temperature_offset [K] is an optional scalar or array shifting the standard-day temperature.
+        The results are written to out (an AtmosphereArrays of at least h_m.size points) when it is given,
+        so evaluating repeatedly into the same out allocates no arrays, including for a final shorter chunk.
+        Returns out, or views of its first h_m.size points if it is larger.
+    """
+    h_m = np.asarray(h_m, dtype=float).reshape(-1)
+
+    if out is None:
+        out = AtmosphereArrays(h_m.size)
+    elif out.num_points < h_m.size:
+        raise Exception('out holds {} points but h_m has {}'.format(out.num_points, h_m.size))
+    elif out.num_points > h_m.size:
+        out = out.get_views(h_m.size)
+
+    tmp1 = out.tmp1
+    tmp2 = out.tmp2
+    tropos_mask = out.tropos_mask
+    strato_mask = out.strato_mask
+    smooth_mask = out.smooth_mask
+
+    np.less_equal(h_m, h_lower, out=tropos_mask)
+    np.greater(h_m, h_upper, out=strato_mask)
+    np.logical_or(tropos_mask, strato_mask, out=smooth_mask)
+    np.logical_not(smooth_mask, out=smooth_mask)
+
+    # each regime formula is evaluated on all points, but only copied where it applies,
+    # so the troposphere power law at high altitude does not leak into the results
+    with np.errstate(invalid='ignore'):
+        # temperature
+        temperature = out.temperature
+        np.multiply(h_m, L, out=tmp1)
+        np.subtract(T0, tmp1, out=tmp1)
+        np.copyto(temperature, tmp1, where=tropos_mask)
+        np.copyto(temperature, T1, where=strato_mask)
+        _compute_cubic(temp_coeffs, h_m, tmp1, tmp2)
+        np.copyto(temperature, tmp1, where=smooth_mask)
+
+        if temperature_offset is not None:
+            np.add(temperature, np.reshape(temperature_offset, -1), out=temperature)
+
+        # pressure
+        p_Pa = out.p_Pa
+        np.multiply(h_m, L, out=tmp1)
+        np.divide(tmp1, T0, out=tmp1)
+        np.subtract(1, tmp1, out=tmp1)
+        np.power(tmp1, g_L_R, out=tmp1)
+        np.multiply(tmp1, p0, out=tmp1)
+        np.copyto(p_Pa, tmp1, where=tropos_mask)
+        np.subtract(h_m, h_trans, out=tmp1)
+        np.multiply(tmp1, -g, out=tmp1)
+        np.divide(tmp1, R * T1, out=tmp1)
+        np.exp(tmp1, out=tmp1)
+        np.multiply(tmp1, p1, out=tmp1)
+        np.copyto(p_Pa, tmp1, where=strato_mask)
+        _compute_cubic(pressure_coeffs, h_m, tmp1, tmp2)
+        np.copyto(p_Pa, tmp1, where=smooth_mask)
+
+    np.divide(p_Pa, 1e6, out=out.pressure_MPa)
+
+    # density
+    np.divide(p_Pa, R, out=out.density)
+    np.divide(out.density, temperature, out=out.density)
+
+    # sonic speed
+    np.multiply(temperature, gamma * R, out=out.sonic_speed)
+    np.sqrt(out.sonic_speed, out=out.sonic_speed)
+
+    # dynamic viscosity
+    viscosity = out.dynamic_viscosity
+    np.divide(temperature, T2, out=viscosity)
+    np.power(viscosity, 1.5, out=viscosity)
+    np.multiply(viscosity, mu2, out=viscosity)
+    np.multiply(viscosity, T2 + Ts, out=viscosity)
+    np.add(temperature, Ts, out=tmp1)
+    np.divide(viscosity, tmp1, out=viscosity)
+
+    if speed is not None:
+        speed = np.asarray(speed, dtype=float).reshape(-1)
+
+        np.divide(speed, out.sonic_speed, out=out.mach_number)
+
+        np.square(speed, out=tmp1)
+        np.multiply(out.density, 0.5, out=out.dynamic_pressure)
+        np.multiply(out.dynamic_pressure, tmp1, out=out.dynamic_pressure)
+
+    return out
+
+
+if __name__ == '__main__':
+    import time
+
+
+    # process a long record in chunks, reusing the same buffers for every chunk
+    num_points = int(1e7) + 12345
+    chunk_size = int(1e6)
+
+    h_m = 15000. * np.random.random(num_points)
+    speed = 250. * np.random.random(num_points)
+    out = AtmosphereArrays(chunk_size)
+
+    start = time.time()
+    for ind in range(0, num_points, chunk_size):
+        evaluate_atmosphere(h_m[ind:ind + chunk_size], speed[ind:ind + chunk_size], out=out)
+    print('{:.0e} points in chunks of {:.0e}: {:.3f} s'.format(num_points, chunk_size, time.time() - start))
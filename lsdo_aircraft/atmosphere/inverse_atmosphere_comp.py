@@ -0,0 +1,188 @@
+from __future__ import print_function
+import numpy as np
+
+from openmdao.api import ImplicitComponent
+
+from lsdo_aircraft.atmosphere.constants import epsilon, h_trans
+from lsdo_aircraft.atmosphere.isa_utils import breakpoints as isa_breakpoints
+from lsdo_aircraft.atmosphere.atmosphere_table import compute_analytic_properties
+
+
+# index in the arrays returned by compute_analytic_properties, and scaling to the input units
+property_indices = dict(temperature=0, pressure_MPa=1, density=2)
+property_scalings = dict(temperature=1., pressure_MPa=1.e-6, density=1.)
+
+class InverseAtmosphereComp(ImplicitComponent):
+    """
+        This component solves for the altitude at which the standard atmosphere has a given pressure
+        (pressure altitude), density (density altitude) or temperature. The options are 'shape', 'in_name'
+        (the property to invert), 'out_name', 'layered' (the model of Atmosphere['layered']), 'num_iter' and
+        'tol' (maximum number of Newton iterations and relative residual tolerance).
+        Each point is first bracketed between the layer boundaries of the model, then solved by Newton's
+        method with bisection whenever a step leaves the bracket. Temperature is only inverted in the
+        troposphere, where it is monotonic; other values are clipped to the bracket ends.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+        self.options.declare('in_name', default='pressure_MPa', values=['pressure_MPa', 'density', 'temperature'])
+        self.options.declare('out_name', default='altitude', types=str)
+        self.options.declare('layered', default=False, types=bool)
+        self.options.declare('h_min', default=-2000., types=float)
+        self.options.declare('num_iter', default=50, types=int)
+        self.options.declare('tol', default=1.e-12, types=float)
+
+    def setup(self):
+        shape = self.options['shape']
+        in_name = self.options['in_name']
+        out_name = self.options['out_name']
+        layered = self.options['layered']
+        h_min = self.options['h_min']
+
+        self.add_input(in_name, shape=shape)
+        self.add_output(out_name, shape=shape)
+
+        arange = np.arange(np.prod(shape))
+
+        self.declare_partials(out_name, '*', rows=arange, cols=arange)
+
+        # bracketing altitudes: the smoothing breakpoints, between which each property is monotonic
+        if in_name == 'temperature':
+            bracket_h_m = [h_min, h_trans - epsilon]
+        elif layered:
+            bracket_h_m = [h_min] + list(isa_breakpoints) + [86000.]
+        else:
+            bracket_h_m = [h_min, h_trans - epsilon, h_trans + epsilon, 40000.]
+
+        self.bracket_h_m = np.array(bracket_h_m)
+        self.bracket_values, _ = self.get_props(self.bracket_h_m)
+
+    def get_props(self, h_m):
+        in_name = self.options['in_name']
+
+        values, derivs = compute_analytic_properties(h_m, self.options['layered'])
+
+        scaling = property_scalings[in_name]
+        return scaling * values[property_indices[in_name]], scaling * derivs[property_indices[in_name]]
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        in_name = self.options['in_name']
+        out_name = self.options['out_name']
+
+        values, _ = self.get_props(outputs[out_name])
+
+        residuals[out_name] = values - inputs[in_name]
+
+    def solve_nonlinear(self, inputs, outputs):
+        in_name = self.options['in_name']
+        out_name = self.options['out_name']
+        num_iter = self.options['num_iter']
+        tol = self.options['tol']
+
+        target = inputs[in_name]
+
+        # all properties decrease with altitude on the bracketing range
+        bracket_ind = np.searchsorted(-self.bracket_values, -target)
+        bracket_ind = np.clip(bracket_ind, 1, len(self.bracket_h_m) - 1)
+        xl = self.bracket_h_m[bracket_ind - 1]
+        xu = self.bracket_h_m[bracket_ind]
+
+        x = 0.5 * xl + 0.5 * xu
+
+        for ind in range(num_iter):
+            values, derivs = self.get_props(x)
+            r = values - target
+
+            if np.max(np.abs(r) / np.abs(target)) < tol:
+                break
+
+            mask_l = r > 0
+            mask_u = r <= 0
+            xl[mask_l] = x[mask_l]
+            xu[mask_u] = x[mask_u]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x = x - r / derivs
+
+            mask_bisect = ~((x > xl) & (x < xu))
+            x[mask_bisect] = 0.5 * xl[mask_bisect] + 0.5 * xu[mask_bisect]
+
+        outputs[out_name] = x
+
+    def linearize(self, inputs, outputs, partials):
+        in_name = self.options['in_name']
+        out_name = self.options['out_name']
+
+        _, derivs = self.get_props(outputs[out_name].flatten())
+
+        partials[out_name, in_name] = -1.
+        partials[out_name, out_name] = derivs
+
+        self.jac = derivs.reshape(self.options['shape'])
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        out_name = self.options['out_name']
+
+        if mode == 'fwd':
+            d_outputs[out_name] += 1. / self.jac * d_residuals[out_name]
+        else:
+            d_residuals[out_name] += 1. / self.jac * d_outputs[out_name]
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.atmosphere.atmosphere_comp import AtmosphereComp
+
+
+    shape = (1000,)
+
+    for layered in [False, True]:
+        h_max = 80000. if layered else 39000.
+
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('altitude', -1000. + (h_max + 1000.) * np.random.random(shape))
+        comp.add_output('speed', np.zeros(shape))
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = AtmosphereComp(shape=shape, layered=layered)
+        prob.model.add_subsystem('atmosphere_comp', comp, promotes=['*'])
+
+        for in_name in ['pressure_MPa', 'density', 'temperature']:
+            comp = InverseAtmosphereComp(
+                shape=shape,
+                in_name=in_name,
+                out_name='{}_altitude'.format(in_name),
+                layered=layered,
+            )
+            prob.model.add_subsystem('{}_altitude_comp'.format(in_name), comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.run_model()
+
+        tropos_mask = prob['altitude'] < h_trans - epsilon
+        print('layered' if layered else 'two-layer', 'max. altitude errors [m]:')
+        print('    pressure altitude', np.max(np.abs(prob['pressure_MPa_altitude'] - prob['altitude'])))
+        print('    density altitude', np.max(np.abs(prob['density_altitude'] - prob['altitude'])))
+        print('    temperature altitude (troposphere)', np.max(np.abs(
+            prob['temperature_altitude'] - prob['altitude'])[tropos_mask]))
+
+    shape = (2, 3)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('pressure_MPa', np.array([[0.1, 0.08, 0.05], [0.03, 0.02, 0.01]]))
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = InverseAtmosphereComp(shape=shape)
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
+
+    # the linear solve goes through solve_linear, which check_partials does not call
+    prob.check_totals(of=['altitude'], wrt=['pressure_MPa'], compact_print=True, step_calc='rel')
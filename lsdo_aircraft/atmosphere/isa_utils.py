@@ -0,0 +1,201 @@
+from __future__ import division
+import numpy as np
+
+from lsdo_aircraft.atmosphere.constants import epsilon
+from lsdo_aircraft.atmosphere.constants import T0, T1, R
+from lsdo_aircraft.atmosphere.constants import p0, p1, g
+from lsdo_aircraft.atmosphere.constants import layer_base_altitudes, layer_lapse_rates
+
+
+# Multi-layer ISA up to 86 km. Each layer is either a constant lapse rate (power law pressure)
+# or isothermal (exponential pressure). The layer boundaries are bridged by the same C1 cubic
+# smoothing of half-width epsilon as the two-layer model in utils.py, so for altitudes below
+# 20 km the results match compute_temps and compute_pressures.
+#
+# Points are assigned to segments with a sorted lookup on the smoothing breakpoints:
+# even segment 2 * k is the interior of layer k, odd segment 2 * k + 1 is the smoothing
+# region between layers k and k + 1. get_segments returns the flat indices of the points in
+# each occupied segment, and only the formula of each point's own segment is evaluated.
+
+num_layers = len(layer_base_altitudes)
+
+layer_h = np.array(layer_base_altitudes, dtype=float)
+layer_L = np.array(layer_lapse_rates, dtype=float)
+
+# base temperatures and pressures; the first two layers use the constants of the two-layer model
+layer_T = np.zeros(num_layers)
+layer_p = np.zeros(num_layers)
+layer_T[:2] = T0, T1
+layer_p[:2] = p0, p1
+
+
+def _compute_layer_temp(k, h_m):
+    return layer_T[k] - layer_L[k] * (h_m - layer_h[k])
+
+def _compute_layer_pressure(k, h_m):
+    if layer_L[k] == 0.:
+        return layer_p[k] * np.exp(-g * (h_m - layer_h[k]) / (R * layer_T[k]))
+    else:
+        return layer_p[k] * (_compute_layer_temp(k, h_m) / layer_T[k]) ** (g / (layer_L[k] * R))
+
+
+for k in range(2, num_layers):
+    layer_T[k] = _compute_layer_temp(k - 1, layer_h[k])
+    layer_p[k] = _compute_layer_pressure(k - 1, layer_h[k])
+
+# smoothing cubics in the local coordinate x = h - h_boundary, one row per boundary
+breakpoints = np.empty(2 * (num_layers - 1))
+breakpoints[0::2] = layer_h[1:] - epsilon
+breakpoints[1::2] = layer_h[1:] + epsilon
+
+smoothing_matrix = np.array([
+    [-epsilon ** 3, epsilon ** 2, -epsilon, 1],
+    [epsilon ** 3, epsilon ** 2, epsilon, 1],
+    [3 * epsilon ** 2, -2 * epsilon, 1, 0],
+    [3 * epsilon ** 2, 2 * epsilon, 1, 0],
+])
+
+temp_smoothing_coeffs = np.zeros((num_layers - 1, 4))
+pressure_smoothing_coeffs = np.zeros((num_layers - 1, 4))
+for k in range(num_layers - 1):
+    h_lower = layer_h[k + 1] - epsilon
+    h_upper = layer_h[k + 1] + epsilon
+
+    T_lower = _compute_layer_temp(k, h_lower)
+    T_upper = _compute_layer_temp(k + 1, h_upper)
+    p_lower = _compute_layer_pressure(k, h_lower)
+    p_upper = _compute_layer_pressure(k + 1, h_upper)
+
+    temp_smoothing_coeffs[k] = np.linalg.solve(smoothing_matrix, np.array([
+        T_lower,
+        T_upper,
+        -layer_L[k],
+        -layer_L[k + 1],
+    ]))
+    pressure_smoothing_coeffs[k] = np.linalg.solve(smoothing_matrix, np.array([
+        p_lower,
+        p_upper,
+        -g * p_lower / (R * T_lower),
+        -g * p_upper / (R * T_upper),
+    ]))
+
+# functions
+def get_segments(h_m):
+    segment_indices = np.searchsorted(breakpoints, h_m.reshape(-1))
+    counts = np.bincount(segment_indices, minlength=2 * num_layers - 1)
+    return [
+        (segment, np.flatnonzero(segment_indices == segment))
+        for segment in np.flatnonzero(counts)
+    ]
+
+def compute_isa_temps(h_m, segments):
+    h_flat = h_m.reshape(-1)
+    temp_K = np.empty(h_flat.shape, dtype=h_m.dtype)
+
+    for segment, indices in segments:
+        h_sub = h_flat[indices]
+        k = segment // 2
+
+        if segment % 2 == 0:
+            temp_K[indices] = _compute_layer_temp(k, h_sub)
+        else:
+            a, b, c, d = temp_smoothing_coeffs[k]
+            x = h_sub - layer_h[k + 1]
+            temp_K[indices] = ((a * x + b) * x + c) * x + d
+
+    return temp_K.reshape(h_m.shape)
+
+def compute_isa_temp_derivs(h_m, segments):
+    h_flat = h_m.reshape(-1)
+    derivs = np.empty(h_flat.shape, dtype=h_m.dtype)
+
+    for segment, indices in segments:
+        h_sub = h_flat[indices]
+        k = segment // 2
+
+        if segment % 2 == 0:
+            derivs[indices] = -layer_L[k]
+        else:
+            a, b, c, _ = temp_smoothing_coeffs[k]
+            x = h_sub - layer_h[k + 1]
+            derivs[indices] = (3 * a * x + 2 * b) * x + c
+
+    return derivs.reshape(h_m.shape)
+
+def compute_isa_pressures(h_m, segments):
+    h_flat = h_m.reshape(-1)
+    p_Pa = np.empty(h_flat.shape, dtype=h_m.dtype)
+
+    for segment, indices in segments:
+        h_sub = h_flat[indices]
+        k = segment // 2
+
+        if segment % 2 == 0:
+            p_Pa[indices] = _compute_layer_pressure(k, h_sub)
+        else:
+            a, b, c, d = pressure_smoothing_coeffs[k]
+            x = h_sub - layer_h[k + 1]
+            p_Pa[indices] = ((a * x + b) * x + c) * x + d
+
+    return p_Pa.reshape(h_m.shape)
+
+def compute_isa_pressure_derivs(h_m, segments):
+    h_flat = h_m.reshape(-1)
+    derivs = np.empty(h_flat.shape, dtype=h_m.dtype)
+
+    for segment, indices in segments:
+        h_sub = h_flat[indices]
+        k = segment // 2
+
+        if segment % 2 == 0:
+            derivs[indices] = -g * _compute_layer_pressure(k, h_sub) / (R * _compute_layer_temp(k, h_sub))
+        else:
+            a, b, c, _ = pressure_smoothing_coeffs[k]
+            x = h_sub - layer_h[k + 1]
+            derivs[indices] = (3 * a * x + 2 * b) * x + c
+
+    return derivs.reshape(h_m.shape)
+
+
+if __name__ == '__main__':
+    import time
+
+    from lsdo_aircraft.atmosphere.utils import \
+        get_mask_arrays, compute_temps, compute_pressures, compute_temp_derivs, compute_pressure_derivs
+
+
+    # check against the two-layer model below 20 km
+    h_m = np.linspace(0., 20000. - epsilon, 100001)
+    segments = get_segments(h_m)
+    mask_arrays = get_mask_arrays(h_m)
+    print('max rel. temperature error', np.max(np.abs(
+        compute_isa_temps(h_m, segments) / compute_temps(h_m, *mask_arrays) - 1)))
+    print('max rel. pressure error', np.max(np.abs(
+        compute_isa_pressures(h_m, segments) / compute_pressures(h_m, *mask_arrays) - 1)))
+    print('max abs. temperature deriv error', np.max(np.abs(
+        compute_isa_temp_derivs(h_m, segments) - compute_temp_derivs(h_m, *mask_arrays))))
+    print('max rel. pressure deriv error', np.max(np.abs(
+        compute_isa_pressure_derivs(h_m, segments) / compute_pressure_derivs(h_m, *mask_arrays) - 1)))
+
+    # benchmark against the mask approach on the altitude range both support
+    for num_points in [int(1e6), int(1e7)]:
+        h_m = 20000. * np.random.random(num_points)
+
+        start = time.time()
+        mask_arrays = get_mask_arrays(h_m)
+        compute_temps(h_m, *mask_arrays)
+        compute_pressures(h_m, *mask_arrays)
+        compute_temp_derivs(h_m, *mask_arrays)
+        compute_pressure_derivs(h_m, *mask_arrays)
+        time_mask = time.time() - start
+
+        start = time.time()
+        segments = get_segments(h_m)
+        compute_isa_temps(h_m, segments)
+        compute_isa_pressures(h_m, segments)
+        compute_isa_temp_derivs(h_m, segments)
+        compute_isa_pressure_derivs(h_m, segments)
+        time_layer = time.time() - start
+
+        print('{:.0e} points: masks {:.3f} s, sorted layer lookup {:.3f} s'.format(
+            num_points, time_mask, time_layer))
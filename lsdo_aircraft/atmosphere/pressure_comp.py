@@ -4,27 +4,42 @@ import numpy as np
 from lsdo_utils.api import ArrayExplicitComponent
 
 from lsdo_aircraft.atmosphere.utils import \
-    get_mask_arrays, compute_pressures, compute_pressure_derivs
+    AltitudeRegimeIndex, compute_pressures, compute_pressure_derivs
+from lsdo_aircraft.atmosphere.isa_utils import compute_isa_pressures, compute_isa_pressure_derivs
 
 
 class PressureComp(ArrayExplicitComponent):
 
+    def array_initialize(self):
+        self.options.declare('regime_index', default=None, types=AltitudeRegimeIndex, allow_none=True)
+        self.options.declare('layered', default=False, types=bool)
+
     def array_setup(self):
+        if self.options['regime_index'] is None:
+            self.options['regime_index'] = AltitudeRegimeIndex()
+
         self.array_add_input('altitude_km')
         self.array_add_output('pressure_MPa')
         self.array_declare_partials('pressure_MPa', 'altitude_km')
 
     def compute(self, inputs, outputs):
         h_m = inputs['altitude_km'] * 1e3
+        regime_index = self.options['regime_index']
 
-        self.mask_arrays = get_mask_arrays(h_m)
-
-        p_Pa = compute_pressures(h_m, *self.mask_arrays)
+        if self.options['layered']:
+            p_Pa = compute_isa_pressures(h_m, regime_index.get_segments(h_m))
+        else:
+            p_Pa = compute_pressures(h_m, *regime_index.get_mask_arrays(h_m))
 
         outputs['pressure_MPa'] = p_Pa / 1e6
 
     def compute_partials(self, inputs, partials):
         h_m = inputs['altitude_km'] * 1e3
-        derivs = compute_pressure_derivs(h_m, *self.mask_arrays).flatten()
+        regime_index = self.options['regime_index']
+
+        if self.options['layered']:
+            derivs = compute_isa_pressure_derivs(h_m, regime_index.get_segments(h_m)).flatten()
+        else:
+            derivs = compute_pressure_derivs(h_m, *regime_index.get_mask_arrays(h_m)).flatten()
 
         partials['pressure_MPa', 'altitude_km'] = derivs * 1e3 / 1e6
\ No newline at end of file
@@ -0,0 +1,183 @@
+from __future__ import print_function
+import numpy as np
+
+from lsdo_utils.api import ArrayExplicitComponent
+
+from lsdo_aircraft.atmosphere.atmosphere_cache import AtmosphereCache
+from lsdo_aircraft.atmosphere.constants import Ts
+from lsdo_aircraft.atmosphere.atmosphere_table import AtmosphereTable, get_atmosphere_table
+
+
+class TabulatedAtmosphereComp(ArrayExplicitComponent):
+    """
+        Table-driven drop-in replacement for AtmosphereComp: temperature, pressure, density,
+        sonic speed and viscosity, and their altitude derivatives, are interpolated from an
+        AtmosphereTable by cubic Hermite interpolation instead of evaluating the analytic model.
+        The temperature_offset input shifts the tabulated standard-day temperature, and the density,
+        sonic speed and viscosity are scaled by the resulting temperature ratio at standard pressure.
+    """
+
+    def array_initialize(self):
+        self.options.declare('table', default=None, types=AtmosphereTable, allow_none=True)
+
+        self.options.declare('cache', default=None, types=AtmosphereCache, allow_none=True)
+
+    def array_setup(self):
+        if self.options['table'] is None:
+            self.options['table'] = get_atmosphere_table()
+
+        self.array_add_input('altitude')
+        self.array_add_input('speed')
+        self.array_add_input('temperature_offset', val=0.)
+        self.array_add_output('temperature')
+        self.array_add_output('pressure_MPa')
+        self.array_add_output('density')
+        self.array_add_output('sonic_speed')
+        self.array_add_output('dynamic_viscosity')
+        self.array_add_output('mach_number')
+        self.array_add_output('dynamic_pressure')
+
+        for out_name in [
+            'temperature',
+            'pressure_MPa',
+            'density',
+            'sonic_speed',
+            'dynamic_viscosity',
+            'mach_number',
+            'dynamic_pressure',
+        ]:
+            self.array_declare_partials(out_name, 'altitude')
+        self.array_declare_partials('mach_number', 'speed')
+        self.array_declare_partials('dynamic_pressure', 'speed')
+
+        for out_name in [
+            'temperature',
+            'density',
+            'sonic_speed',
+            'dynamic_viscosity',
+            'mach_number',
+            'dynamic_pressure',
+        ]:
+            self.array_declare_partials(out_name, 'temperature_offset')
+
+    def compute(self, inputs, outputs):
+        cache = self.options['cache']
+        if cache is not None and cache.load_outputs(inputs, outputs):
+            return
+
+        h_m = inputs['altitude']
+        speed = inputs['speed']
+
+        std_temperature, p_Pa, std_density, std_sonic_speed, std_viscosity = self.options['table'].evaluate(h_m)
+
+        temperature = std_temperature + inputs['temperature_offset']
+        temperature_ratio = temperature / std_temperature
+        sqrt_temperature_ratio = np.sqrt(temperature_ratio)
+
+        density = std_density / temperature_ratio
+        sonic_speed = std_sonic_speed * sqrt_temperature_ratio
+        viscosity = std_viscosity * temperature_ratio * sqrt_temperature_ratio \
+            * (std_temperature + Ts) / (temperature + Ts)
+
+        outputs_dict = {
+            'temperature': temperature,
+            'pressure_MPa': p_Pa / 1e6,
+            'density': density,
+            'sonic_speed': sonic_speed,
+            'dynamic_viscosity': viscosity,
+            'mach_number': speed / sonic_speed,
+            'dynamic_pressure': 0.5 * density * speed ** 2,
+        }
+
+        for out_name, val in outputs_dict.items():
+            outputs[out_name] = val
+
+        if cache is not None:
+            cache.store_outputs(inputs, outputs_dict)
+
+    def compute_partials(self, inputs, partials):
+        cache = self.options['cache']
+        if cache is not None and cache.load_partials(inputs, partials):
+            return
+
+        h_m = inputs['altitude'].flatten()
+        speed = inputs['speed'].flatten()
+
+        table = self.options['table']
+        std_temperature, _, std_density, std_sonic_speed, std_viscosity = table.evaluate(h_m)
+        dtemperature_dh, dp_dh, dstd_density_dh, dstd_sonic_speed_dh, dstd_viscosity_dh = table.evaluate_derivs(h_m)
+
+        temperature = std_temperature + inputs['temperature_offset'].flatten()
+        temperature_ratio = temperature / std_temperature
+        sqrt_temperature_ratio = np.sqrt(temperature_ratio)
+
+        # derivatives of the temperature ratio w.r.t. the offset and w.r.t. altitude at constant offset
+        dratio_doffset = 1. / std_temperature
+        dratio_dh = dtemperature_dh / std_temperature * (1. - temperature_ratio)
+
+        density = std_density / temperature_ratio
+        ddensity_dratio = -density / temperature_ratio
+        ddensity_doffset = ddensity_dratio * dratio_doffset
+        ddensity_dh = dstd_density_dh / temperature_ratio + ddensity_dratio * dratio_dh
+
+        sonic_speed = std_sonic_speed * sqrt_temperature_ratio
+        dsonic_speed_dratio = 0.5 * sonic_speed / temperature_ratio
+        dsonic_speed_doffset = dsonic_speed_dratio * dratio_doffset
+        dsonic_speed_dh = dstd_sonic_speed_dh * sqrt_temperature_ratio + dsonic_speed_dratio * dratio_dh
+
+        # viscosity = std_viscosity * f(temperature) / f(std_temperature), with f(T) = T ** 1.5 / (T + Ts)
+        viscosity = std_viscosity * temperature_ratio * sqrt_temperature_ratio \
+            * (std_temperature + Ts) / (temperature + Ts)
+        dlogf_dtemperature = 1.5 / temperature - 1. / (temperature + Ts)
+        dlogf_dstd_temperature = 1.5 / std_temperature - 1. / (std_temperature + Ts)
+        dviscosity_doffset = viscosity * dlogf_dtemperature
+        dviscosity_dh = (
+            dstd_viscosity_dh * viscosity / std_viscosity
+            + viscosity * (dlogf_dtemperature - dlogf_dstd_temperature) * dtemperature_dh
+        )
+
+        partials_dict = {
+            ('temperature', 'altitude'): dtemperature_dh,
+            ('pressure_MPa', 'altitude'): dp_dh / 1e6,
+            ('density', 'altitude'): ddensity_dh,
+            ('sonic_speed', 'altitude'): dsonic_speed_dh,
+            ('dynamic_viscosity', 'altitude'): dviscosity_dh,
+            ('mach_number', 'altitude'): -speed / sonic_speed ** 2 * dsonic_speed_dh,
+            ('mach_number', 'speed'): 1. / sonic_speed,
+            ('dynamic_pressure', 'altitude'): 0.5 * speed ** 2 * ddensity_dh,
+            ('dynamic_pressure', 'speed'): density * speed,
+            ('temperature', 'temperature_offset'): np.ones(h_m.shape),
+            ('density', 'temperature_offset'): ddensity_doffset,
+            ('sonic_speed', 'temperature_offset'): dsonic_speed_doffset,
+            ('dynamic_viscosity', 'temperature_offset'): dviscosity_doffset,
+            ('mach_number', 'temperature_offset'): -speed / sonic_speed ** 2 * dsonic_speed_doffset,
+            ('dynamic_pressure', 'temperature_offset'): 0.5 * speed ** 2 * ddensity_doffset,
+        }
+
+        for key, val in partials_dict.items():
+            partials[key] = val
+
+        if cache is not None:
+            cache.store_partials(inputs, partials_dict)
+
+
+if __name__ == '__main__':
+    from openmdao.api import Problem, IndepVarComp
+
+
+    shape = (2, 3)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('altitude', np.array([[0., 5.e3, 10.8e3], [11.e3, 11.3e3, 15.e3]]))
+    comp.add_output('speed', 250. * np.random.random(shape))
+    comp.add_output('temperature_offset', 30. * np.random.random(shape) - 15.)
+    prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+    comp = TabulatedAtmosphereComp(shape=shape)
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+    prob.setup(check=True)
+    prob.run_model()
+    prob.check_partials(compact_print=True)
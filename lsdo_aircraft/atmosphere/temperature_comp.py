@@ -4,27 +4,45 @@ import numpy as np
 from lsdo_utils.api import ArrayExplicitComponent
 
 from lsdo_aircraft.atmosphere.utils import \
-    get_mask_arrays, compute_temps, compute_temp_derivs
+    AltitudeRegimeIndex, compute_temps, compute_temp_derivs
+from lsdo_aircraft.atmosphere.isa_utils import compute_isa_temps, compute_isa_temp_derivs
 
 
 class TemperatureComp(ArrayExplicitComponent):
 
+    def array_initialize(self):
+        self.options.declare('regime_index', default=None, types=AltitudeRegimeIndex, allow_none=True)
+        self.options.declare('layered', default=False, types=bool)
+
     def array_setup(self):
+        if self.options['regime_index'] is None:
+            self.options['regime_index'] = AltitudeRegimeIndex()
+
         self.array_add_input('altitude_km')
+        self.array_add_input('temperature_offset', val=0.)
         self.array_add_output('temperature')
         self.array_declare_partials('temperature', 'altitude_km')
+        self.array_declare_partials('temperature', 'temperature_offset')
 
     def compute(self, inputs, outputs):
         h_m = inputs['altitude_km'] * 1e3
+        regime_index = self.options['regime_index']
 
-        self.mask_arrays = get_mask_arrays(h_m)
+        if self.options['layered']:
+            temp_K = compute_isa_temps(h_m, regime_index.get_segments(h_m))
+        else:
+            temp_K = compute_temps(h_m, *regime_index.get_mask_arrays(h_m))
 
-        temp_K = compute_temps(h_m, *self.mask_arrays)
-
-        outputs['temperature'] = temp_K
+        outputs['temperature'] = temp_K + inputs['temperature_offset']
 
     def compute_partials(self, inputs, partials):
         h_m = inputs['altitude_km'] * 1e3
-        derivs = compute_temp_derivs(h_m, *self.mask_arrays).flatten()
+        regime_index = self.options['regime_index']
+
+        if self.options['layered']:
+            derivs = compute_isa_temp_derivs(h_m, regime_index.get_segments(h_m)).flatten()
+        else:
+            derivs = compute_temp_derivs(h_m, *regime_index.get_mask_arrays(h_m)).flatten()
 
-        partials['temperature', 'altitude_km'] = derivs * 1e3
\ No newline at end of file
+        partials['temperature', 'altitude_km'] = derivs * 1e3
+        partials['temperature', 'temperature_offset'] = 1.
\ No newline at end of file
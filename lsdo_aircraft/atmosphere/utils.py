@@ -4,6 +4,7 @@ import numpy as np
 from lsdo_aircraft.atmosphere.constants import epsilon, h_trans
 from lsdo_aircraft.atmosphere.constants import T0, T1, L, R
 from lsdo_aircraft.atmosphere.constants import p0, p1, g, gamma
+from lsdo_aircraft.atmosphere.isa_utils import get_segments
 
 
 g_L_R = g / L / R
@@ -44,6 +45,57 @@ def get_mask_arrays(h_m):
     smooth_mask = np.logical_and(~tropos_mask, ~strato_mask)
     return tropos_mask, strato_mask, smooth_mask
 
+class AltitudeRegimeIndex(object):
+    """
+        Shared cache of the altitude regimes, keyed to the altitude vector they were built from:
+        the tropopause masks of the two-layer model, the layer segments of the multi-layer
+        model in isa_utils.py, and the unique altitudes with the indices that scatter them back.
+        They are rebuilt (and the version incremented) only when the altitude values change,
+        so every component reading from the same index shares one lookup, and partials always
+        use the regimes of the point at which they are evaluated.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.h_m = None
+        self.mask_arrays = None
+        self.segments = None
+        self.unique = None
+
+    def _update(self, h_m):
+        h_m_flat = h_m.reshape(-1)
+
+        if self.h_m is None or self.h_m.shape != h_m_flat.shape or not np.array_equal(self.h_m, h_m_flat):
+            self.h_m = h_m_flat.copy()
+            self.mask_arrays = None
+            self.segments = None
+            self.unique = None
+            self.version += 1
+
+    def get_mask_arrays(self, h_m):
+        self._update(h_m)
+
+        if self.mask_arrays is None:
+            self.mask_arrays = get_mask_arrays(self.h_m)
+
+        return tuple(mask.reshape(h_m.shape) for mask in self.mask_arrays)
+
+    def get_segments(self, h_m):
+        self._update(h_m)
+
+        if self.segments is None:
+            self.segments = get_segments(self.h_m)
+
+        return self.segments
+
+    def get_unique(self, h_m):
+        self._update(h_m)
+
+        if self.unique is None:
+            self.unique = np.unique(self.h_m, return_inverse=True)
+
+        return self.unique
+
 def compute_pressures(h_m, tropos_mask, strato_mask, smooth_mask):
     a, b, c, d = pressure_coeffs
 
@@ -15,6 +15,7 @@ class LiftingSurfaceGeometry(OptionsDictionary):
 
         self.declare('lift_coeff_zero_alpha', default=0., types=float_types)
         self.declare('lift_curve_slope_2D', default=2 * np.pi, types=float_types)
+        self.declare('taper_ratio', default=1., types=float_types)
 
         self.declare('dynamic_pressure_ratio', default=1., types=float_types)
         self.declare('downwash_slope', default=0., types=float_types)
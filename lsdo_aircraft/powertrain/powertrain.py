@@ -18,4 +18,7 @@ class Powertrain(OptionsDictionary):
         if isinstance(tgt_var_names, str):
             tgt_var_names = [tgt_var_names]
 
-        self.links.append((src_name, src_var_names, tgt_name, tgt_var_names))
\ No newline at end of file
+        self.links.append((src_name, src_var_names, tgt_name, tgt_var_names))
+
+    def get_modules(self, module_class):
+        return [module for module in self.modules if isinstance(module, module_class)]
\ No newline at end of file
@@ -2,27 +2,75 @@ from openmdao.api import Group, IndepVarComp
 
 from lsdo_utils.api import LinearCombinationComp, PowerCombinationComp, constants
 
+from lsdo_aircraft.atmosphere.atmosphere import Atmosphere
+
 
 class PowertrainGroup(Group):
+    """
+        Adds the group of each powertrain module and connects them through the declared links.
+        With 'shared_atmosphere', the Atmosphere modules are not added; their links are instead
+        connected to the atmosphere block of the parent group by connect_atmosphere.
+    """
 
     def initialize(self):
         self.options.declare('shape', types=tuple)
         self.options.declare('powertrain')
+        self.options.declare('shared_atmosphere', default=False, types=bool)
         
     def setup(self):
         shape = self.options['shape']
         powertrain = self.options['powertrain']
+        shared_atmosphere = self.options['shared_atmosphere']
+
+        if shared_atmosphere:
+            atmosphere_names = [module['name'] for module in powertrain.get_modules(Atmosphere)]
+        else:
+            atmosphere_names = []
 
         for module in powertrain.modules:
             name = module['name']
             group_class = module['group_class']
 
+            if name in atmosphere_names:
+                continue
+
             group = group_class(shape=shape, options_dictionary=module)
             self.add_subsystem('{}_group'.format(name), group, promotes=group.promotes)
 
         for src_name, src_var_names, tgt_name, tgt_var_names in powertrain.links:
+            if src_name in atmosphere_names or tgt_name in atmosphere_names:
+                continue
+
             for src_var_name, tgt_var_name in zip(src_var_names, tgt_var_names):
                 self.connect(
                     '{}_group.{}'.format(src_name, src_var_name),
                     '{}_group.{}'.format(tgt_name, tgt_var_name),
-                )
\ No newline at end of file
+                )
+
+    def connect_atmosphere(self, aircraft_group):
+        """
+            Rewires the links from every Atmosphere module to the promoted outputs of the atmosphere
+            block of aircraft_group, so duplicate atmosphere modules are merged into it. The links to
+            Atmosphere modules are dropped, since the shared block takes the flight condition of the aircraft.
+        """
+        powertrain = self.options['powertrain']
+
+        atmosphere_names = [module['name'] for module in powertrain.get_modules(Atmosphere)]
+
+        connections = []
+        for src_name, src_var_names, tgt_name, tgt_var_names in powertrain.links:
+            for src_var_name, tgt_var_name in zip(src_var_names, tgt_var_names):
+                if src_name in atmosphere_names and tgt_name not in atmosphere_names:
+                    connection = (
+                        src_var_name,
+                        'powertrain_group.{}_group.{}'.format(tgt_name, tgt_var_name),
+                    )
+                else:
+                    continue
+
+                # links repeated across merged atmosphere modules are only connected once
+                if connection not in connections:
+                    connections.append(connection)
+
+        for src, tgt in connections:
+            aircraft_group.connect(src, tgt)
@@ -0,0 +1,132 @@
+import time
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp
+
+from lsdo_utils.api import units
+
+from lsdo_aircraft.api import Aircraft, AircraftGroup
+from lsdo_aircraft.api import Geometry, LiftingSurfaceGeometry, BodyGeometry, PartGeometry
+from lsdo_aircraft.api import Analyses, Aerodynamics
+
+
+# Sizing coupled with the aerodynamics: the wing area from sizing drives the aerodynamics, and their
+# lift-to-drag ratio drives the sizing, for every wing loading and thrust-to-weight sweep point at once.
+num_sweep_points = 100
+shape = (1 + num_sweep_points, )
+
+ref_wing_loading_lbf_ft2 = 130.
+ref_thrust_to_weight = 0.3
+cruise_speed = 230.
+
+wing_loading_lbf_ft2 = np.concatenate((
+    ref_wing_loading_lbf_ft2 * np.ones(1),
+    np.linspace(0.5 * ref_wing_loading_lbf_ft2, 2 * ref_wing_loading_lbf_ft2, num_sweep_points),
+))
+thrust_to_weight = np.concatenate((
+    ref_thrust_to_weight * np.ones(1),
+    np.linspace(0.5 * ref_thrust_to_weight, 2 * ref_thrust_to_weight, num_sweep_points),
+))
+
+#
+
+geometry = Geometry()
+
+geometry.add(LiftingSurfaceGeometry(
+    name='wing',
+    lift_coeff_zero_alpha=0.23,
+))
+geometry.add(LiftingSurfaceGeometry(
+    name='tail',
+    dynamic_pressure_ratio=0.9,
+))
+geometry.add(BodyGeometry(
+    name='fuselage',
+    fuselage_aspect_ratio=10.,
+))
+geometry.add(PartGeometry(
+    name='balance',
+    parasite_drag_coeff=0.006,
+))
+
+#
+
+analyses = Analyses()
+
+aerodynamics = Aerodynamics(vectorized=True)
+analyses.add(aerodynamics)
+
+#
+
+aircraft = Aircraft(
+    geometry=geometry,
+    analyses=analyses,
+    aircraft_type='transport',
+    energy_source_type='fuel_burning',
+    thrust_source_type='jet',
+    CL_max=1.5,
+    CL_takeoff=1.5 / 1.21,
+    tsfc=1.e-4,
+    stall_speed=cruise_speed * 0.6,
+    climb_speed=cruise_speed * 0.8,
+    turn_speed=cruise_speed * 0.8,
+    landing_distance_ft=8000.,
+    wing_loading_lbf_ft2=wing_loading_lbf_ft2,
+    thrust_to_weight=thrust_to_weight,
+    ref_wing_loading_lbf_ft2=ref_wing_loading_lbf_ft2,
+    ref_thrust_to_weight=ref_thrust_to_weight,
+    coupled_sizing=True,
+)
+
+#
+
+prob = Problem()
+
+comp = IndepVarComp()
+comp.add_output('altitude', val=11., shape=shape)
+comp.add_output('speed', val=cruise_speed, shape=shape)
+comp.add_output('alpha', val=3. * np.pi / 180., shape=shape)
+comp.add_output('sizing_density', val=1.225, shape=shape)
+comp.add_output('payload_weight', val=400 * 230 * units('N', 'lbf'), shape=shape)
+comp.add_output('crew_weight', val=10 * 230 * units('N', 'lbf'), shape=shape)
+comp.add_output('range_km', val=6500., shape=shape)
+comp.add_output('oswald_efficiency', val=0.8, shape=shape)
+comp.add_output('aspect_ratio', val=8.68, shape=shape)
+comp.add_output('CD0', val=0.0350, shape=shape)
+prob.model.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+aircraft_group = AircraftGroup(shape=shape, aircraft=aircraft)
+prob.model.add_subsystem('aircraft_group', aircraft_group, promotes=['*'])
+
+prob.setup(check=True)
+
+prob['wing_geometry_group.area'] = 427.8
+prob['wing_geometry_group.wetted_area'] = 427.8 * 2.1
+prob['wing_geometry_group.characteristic_length'] = 7.
+prob['wing_geometry_group.sweep'] = 31.6 * np.pi / 180.
+prob['wing_geometry_group.incidence_angle'] = 0.
+prob['wing_geometry_group.aspect_ratio'] = 8.68
+prob['wing_geometry_group.mac'] = 7.
+
+prob['tail_geometry_group.area'] = 101.3
+prob['tail_geometry_group.wetted_area'] = 101.3 * 2.1
+prob['tail_geometry_group.characteristic_length'] = 5.
+prob['tail_geometry_group.sweep'] = 35. * np.pi / 180.
+prob['tail_geometry_group.incidence_angle'] = 0.
+prob['tail_geometry_group.aspect_ratio'] = 4.5
+prob['tail_geometry_group.mac'] = 5.
+
+prob['fuselage_geometry_group.wetted_area'] = 73 * 2 * np.pi * 3.1
+prob['fuselage_geometry_group.characteristic_length'] = 73.
+
+# initial guess for the Newton solver
+prob['lift_to_drag_ratio'] = 15.
+
+start = time.time()
+prob.run_model()
+print('coupled solve in {:.3f} s'.format(time.time() - start))
+
+print('gross_weight', prob['gross_weight'][:5])
+print('wing_area', prob['wing_area'][:5])
+print('lift_to_drag_ratio', prob['aerodynamics_analysis_group.lift_to_drag_ratio'][:5])
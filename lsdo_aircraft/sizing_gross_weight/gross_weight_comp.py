@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 
 from lsdo_utils.api import units, constants
@@ -14,7 +16,15 @@ class GrossWeightComp(ImplicitComponent):
     """
         This component solves for the gross weight of the aircraft selected by solving a non-linear equation. The options that are required for this component are given in 'aircraft.py', 
         and are defined based on the type of aircraft selected. The values for: 'a', 'c' and 'k_vs' are taken from the Raymer Empty Weight Fraction Regression. Other options are 'shape', 
-        'num_iter' (maximum number of iterations), and 'weight_max' (limit on gross weight).
+        'num_iter' (maximum number of iterations), 'weight_max' (limit on gross weight), 'tol' (tolerance on the residual relative to the gross weight)
+        and 'verbose' (prints the maximum residual and the number of unconverged elements at each iteration).
+        Each element is bracketed on [0, weight_max] and solved by Newton's method with the analytic dres_dgw of get_derivs, falling back to bisection
+        whenever a step leaves the bracket. Converged elements drop out of the iteration, and num_iterations is the number of passes of the last solve.
+        If elements are still unconverged after 'num_iter' passes, their number is stored in num_unconverged and a warning is issued.
+        With 'warm_start', each solve after the first starts from the previous gross weight of each element, bracketed within a relative width around it.
+        The width of each element adapts to twice its last relative change, between 'warm_start_width' and 0.5; elements whose residual does not
+        change sign across their bracket fall back to [0, weight_max]. num_fallbacks counts those elements, and num_iterations_saved sums, over the
+        warm-started solves, the passes saved w.r.t. num_cold_iterations, the number of passes of the last solve from [0, weight_max].
     """
 
     def initialize(self):
@@ -24,6 +34,10 @@ class GrossWeightComp(ImplicitComponent):
         self.options.declare('k_vs', types=float)
         self.options.declare('weight_max', default=1.e8, types=float)
         self.options.declare('num_iter', default=100, types=int)
+        self.options.declare('tol', default=1.e-12, types=float)
+        self.options.declare('verbose', default=False, types=bool)
+        self.options.declare('warm_start', default=True, types=bool)
+        self.options.declare('warm_start_width', default=0.01, types=float)
 
     def setup(self):
         shape = self.options['shape']
@@ -36,6 +50,15 @@ class GrossWeightComp(ImplicitComponent):
 
         self.declare_partials('gross_weight', '*', rows=arange, cols=arange)
 
+        self.warm_start_gross_weight = None
+        self.warm_start_widths = None
+
+        self.num_iterations = 0
+        self.num_cold_iterations = 0
+        self.num_iterations_saved = 0
+        self.num_fallbacks = 0
+        self.num_unconverged = 0
+
     def get_res(self, inputs, gross_weight):
         a = self.options['a']
         c = self.options['c']
@@ -69,24 +92,122 @@ class GrossWeightComp(ImplicitComponent):
 
     def solve_nonlinear(self, inputs, outputs):
         weight_max = self.options['weight_max']
+        warm_start_width = self.options['warm_start_width']
+
+        flat_inputs = dict(
+            fixed_weight=inputs['fixed_weight'].flatten(),
+            propellant_weight_fraction=inputs['propellant_weight_fraction'].flatten(),
+        )
+
+        x0 = self.warm_start_gross_weight
+        warm_start = self.options['warm_start'] and x0 is not None
+
+        # the residual is positive below the gross weight and negative above it
+        if warm_start:
+            xp = x0 * (1. - self.warm_start_widths)
+            xn = np.minimum(x0 * (1. + self.warm_start_widths), weight_max)
+            x = np.array(x0)
+
+            mask_fallback = ~((self.get_res(flat_inputs, xp) >= 0) & (self.get_res(flat_inputs, xn) < 0))
+            xp[mask_fallback] = 0.
+            xn[mask_fallback] = weight_max
+            x[mask_fallback] = 0.5 * weight_max
+
+            self.num_fallbacks += int(np.sum(mask_fallback))
+        else:
+            xp = np.zeros(flat_inputs['fixed_weight'].shape)
+            xn = weight_max * np.ones(flat_inputs['fixed_weight'].shape)
+            x = 0.5 * xp + 0.5 * xn
+
+        x = self.solve_bracketed(flat_inputs, x, xp, xn)
+
+        if warm_start:
+            self.num_iterations_saved += max(self.num_cold_iterations - self.num_iterations, 0)
+            self.warm_start_widths = np.clip(2. * np.abs(x - x0) / x, warm_start_width, 0.5)
+        else:
+            self.num_cold_iterations = self.num_iterations
+            self.warm_start_widths = warm_start_width * np.ones(x.shape)
+
+        self.warm_start_gross_weight = x
+
+        outputs['gross_weight'] = x.reshape(self.options['shape'])
+
+    def solve_bracketed(self, flat_inputs, x, xp, xn):
+        """
+            Newton-bisection iteration from x within the brackets [xp, xn] of every element;
+            returns the gross weight and sets num_iterations and num_unconverged.
+        """
         num_iter = self.options['num_iter']
+        tol = self.options['tol']
+        verbose = self.options['verbose']
+
+        fixed_weight = flat_inputs['fixed_weight']
+        propellant_weight_fraction = flat_inputs['propellant_weight_fraction']
 
-        gross_weight = outputs['gross_weight']
+        # indices of the elements that have not converged yet
+        active = np.arange(fixed_weight.size)
 
-        xp = np.zeros(self.options['shape'])
-        xn = weight_max * np.ones(self.options['shape'])
+        self.num_unconverged = 0
 
+        ind = -1
         for ind in range(num_iter):
-            x = 0.5 * xp + 0.5 * xn
-            r = self.get_res(inputs, x)
+            active_inputs = dict(
+                fixed_weight=fixed_weight[active],
+                propellant_weight_fraction=propellant_weight_fraction[active],
+            )
+            x_active = x[active]
+
+            r = self.get_res(active_inputs, x_active)
+            mask_active = np.abs(r) >= tol * x_active
+
+            if verbose:
+                print('GrossWeightComp iteration {}: max. residual {:.3e}, {} unconverged'.format(
+                    ind, np.max(np.abs(r)), np.sum(mask_active)))
+
+            if not np.any(mask_active):
+                break
+
+            active = active[mask_active]
+            active_inputs = dict(
+                fixed_weight=active_inputs['fixed_weight'][mask_active],
+                propellant_weight_fraction=active_inputs['propellant_weight_fraction'][mask_active],
+            )
+            x_active = x_active[mask_active]
+            r = r[mask_active]
+
+            xp_active = xp[active]
+            xn_active = xn[active]
             mask_p = r >= 0
             mask_n = r < 0
-            xp[mask_p] = x[mask_p]
-            xn[mask_n] = x[mask_n]
+            xp_active[mask_p] = x_active[mask_p]
+            xn_active[mask_n] = x_active[mask_n]
+            xp[active] = xp_active
+            xn[active] = xn_active
+
+            _, _, dr_dx = self.get_derivs(active_inputs, x_active)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x_active = x_active - r / dr_dx
+
+            mask_bisect = ~((x_active > xp_active) & (x_active < xn_active))
+            x_active[mask_bisect] = 0.5 * xp_active[mask_bisect] + 0.5 * xn_active[mask_bisect]
 
-            print(np.linalg.norm(r))
+            x[active] = x_active
+        else:
+            # the last pass did not check the result of its step
+            r = self.get_res(dict(
+                fixed_weight=fixed_weight[active],
+                propellant_weight_fraction=propellant_weight_fraction[active],
+            ), x[active])
+            self.num_unconverged = int(np.sum(np.abs(r) >= tol * x[active]))
+
+        if self.num_unconverged:
+            warnings.warn('GrossWeightComp: {} of {} elements did not converge in {} iterations'.format(
+                self.num_unconverged, fixed_weight.size, num_iter))
 
-        outputs['gross_weight'] = 0.5 * xp + 0.5 * xn
+        self.num_iterations = ind + 1
+
+        return x
 
     def linearize(self, inputs, outputs, partials):
         dres_dfixed, dres_dpwf, dres_dgw = self.get_derivs(inputs, outputs['gross_weight'].flatten())
@@ -105,31 +226,58 @@ class GrossWeightComp(ImplicitComponent):
 
 
 if __name__ == '__main__':
+    import time
+
     from openmdao.api import Problem, IndepVarComp
 
 
-    shape = (2, 3)
-    shape = (100,)
+    for shape in [(100,), (1000000,)]:
+        prob = Problem()
+
+        comp = IndepVarComp()
+        comp.add_output('fixed_weight', 1000. * np.random.random(shape))
+        comp.add_output('propellant_weight_fraction', 0.25 * np.random.random(shape))
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = GrossWeightComp(
+            shape=shape,
+            a=2.36,
+            c=-0.18,
+            k_vs=1.,
+            weight_max=1.e8,
+            num_iter=100,
+            verbose=shape == (100,),
+        )
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.final_setup()
+
+        start = time.time()
+        prob.run_model()
+        print('{} points in {} iterations, {:.3f} s'.format(shape[0], comp.num_iterations, time.time() - start))
+
+        # small changes of the inputs, as between driver iterations, are warm-started
+        for ind in range(5):
+            prob['fixed_weight'] *= 1. + 1.e-3 * np.random.random(shape)
+            prob['propellant_weight_fraction'] *= 1. + 1.e-3 * np.random.random(shape)
+
+            start = time.time()
+            prob.run_model()
+            print('    warm start in {} iterations, {:.3f} s'.format(comp.num_iterations, time.time() - start))
+
+        print('    {} iterations saved, {} fallbacks'.format(comp.num_iterations_saved, comp.num_fallbacks))
 
     prob = Problem()
 
     comp = IndepVarComp()
-    comp.add_output('fixed_weight', 1000. * np.random.random(shape))
-    comp.add_output('propellant_weight_fraction', 0.25 * np.random.random(shape))
+    comp.add_output('fixed_weight', 1000. * np.random.random((2, 3)))
+    comp.add_output('propellant_weight_fraction', 0.25 * np.random.random((2, 3)))
     prob.model.add_subsystem('input_comp', comp, promotes=['*'])
 
-    comp = GrossWeightComp(
-        shape=shape,
-        a=2.36,
-        c=-0.18,
-        k_vs=1.,
-        weight_max=1.e8,
-        num_iter=100,
-    )
+    comp = GrossWeightComp(shape=(2, 3), a=2.36, c=-0.18, k_vs=1.)
     prob.model.add_subsystem('comp', comp, promotes=['*'])
 
     prob.setup(check=True)
     prob.run_model()
     prob.check_partials(compact_print=True)
-
-    
\ No newline at end of file
@@ -0,0 +1,16 @@
+import numpy as np
+
+from lsdo_utils.api import OptionsDictionary
+
+from lsdo_aircraft.vlm.vlm_group import VLMGroup
+
+
+class VLM(OptionsDictionary):
+
+    def initialize(self):
+        self.declare('name', default='vlm', types=str)
+        self.declare('group_class', default=VLMGroup, values=[VLMGroup])
+
+        self.declare('num_alpha', default=None, types=int, allow_none=True)
+        self.declare('num_chordwise', default=4, types=int)
+        self.declare('num_spanwise', default=20, types=int)
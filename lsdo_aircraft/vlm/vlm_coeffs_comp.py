@@ -0,0 +1,177 @@
+import numpy as np
+
+from lsdo_aircraft.aerodynamics.part_array_component import PartArrayComponent
+from lsdo_aircraft.vlm.vlm_solution import VLMSolution
+
+
+class VLMCoeffsComp(PartArrayComponent):
+    """
+        Lift and induced drag coefficients of a stack of lifting surfaces from a vortex-lattice solution
+        of each surface, in place of PartLiftCoeffComp and PartInducedDragCoeffComp. The surfaces are solved
+        in isolation, as in LiftGroup, with the downwash_slope and dynamic_pressure_ratio of each part.
+        A VLMSolution is built, i.e., the AIC matrix is factorized, once per distinct (aspect_ratio, sweep)
+        of each part; all the points, alphas and flight conditions with that geometry share it, and so do
+        later evaluations as long as the geometry does not change. The lift curve slope is corrected for
+        compressibility with the Prandtl-Glauert factor 1 / sqrt(1 - mach_number ** 2).
+        num_factorizations counts the solutions built so far.
+    """
+
+    def part_initialize(self):
+        self.options.declare('num_chordwise', default=4, types=int)
+        self.options.declare('num_spanwise', default=20, types=int)
+
+    def part_setup(self):
+        if self.options['num_spanwise'] % 2 != 0:
+            raise Exception('num_spanwise must be even')
+
+        self.part_add_input('aspect_ratio')
+        self.part_add_input('sweep')
+        self.part_add_input('incidence_angle')
+        self.flight_add_input('mach_number')
+        self.flight_add_input('alpha', alpha=True)
+        self.part_add_output('lift_coeff')
+        self.part_add_output('induced_drag_coeff')
+
+        for out_name in ['lift_coeff', 'induced_drag_coeff']:
+            for in_name in ['aspect_ratio', 'sweep', 'incidence_angle', 'mach_number', 'alpha']:
+                self.part_declare_partials(out_name, in_name)
+
+        dynamic_pressure_ratio = self.get_part_array('dynamic_pressure_ratio')
+
+        self.taper_ratios = [part['taper_ratio'] for part in self.options['parts']]
+        self.lift_coeff_constant = dynamic_pressure_ratio * self.get_part_array('lift_coeff_zero_alpha')
+        self.alpha_coeff = dynamic_pressure_ratio * (1 - self.get_part_array('downwash_slope'))
+        self.incidence_coeff = dynamic_pressure_ratio
+
+        self.solutions = {}
+        self.num_factorizations = 0
+
+    def get_solution_arrays(self, inputs, derivs=False):
+        """
+            Returns the lift curve slopes and the induced drag factors of the part stack, followed by their
+            derivatives w.r.t. aspect_ratio and sweep if derivs is True. Only the solutions of the current
+            geometries are kept.
+        """
+        num_chordwise = self.options['num_chordwise']
+        num_spanwise = self.options['num_spanwise']
+
+        aspect_ratio = inputs['aspect_ratio'].reshape((self.num_parts, -1))
+        sweep = inputs['sweep'].reshape((self.num_parts, -1))
+
+        num_arrays = 6 if derivs else 2
+        arrays = np.empty((num_arrays,) + aspect_ratio.shape)
+
+        solutions = {}
+        for ind_part in range(self.num_parts):
+            geometries, inverse = np.unique(
+                np.array([aspect_ratio[ind_part], sweep[ind_part]]).T, axis=0, return_inverse=True)
+
+            values = np.empty((len(geometries), num_arrays))
+            for ind, (geometry_aspect_ratio, geometry_sweep) in enumerate(geometries):
+                key = (ind_part, geometry_aspect_ratio, geometry_sweep)
+
+                solution = self.solutions.get(key)
+                if solution is None:
+                    solution = VLMSolution(
+                        geometry_aspect_ratio, geometry_sweep, self.taper_ratios[ind_part],
+                        num_chordwise, num_spanwise,
+                    )
+                    self.num_factorizations += 1
+                solutions[key] = solution
+
+                values[ind, :2] = solution.lift_curve_slope, solution.induced_drag_factor
+                if derivs:
+                    values[ind, 2:] = solution.compute_derivs().flatten()
+
+            arrays[:, ind_part] = values[inverse.flatten()].T
+
+        self.solutions = solutions
+
+        return arrays.reshape((num_arrays,) + self.part_shape)
+
+    def get_lift_coeff(self, inputs, lift_curve_slope):
+        beta = np.sqrt(1 - inputs['mach_number'] ** 2)
+
+        effective_alpha = self.alpha_coeff * self.get_broadcast_input(inputs, 'alpha') \
+            + self.incidence_coeff * inputs['incidence_angle']
+
+        return self.lift_coeff_constant + lift_curve_slope / beta * effective_alpha, effective_alpha, beta
+
+    def compute(self, inputs, outputs):
+        lift_curve_slope, induced_drag_factor = self.get_solution_arrays(inputs)
+
+        lift_coeff, _, _ = self.get_lift_coeff(inputs, lift_curve_slope)
+
+        outputs['lift_coeff'] = lift_coeff
+        outputs['induced_drag_coeff'] = induced_drag_factor * lift_coeff ** 2
+
+    def compute_partials(self, inputs, partials):
+        mach_number = inputs['mach_number']
+
+        (
+            lift_curve_slope, induced_drag_factor,
+            dslope_daspect_ratio, dslope_dsweep, dfactor_daspect_ratio, dfactor_dsweep,
+        ) = self.get_solution_arrays(inputs, derivs=True)
+
+        lift_coeff, effective_alpha, beta = self.get_lift_coeff(inputs, lift_curve_slope)
+
+        dlift_coeff_dict = {
+            'aspect_ratio': effective_alpha / beta * dslope_daspect_ratio,
+            'sweep': effective_alpha / beta * dslope_dsweep,
+            'incidence_angle': lift_curve_slope / beta * self.incidence_coeff,
+            'mach_number': lift_curve_slope * effective_alpha * mach_number / beta ** 3,
+            'alpha': lift_curve_slope / beta * self.alpha_coeff,
+        }
+
+        for in_name, dlift_coeff in dlift_coeff_dict.items():
+            dinduced_drag_coeff = 2 * induced_drag_factor * lift_coeff * dlift_coeff
+            if in_name == 'aspect_ratio':
+                dinduced_drag_coeff = dinduced_drag_coeff + dfactor_daspect_ratio * lift_coeff ** 2
+            elif in_name == 'sweep':
+                dinduced_drag_coeff = dinduced_drag_coeff + dfactor_dsweep * lift_coeff ** 2
+
+            partials['lift_coeff', in_name] = self.get_part_partials(dlift_coeff)
+            partials['induced_drag_coeff', in_name] = self.get_part_partials(dinduced_drag_coeff)
+
+
+if __name__ == '__main__':
+    import time
+
+    from openmdao.api import Problem, IndepVarComp
+
+    from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+    parts = [
+        LiftingSurfaceGeometry(name='wing', lift_coeff_zero_alpha=0.23, taper_ratio=0.3),
+        LiftingSurfaceGeometry(name='tail', dynamic_pressure_ratio=0.9, downwash_slope=0.3, taper_ratio=0.5),
+    ]
+
+    for shape, num_alpha in [((2, 3), None), ((2, 3), 4), ((100, 100), 20)]:
+        part_shape = (len(parts),) + shape
+        alpha_shape = (num_alpha,) if num_alpha is not None else ()
+
+        prob = Problem()
+
+        # a few distinct geometries, shared by many flight conditions
+        comp = IndepVarComp()
+        comp.add_output('aspect_ratio', np.random.choice([4.5, 8.68], part_shape))
+        comp.add_output('sweep', np.random.choice([0.4, 0.55], part_shape))
+        comp.add_output('incidence_angle', 0.05 * np.random.random(part_shape))
+        comp.add_output('mach_number', 0.8 * np.random.random(shape))
+        comp.add_output('alpha', 0.1 * np.random.random(alpha_shape + shape))
+        prob.model.add_subsystem('input_comp', comp, promotes=['*'])
+
+        comp = VLMCoeffsComp(shape=shape, parts=parts, num_alpha=num_alpha)
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+
+        prob.setup(check=True)
+        prob.final_setup()
+
+        start = time.time()
+        prob.run_model()
+        print('{} points with {} factorizations in {:.3f} s'.format(
+            np.prod(alpha_shape + part_shape), comp.num_factorizations, time.time() - start))
+
+        if np.prod(shape) < 10:
+            prob.check_partials(compact_print=True)
@@ -0,0 +1,35 @@
+from lsdo_aircraft.aerodynamics.aerodynamics_group import AerodynamicsGroup
+from lsdo_aircraft.vlm.vlm_coeffs_comp import VLMCoeffsComp
+from lsdo_aircraft.geometry.lifting_surface_geometry import LiftingSurfaceGeometry
+
+
+class VLMGroup(AerodynamicsGroup):
+    """
+        Vectorized AerodynamicsGroup in which the lift and induced drag coefficients of the lifting
+        surfaces come from VLMCoeffsComp; the skin friction, parasite drag and wave drag are unchanged.
+    """
+
+    @classmethod
+    def get_dependent_input_name(cls, options_dictionary, part, var_name, bypass_cache=False):
+        part_name = part['name']
+
+        if isinstance(part, LiftingSurfaceGeometry):
+            return 'lifting_surfaces_group.{}_{}'.format(part_name, var_name)
+        else:
+            return 'bodies_group.{}_{}'.format(part_name, var_name)
+
+    def setup(self):
+        self.setup_vectorized()
+
+    def add_lift_and_induced_drag_comps(self, group, lifting_surfaces):
+        shape = self.options['shape']
+        options_dictionary = self.options['options_dictionary']
+
+        comp = VLMCoeffsComp(
+            shape=shape,
+            parts=lifting_surfaces,
+            num_alpha=options_dictionary['num_alpha'],
+            num_chordwise=options_dictionary['num_chordwise'],
+            num_spanwise=options_dictionary['num_spanwise'],
+        )
+        group.add_subsystem('vlm_coeffs_comp', comp, promotes=['*'])
@@ -0,0 +1,189 @@
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+
+def get_vlm_mesh(aspect_ratio, sweep, taper_ratio, num_chordwise, num_spanwise):
+    """
+        Horseshoe-vortex mesh of a trapezoidal planform of unit span, with the given quarter-chord sweep.
+        The strips are those of get_spanwise_stations; num_spanwise must be even, so no panel straddles the root.
+        Returns the bound vortex end points (x1, y1, x2, y2) and the control points (xc, yc), flattened
+        in (chordwise, spanwise) order.
+        aspect_ratio and sweep may be complex, for complex-step derivatives of the mesh.
+    """
+    root_chord = 2. / aspect_ratio / (1. + taper_ratio)
+
+    def get_chord(y):
+        return root_chord * (1. - (1. - taper_ratio) * 2. * np.abs(y))
+
+    def get_leading_edge(y):
+        return np.abs(y) * np.tan(sweep) + 0.25 * root_chord - 0.25 * get_chord(y)
+
+    y_edges, y_mid = get_spanwise_stations(num_spanwise)
+    s_edges = np.linspace(0., 1., num_chordwise + 1)[:-1].reshape((num_chordwise, 1))
+    ds = 1. / num_chordwise
+
+    y1 = np.broadcast_to(y_edges[:-1], (num_chordwise, num_spanwise))
+    y2 = np.broadcast_to(y_edges[1:], (num_chordwise, num_spanwise))
+    yc = np.broadcast_to(y_mid, (num_chordwise, num_spanwise))
+
+    x1 = get_leading_edge(y1) + (s_edges + 0.25 * ds) * get_chord(y1)
+    x2 = get_leading_edge(y2) + (s_edges + 0.25 * ds) * get_chord(y2)
+    xc = get_leading_edge(yc) + (s_edges + 0.75 * ds) * get_chord(yc)
+
+    return [array.flatten() for array in [x1, y1, x2, y2, xc, yc]]
+
+
+def get_spanwise_stations(num_spanwise):
+    """
+        Returns the cosine-spaced edges of the strips of a unit span and their centers, which are placed at
+        the mid-angles of the cosine spacing rather than at the mid-points; this makes the lift and
+        the Trefftz-plane induced drag converge much faster with num_spanwise.
+    """
+    theta = np.linspace(0., np.pi, 2 * num_spanwise + 1)
+    return -0.5 * np.cos(theta[::2]), -0.5 * np.cos(theta[1::2])
+
+
+def compute_aic(x1, y1, x2, y2, xc, yc):
+    """
+        Planar aerodynamic influence coefficients: the normal velocity at each control point (rows)
+        induced by a horseshoe vortex of unit strength on each panel (columns), vectorized over both.
+    """
+    xm = xc.reshape((-1, 1))
+    yn = yc.reshape((-1, 1))
+
+    dx1 = xm - x1
+    dy1 = yn - y1
+    dx2 = xm - x2
+    dy2 = yn - y2
+    r1 = np.sqrt(dx1 ** 2 + dy1 ** 2)
+    r2 = np.sqrt(dx2 ** 2 + dy2 ** 2)
+
+    bound = ((x2 - x1) * dx1 + (y2 - y1) * dy1) / r1 - ((x2 - x1) * dx2 + (y2 - y1) * dy2) / r2
+    bound = bound / (dx1 * dy2 - dx2 * dy1)
+    trailing_1 = (1. + dx1 / r1) / dy1
+    trailing_2 = (1. + dx2 / r2) / dy2
+
+    return (bound - trailing_1 + trailing_2) / (4 * np.pi)
+
+
+def compute_trefftz_matrix(y_edges, y_mid):
+    """
+        Downwash at the center of each strip in the Trefftz plane induced by the trailing vortex pairs
+        of a unit circulation on each strip.
+    """
+    y = y_mid.reshape((-1, 1))
+
+    return -(1. / (y - y_edges[:-1]) - 1. / (y - y_edges[1:])) / (2 * np.pi)
+
+
+class VLMSolution(object):
+    """
+        Vortex-lattice solution of one lifting surface geometry. The AIC matrix is assembled and
+        LU-factorized once, and the circulation is solved for a unit alpha; the lift is linear in alpha,
+        so this gives the lift curve slope for every alpha and flight condition. The induced drag follows
+        from the Trefftz plane as induced_drag_factor * lift_coeff ** 2, i.e., induced_drag_factor is
+        1 / (pi * e * aspect_ratio). compute_derivs returns the derivatives of both w.r.t. aspect_ratio and
+        sweep, from adjoint solves with the same factorization and a complex-step derivative of the AIC matrix.
+    """
+
+    def __init__(self, aspect_ratio, sweep, taper_ratio, num_chordwise, num_spanwise):
+        self.aspect_ratio = aspect_ratio
+        self.sweep = sweep
+        self.taper_ratio = taper_ratio
+        self.num_chordwise = num_chordwise
+        self.num_spanwise = num_spanwise
+
+        mesh = get_vlm_mesh(aspect_ratio, sweep, taper_ratio, num_chordwise, num_spanwise)
+        y_edges, y_mid = get_spanwise_stations(num_spanwise)
+
+        self.dy = y_edges[1:] - y_edges[:-1]
+        self.trefftz_matrix = compute_trefftz_matrix(y_edges, y_mid)
+
+        self.lu = lu_factor(compute_aic(*mesh))
+        self.circulation = lu_solve(self.lu, -np.ones(num_chordwise * num_spanwise))
+
+        self.lift_curve_slope, self.induced_drag_factor = self._compute_coeffs(self.circulation)[:2]
+
+        self.derivs = None
+
+    def _compute_coeffs(self, circulation):
+        aspect_ratio = self.aspect_ratio
+        dy = self.dy
+        trefftz_matrix = self.trefftz_matrix
+
+        strip_circulation = circulation.reshape((self.num_chordwise, self.num_spanwise)).sum(axis=0)
+        downwash = trefftz_matrix.dot(strip_circulation)
+
+        # unit span and speed, so the area is 1 / aspect_ratio
+        lift_coeff = 2. * aspect_ratio * np.sum(strip_circulation * dy)
+        induced_drag_coeff = -aspect_ratio * np.sum(strip_circulation * downwash * dy)
+        induced_drag_factor = induced_drag_coeff / lift_coeff ** 2
+
+        dlift_coeff_dstrip = 2. * aspect_ratio * dy
+        dinduced_drag_coeff_dstrip = -aspect_ratio * (downwash * dy + trefftz_matrix.T.dot(strip_circulation * dy))
+        dfactor_dstrip = dinduced_drag_coeff_dstrip / lift_coeff ** 2 \
+            - 2. * induced_drag_factor / lift_coeff * dlift_coeff_dstrip
+
+        return lift_coeff, induced_drag_factor, dlift_coeff_dstrip, dfactor_dstrip
+
+    def compute_derivs(self):
+        """
+            Returns a (2, 2) array with the derivatives of lift_curve_slope (row 0) and
+            induced_drag_factor (row 1) w.r.t. aspect_ratio (column 0) and sweep (column 1).
+        """
+        if self.derivs is not None:
+            return self.derivs
+
+        num_chordwise = self.num_chordwise
+        num_spanwise = self.num_spanwise
+
+        _, _, dlift_coeff_dstrip, dfactor_dstrip = self._compute_coeffs(self.circulation)
+
+        # adjoint solves with the stored factorization; each strip sums the circulation of its panels
+        rhs = np.array([
+            np.tile(dlift_coeff_dstrip, num_chordwise),
+            np.tile(dfactor_dstrip, num_chordwise),
+        ]).T
+        adjoint = lu_solve(self.lu, rhs, trans=1)
+
+        # explicit dependence on aspect_ratio through the area; lift_curve_slope is proportional to it
+        # and induced_drag_factor to 1 / aspect_ratio at a fixed circulation
+        explicit_derivs = np.array([
+            [self.lift_curve_slope / self.aspect_ratio, 0.],
+            [-self.induced_drag_factor / self.aspect_ratio, 0.],
+        ])
+
+        step = 1.e-30
+        daic_circulation = np.empty((num_chordwise * num_spanwise, 2))
+        for ind, (aspect_ratio, sweep) in enumerate([
+            (self.aspect_ratio + step * 1j, self.sweep),
+            (self.aspect_ratio, self.sweep + step * 1j),
+        ]):
+            mesh = get_vlm_mesh(aspect_ratio, sweep, self.taper_ratio, num_chordwise, num_spanwise)
+            daic = compute_aic(*mesh).imag / step
+            daic_circulation[:, ind] = daic.dot(self.circulation)
+
+        self.derivs = explicit_derivs - adjoint.T.dot(daic_circulation)
+
+        return self.derivs
+
+
+if __name__ == '__main__':
+    for aspect_ratio, sweep, taper_ratio in [(8., 0., 1.), (8.68, 31.6 * np.pi / 180., 0.3), (4.5, 0.6, 0.5)]:
+        solution = VLMSolution(aspect_ratio, sweep, taper_ratio, 4, 40)
+
+        print('aspect_ratio {}, sweep {:.3f}, taper_ratio {}:'.format(aspect_ratio, sweep, taper_ratio))
+        print('    lift curve slope {:.4f} (2 pi AR / (AR + 2) = {:.4f})'.format(
+            solution.lift_curve_slope, 2 * np.pi * aspect_ratio / (aspect_ratio + 2)))
+        print('    span efficiency {:.4f}'.format(1. / np.pi / aspect_ratio / solution.induced_drag_factor))
+
+        derivs = solution.compute_derivs()
+
+        step = 1.e-6
+        fd_derivs = np.empty((2, 2))
+        for ind, (daspect_ratio, dsweep) in enumerate([(step, 0.), (0., step)]):
+            perturbed = VLMSolution(aspect_ratio + daspect_ratio, sweep + dsweep, taper_ratio, 4, 40)
+            fd_derivs[0, ind] = (perturbed.lift_curve_slope - solution.lift_curve_slope) / step
+            fd_derivs[1, ind] = (perturbed.induced_drag_factor - solution.induced_drag_factor) / step
+
+        print('    max. derivative error', np.max(np.abs(derivs - fd_derivs) / np.maximum(np.abs(fd_derivs), 1e-3)))